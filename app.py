@@ -1,18 +1,23 @@
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, render_template, jsonify, request, stream_with_context
 import json
 import os
 import random
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 from scrapers.utils.ai_filter_processor import AIFilterProcessor
-from scrapers.utils.job_date_estimator import JobDateEstimator
+from scrapers.utils.job_date_estimator import JobDateEstimator, estimate_date_from_patterns
+from scrapers.utils.date_enrichment import DateEnrichmentWorker
+from scrapers.utils.date_display import confidence_color, relative_date_label, to_epoch
+from scrapers.utils.job_analyzer import classify_title_columns
 from application_system import application_system
+from job_store import get_job_store
 
 app = Flask(__name__)
 
-# Initialize AI processor
+# Initialize AI processor (no network here; the API check runs in the background)
 try:
     ai_processor = AIFilterProcessor()
-    print("✅ AI Filter Processor initialized successfully")
+    print("✅ AI Filter Processor initialized (checking API connection in the background)")
 except Exception as e:
     print(f"❌ Failed to initialize AI Filter Processor: {e}")
     ai_processor = None
@@ -26,6 +31,9 @@ except Exception as e:
     print(f"❌ Failed to initialize Job Date Estimator: {e}")
     date_estimator = None
 
+# Accurate-mode lookups run in the background; page loads only get provisional dates
+date_enrichment = DateEnrichmentWorker(date_estimator) if date_estimator else None
+
 # Load resume data for application system
 try:
     import json
@@ -40,16 +48,19 @@ except Exception as e:
 def load_job_data():
     """Load and clean job data from scraped_data.json with simple processing"""
     try:
-        with open('scraped_data.json', 'r') as f:
-            data = json.load(f)
+        job_store = get_job_store()
+        if not os.path.exists(job_store.data_file):
+            raise FileNotFoundError(job_store.data_file)
         
         jobs = []
         
-        # Process all jobs with opening_title
-        jobs_to_process = [job for job in data if 'opening_title' in job]
+        # Process all jobs with opening_title (parsed once per file change, shared with the application system)
+        jobs_to_process = job_store.jobs()
         
         print(f"🔄 Processing {len(jobs_to_process)} jobs with simple filtering...")
         
+        first_seen_index = build_first_seen_index(jobs_to_process)
+        
         for job in jobs_to_process:
             # Basic job data
             clean_job = {
@@ -59,35 +70,30 @@ def load_job_data():
                 'source': job.get('source', 'N/A'),
                 'id': job.get('id', 'N/A'),
                 'company': job.get('company_name', extract_company_name(job.get('source', ''))),
-                'description': job.get('description', '')
+                # Descriptions stay compressed in the store; application analysis reads them from there
+                'has_description': bool(job.get('description') or job.get('description_compressed')),
+                'ai_processed': False
             }
+            clean_job['company_normalized'] = clean_job['company']
             
             # Process posted date
-            posted_date_info = process_posted_date(job, clean_job)
+            posted_date_info = process_posted_date(job, clean_job, first_seen_index.get(get_job_history_key(job)))
             clean_job.update(posted_date_info)
             
-            # Debug: Print first few jobs to see posted dates
-            if len(jobs) < 5:
-                print(f"Job: {clean_job['title']} - Posted: {clean_job.get('posted_date_display', 'Unknown')}")
-            
-            # Smart processing for experience and roles
-            clean_job.update({
-                'experience_level': extract_experience_smart(clean_job['title']),
-                'role_category': extract_role_smart(clean_job['title']),
-                'company_normalized': clean_job['company'],
-                'ai_processed': False
-            })
-            
-            # Add display properties
-            clean_job.update({
-                'experience_display': get_experience_display_name(clean_job['experience_level']),
-                'role_display': get_role_display_name(clean_job['role_category']),
-                'experience_color': get_experience_color(clean_job['experience_level']),
-                'role_color': get_role_color(clean_job['role_category'])
-            })
-            
             jobs.append(clean_job)
         
+        # Commit the date estimates made while loading in one go
+        if date_estimator:
+            date_estimator.flush_cache()
+        
+        add_posted_date_labels(jobs)
+        
+        # Experience/role classification plus display names and colors, one column at a time
+        title_columns = classify_title_columns([clean_job['title'] for clean_job in jobs])
+        for field, column in title_columns.items():
+            for clean_job, value in zip(jobs, column):
+                clean_job[field] = value
+        
         print(f"🎉 Loaded {len(jobs)} jobs with simple processing")
         return jobs
     except FileNotFoundError:
@@ -97,48 +103,6 @@ def load_job_data():
         print(f"Error loading data: {e}")
         return []
 
-def extract_experience_smart(title):
-    """Extract experience level from job title using smart rules"""
-    title_lower = title.lower()
-    
-    if any(word in title_lower for word in ['senior', 'lead', 'principal', 'staff', 'sr']):
-        return 'senior'
-    elif any(word in title_lower for word in ['junior', 'entry', 'associate', 'graduate', 'jr']):
-        return 'entry'
-    elif any(word in title_lower for word in ['mid', 'intermediate', 'mid-level']):
-        return 'mid'
-    elif any(word in title_lower for word in ['director', 'vp', 'head', 'chief', 'manager']):
-        return 'director'
-    else:
-        return 'unknown'
-
-def extract_role_smart(title):
-    """Extract role category from job title using smart rules"""
-    title_lower = title.lower()
-    
-    if any(word in title_lower for word in ['engineer', 'developer', 'programmer', 'devops', 'sre']):
-        return 'engineering'
-    elif any(word in title_lower for word in ['data', 'ml', 'ai', 'analyst', 'scientist']):
-        return 'data_science'
-    elif any(word in title_lower for word in ['product', 'program']):
-        return 'product'
-    elif any(word in title_lower for word in ['design', 'ux', 'ui']):
-        return 'design'
-    elif any(word in title_lower for word in ['sales', 'business development']):
-        return 'sales'
-    elif any(word in title_lower for word in ['marketing', 'growth', 'content']):
-        return 'marketing'
-    elif any(word in title_lower for word in ['operations', 'strategy']):
-        return 'operations'
-    elif any(word in title_lower for word in ['hr', 'recruiting', 'talent']):
-        return 'hr'
-    elif any(word in title_lower for word in ['finance', 'accounting', 'controller']):
-        return 'finance'
-    elif any(word in title_lower for word in ['legal', 'compliance', 'counsel']):
-        return 'legal'
-    else:
-        return 'other'
-
 def format_timestamp(timestamp):
     """Convert Unix timestamp to readable date"""
     if timestamp:
@@ -148,174 +112,97 @@ def format_timestamp(timestamp):
             return 'N/A'
     return 'N/A'
 
-def get_experience_display_name(level):
-    """Get display name for experience level"""
-    display_names = {
-        'entry': 'Entry Level',
-        'mid': 'Mid Level',
-        'senior': 'Senior',
-        'staff': 'Staff',
-        'director': 'Director',
-        'unknown': 'Unknown'
-    }
-    return display_names.get(level, 'Unknown')
-
-def get_role_display_name(role):
-    """Get display name for role category"""
-    display_names = {
-        'engineering': 'Engineering',
-        'data_science': 'Data Science',
-        'product': 'Product',
-        'design': 'Design',
-        'sales': 'Sales',
-        'marketing': 'Marketing',
-        'operations': 'Operations',
-        'hr': 'HR',
-        'finance': 'Finance',
-        'legal': 'Legal',
-        'other': 'Other'
-    }
-    return display_names.get(role, 'Other')
-
-def get_experience_color(level):
-    """Get color for experience level"""
-    colors = {
-        'entry': 'secondary',
-        'mid': 'info',
-        'senior': 'primary',
-        'staff': 'warning',
-        'director': 'danger',
-        'unknown': 'dark'
-    }
-    return colors.get(level, 'light')
-
-def get_role_color(role):
-    """Get color for role category"""
-    colors = {
-        'engineering': 'primary',
-        'data_science': 'info',
-        'product': 'success',
-        'design': 'warning',
-        'sales': 'danger',
-        'marketing': 'secondary',
-        'operations': 'dark',
-        'hr': 'secondary',
-        'finance': 'success',
-        'legal': 'warning',
-        'other': 'dark'
-    }
-    return colors.get(role, 'light')
-
-def process_posted_date(job, clean_job):
+def get_job_history_key(job):
+    """Key that identifies the same opening across scrape runs (row ids change per run)"""
+    return job.get('opening_link') or f"{job.get('opening_title')}|{job.get('company_name')}"
+
+def build_first_seen_index(jobs):
+    """Earliest created_at per opening; scrape runs are appended to scraped_data.json"""
+    first_seen = {}
+    for job in jobs:
+        created_at = job.get('created_at')
+        if created_at:
+            job_key = get_job_history_key(job)
+            if job_key not in first_seen or created_at < first_seen[job_key]:
+                first_seen[job_key] = created_at
+    return first_seen
+
+def process_posted_date(job, clean_job, first_seen=None):
     """Process and estimate posted date for a job"""
     # Check if we already have posted date data
     if job.get('posted_date'):
         return {
             'posted_date': job.get('posted_date'),
+            'posted_date_epoch': job.get('posted_date_epoch'),  # parsed by the job store on load
             'posted_date_confidence': job.get('posted_date_confidence', 'unknown'),
-            'posted_date_source': job.get('posted_date_source', 'scraped'),
-            'posted_date_display': format_posted_date_display(job.get('posted_date')),
-            'posted_date_color': get_posted_date_color(job.get('posted_date_confidence', 'unknown'))
+            'posted_date_source': job.get('posted_date_source', 'scraped')
         }
     
-    # If no posted date, estimate it
-    if date_estimator:
+    # If no posted date, estimate it (never blocks on external lookups)
+    if date_enrichment:
         try:
-            result = date_estimator.estimate_job_date(
+            result = date_enrichment.estimate(
                 clean_job['title'], 
                 clean_job['company'], 
-                clean_job['location']
+                clean_job['location'],
+                first_seen
             )
             
             # Ensure we have a valid result
             if result and result.get('estimated_date'):
                 return {
                     'posted_date': result.get('estimated_date'),
+                    'posted_date_epoch': to_epoch(result.get('estimated_date')),
                     'posted_date_confidence': result.get('confidence', 'low'),
                     'posted_date_source': result.get('source', 'estimated'),
-                    'posted_date_display': date_estimator.format_date_for_display(result.get('estimated_date')),
-                    'posted_date_color': date_estimator.get_confidence_color(result.get('confidence', 'low'))
+                    'posted_date_provisional': result.get('provisional', False)
                 }
         except Exception as e:
             print(f"Error estimating date for job {clean_job['title']}: {e}")
     
     # Fallback - always provide a date estimate
     try:
-        # Simple fallback based on job title patterns
-        title_lower = clean_job['title'].lower()
-        now = datetime.now()
-        
-        if any(word in title_lower for word in ['senior', 'lead', 'principal', 'staff', 'director', 'vp', 'head']):
-            days_ago = random.randint(14, 28)
-            estimated_date = now - timedelta(days=days_ago)
-            confidence = 'low'
-            source = 'pattern_fallback'
-        elif any(word in title_lower for word in ['urgent', 'immediate', 'asap', 'new', 'recent']):
-            days_ago = random.randint(1, 7)
-            estimated_date = now - timedelta(days=days_ago)
-            confidence = 'low'
-            source = 'pattern_fallback'
-        else:
-            days_ago = random.randint(7, 14)
-            estimated_date = now - timedelta(days=days_ago)
-            confidence = 'very_low'
-            source = 'pattern_fallback'
+        # Same deterministic title-pattern guess the estimator uses
+        result = estimate_date_from_patterns(
+            clean_job['title'], clean_job['company'], clean_job['location'], first_seen
+        )
+        estimated_date = result['estimated_date']
+        confidence = result['confidence']
+        source = 'pattern_fallback'
         
         return {
             'posted_date': estimated_date,
+            'posted_date_epoch': to_epoch(estimated_date),
             'posted_date_confidence': confidence,
-            'posted_date_source': source,
-            'posted_date_display': format_posted_date_display(estimated_date),
-            'posted_date_color': get_posted_date_color(confidence)
+            'posted_date_source': source
         }
     except Exception as e:
         print(f"Fallback error for job {clean_job['title']}: {e}")
         # Final fallback
         return {
             'posted_date': None,
+            'posted_date_epoch': None,
             'posted_date_confidence': 'unknown',
-            'posted_date_source': 'unknown',
-            'posted_date_display': 'Unknown',
-            'posted_date_color': 'secondary'
+            'posted_date_source': 'unknown'
         }
 
 def format_posted_date_display(date_obj):
     """Format posted date for display"""
-    if not date_obj:
-        return "Unknown"
-    
-    if isinstance(date_obj, str):
-        try:
-            date_obj = datetime.fromisoformat(date_obj.replace('Z', '+00:00'))
-        except:
-            return date_obj
-    
-    now = datetime.now()
-    diff = now - date_obj
-    
-    if diff.days == 0:
-        return "Today"
-    elif diff.days == 1:
-        return "Yesterday"
-    elif diff.days < 7:
-        return f"{diff.days} days ago"
-    elif diff.days < 30:
-        weeks = diff.days // 7
-        return f"{weeks} week{'s' if weeks > 1 else ''} ago"
-    else:
-        months = diff.days // 30
-        return f"{months} month{'s' if months > 1 else ''} ago"
+    epoch = to_epoch(date_obj)
+    if epoch is None and isinstance(date_obj, str) and date_obj:
+        return date_obj
+    return relative_date_label(epoch)
 
 def get_posted_date_color(confidence):
     """Get color class for posted date confidence"""
-    confidence_colors = {
-        'high': 'success',
-        'medium': 'warning', 
-        'low': 'info',
-        'very_low': 'secondary',
-        'unknown': 'secondary'
-    }
-    return confidence_colors.get(confidence, 'secondary')
+    return confidence_color(confidence)
+
+def add_posted_date_labels(jobs, now=None):
+    """Relative date labels and colors for a whole snapshot, against one clock tick"""
+    now = time.time() if now is None else now
+    for clean_job in jobs:
+        clean_job['posted_date_display'] = relative_date_label(clean_job['posted_date_epoch'], now)
+        clean_job['posted_date_color'] = confidence_color(clean_job['posted_date_confidence'])
 
 def extract_company_name(source_url):
     """Extract company name from source URL"""
@@ -415,10 +302,9 @@ def api_jobs():
     # Get jobs for current page
     paginated_jobs = jobs[start_idx:end_idx]
     
-    # Add random sorting to mix companies (only if no other sorting is applied)
+    # Mix companies (only if no other sorting is applied); seeded by page so responses stay cacheable
     if not any([company, experience, role, country, state, search]):
-        import random
-        random.shuffle(paginated_jobs)
+        random.Random(page).shuffle(paginated_jobs)
     
     return jsonify({
         'jobs': paginated_jobs,
@@ -644,22 +530,23 @@ def apply_all_jobs():
     
     print(f"🚀 [API] Starting application processing for {len(application_system.selected_jobs)} jobs")
     
+    # Claim the run before answering, so two requests can't both start one
+    run_id = application_system.start_run()
+    if run_id is None:
+        print(f"⚠️ [API] Application processing already running")
+        return jsonify({
+            'success': False,
+            'message': 'Application processing is already running'
+        })
+    
     def process_in_background():
         try:
             print(f"🔄 [Background] Starting application processing...")
-            results = application_system.process_applications()
+            results = application_system.process_applications(run_id=run_id)
             print(f"✅ [Background] Application processing completed: {results['processed']}/{results['total_jobs']} jobs")
         except Exception as e:
             print(f"❌ [Background] Application processing error: {e}")
     
-    # Check if already processing
-    if application_system.get_processing_status()['is_processing']:
-        print(f"⚠️ [API] Application processing already running")
-        return jsonify({
-            'success': False,
-            'message': 'Application processing is already running'
-        })
-    
     # Start processing in background
     thread = threading.Thread(target=process_in_background)
     thread.daemon = True
@@ -670,7 +557,8 @@ def apply_all_jobs():
     return jsonify({
         'success': True,
         'message': f'Started processing {len(application_system.selected_jobs)} applications',
-        'status': 'processing'
+        'status': 'processing',
+        'run_id': run_id
     })
 
 @app.route('/api/application-status')
@@ -679,6 +567,61 @@ def application_status():
     status = application_system.get_processing_status()
     return jsonify(status)
 
+@app.route('/api/application-runs/<run_id>')
+def application_run(run_id):
+    """Per-job states and timings of one application run"""
+    run = application_system.runs.get_run(run_id)
+    if run is None:
+        return jsonify({'error': 'Unknown run'}), 404
+    return jsonify(run)
+
+def format_sse(event_type, data, event_id=None):
+    """One Server-Sent Events message"""
+    message = f"event: {event_type}\ndata: {json.dumps(data)}\n\n"
+    if event_id is not None:
+        message = f"id: {event_id}\n" + message
+    return message
+
+@app.route('/api/application-events')
+def application_events():
+    """
+    Stream application progress as Server-Sent Events
+    
+    Starts with a 'snapshot' of the latest run, then pushes a 'job' event for
+    every job state change and a 'run' event when a run starts or finishes.
+    The stream ends once no run is in progress; EventSource's Last-Event-ID
+    resumes a dropped stream where it left off.
+    """
+    runs = application_system.runs
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    
+    def stream():
+        yield "retry: 3000\n\n"
+        event_id, state = runs.snapshot()
+        after_id = int(last_event_id) if last_event_id and last_event_id.isdigit() else event_id
+        if after_id >= event_id:
+            # New stream, or an id from before a restart: start from the current state
+            after_id = event_id
+            yield format_sse('snapshot', state, event_id)
+        
+        while runs.is_running() or after_id < runs.last_event_id:
+            events = runs.wait_for_events(after_id, timeout=15)
+            if not events:
+                yield ": keep-alive\n\n"
+                continue
+            if events[0]['id'] > after_id + 1:
+                # Missed events fell out of the log; resync from a fresh snapshot first
+                yield format_sse('snapshot', runs.snapshot()[1])
+            for event in events:
+                yield format_sse(event['event'], event['data'], event['id'])
+                after_id = event['id']
+    
+    return Response(
+        stream_with_context(stream()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
 @app.route('/api/applications')
 def get_applications():
     """Get prepared applications"""
@@ -722,5 +665,29 @@ def clear_date_cache():
     else:
         return jsonify({'status': 'error', 'message': 'Date estimator not available'})
 
+@app.route('/api/date-estimation/enrichment')
+def date_enrichment_status():
+    """Background date enrichment queue status"""
+    if date_enrichment:
+        return jsonify({'status': 'success', 'enrichment': date_enrichment.status()})
+    else:
+        return jsonify({'status': 'error', 'message': 'Date estimator not available'})
+
+@app.route('/api/date-estimation/cache-stats')
+def date_cache_stats():
+    """Hit/miss/eviction stats for the date estimation cache"""
+    if date_estimator:
+        return jsonify({'status': 'success', 'stats': date_estimator.cache_stats()})
+    else:
+        return jsonify({'status': 'error', 'message': 'Date estimator not available'})
+
+@app.route('/api/ai/status')
+def ai_status():
+    """AI backend health, circuit breaker state and response cache stats"""
+    if ai_processor:
+        return jsonify({'status': 'success', 'ai': ai_processor.status()})
+    else:
+        return jsonify({'status': 'error', 'message': 'AI processor not available'})
+
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000) 
\ No newline at end of file
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Application Pipeline
+Prepares applications for many jobs at once in bounded, staged worker pools
+"""
+
+import logging
+import queue
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from scrapers.utils.rate_limit import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of a stage's input; one per worker
+STOP = object()
+
+class ApplicationPipeline:
+    """
+    Runs JobApplicationSystem's per-job steps as three stages:
+    
+    1. analysis: fetch + analyze the job description (I/O bound)
+    2. preparation: tailor the resume and write the cover letter (CPU bound)
+    3. automation: browser form filling, throttled on its own
+    
+    Each stage has its own worker pool and a bounded input queue. A stage that
+    falls behind fills its queue and blocks the stage feeding it (backpressure),
+    so a slow browser stage never piles up more prepared applications than
+    `queue_size`.
+    
+    With a run_id, each job's progress (analyzing, preparing, completed or
+    error, plus the automation outcome) is recorded in the system's run store.
+    """
+    
+    def __init__(self, system, analysis_workers: int = 8, preparation_workers: int = 4,
+                 automation_workers: int = 1, automation_interval: float = 1.0,
+                 queue_size: int = 16, automate: bool = True, run_id: Optional[str] = None):
+        self.system = system
+        self.run_id = run_id
+        self.analysis_workers = analysis_workers
+        self.preparation_workers = preparation_workers
+        self.automation_workers = automation_workers
+        self.automation_limiter = RateLimiter(automation_interval)  # min seconds between browser launches
+        self.queue_size = queue_size
+        self.automate = automate
+        self.lock = threading.Lock()
+        self.results = None
+    
+    def run(self, jobs: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Prepare (and optionally automate) applications for jobs; same result shape as process_applications"""
+        self.results = {
+            'total_jobs': len(jobs),
+            'processed': 0,
+            'applications': [],
+            'errors': [],
+            'automation_attempts': 0,
+            'automation_success': 0,
+            'start_time': datetime.now().isoformat()
+        }
+        applications = [None] * len(jobs)
+        
+        analysis_queue = queue.Queue(maxsize=self.queue_size)
+        preparation_queue = queue.Queue(maxsize=self.queue_size)
+        automation_queue = queue.Queue(maxsize=self.queue_size)
+        stages = [
+            ('analysis', self.analysis_workers, analysis_queue, self._analyze, preparation_queue),
+            ('preparation', self.preparation_workers, preparation_queue,
+             lambda item: self._prepare(item, applications), automation_queue),
+            ('automation', self.automation_workers, automation_queue, self._automate, None),
+        ]
+        
+        workers = []
+        for name, worker_count, inbox, handle, outbox in stages:
+            stage_workers = [
+                threading.Thread(target=self._stage_worker, args=(inbox, handle, outbox),
+                                 name=f'{name}-{i}', daemon=True)
+                for i in range(worker_count)
+            ]
+            for worker in stage_workers:
+                worker.start()
+            workers.append(stage_workers)
+        
+        # Blocks whenever the analysis queue is full
+        for index, job in enumerate(jobs):
+            analysis_queue.put({'index': index, 'job': job})
+        
+        # Drain the stages in order: once a stage's queue is done, everything it produced is downstream
+        for (name, _, inbox, _, _), stage_workers in zip(stages, workers):
+            inbox.join()
+            for _ in stage_workers:
+                inbox.put(STOP)
+            for worker in stage_workers:
+                worker.join()
+            logger.info(f"✅ {name.capitalize()} stage finished")
+        
+        self.results['applications'] = [application for application in applications if application is not None]
+        self.results['end_time'] = datetime.now().isoformat()
+        self.results['status'] = 'completed'
+        return self.results
+    
+    def _stage_worker(self, inbox: queue.Queue, handle, outbox: Optional[queue.Queue]):
+        while True:
+            item = inbox.get()
+            if item is STOP:
+                inbox.task_done()
+                return
+            try:
+                result = handle(item)
+                if result is not None and outbox is not None:
+                    # Blocks while the next stage is full
+                    outbox.put(result)
+            except Exception as e:
+                self._record_error(item['job'], e)
+            finally:
+                inbox.task_done()
+    
+    def _update_job(self, job: Dict[str, Any], status: Optional[str] = None, **fields):
+        if self.run_id is not None:
+            self.system.runs.update_job(self.run_id, job.get('id'), status, **fields)
+    
+    def _record_error(self, job: Dict[str, Any], error: Exception):
+        error_msg = f"Error processing {job.get('opening_title', 'Unknown')}: {str(error)}"
+        logger.error(f"❌ {error_msg}")
+        with self.lock:
+            self.results['errors'].append(error_msg)
+        self._update_job(job, 'error', error=str(error))
+    
+    def _analyze(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        self._update_job(item['job'], 'analyzing')
+        item['analysis'] = self.system.analyze_job_description(item['job'])
+        return item
+    
+    def _prepare(self, item: Dict[str, Any], applications: List[Optional[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+        job = item['job']
+        self._update_job(job, 'preparing')
+        application = self.system.prepare_application(job, job_analysis=item['analysis'])
+        applications[item['index']] = application
+        
+        self._update_job(job, 'completed', application=application)
+        with self.lock:
+            self.results['processed'] += 1
+            processed = self.results['processed']
+        logger.info(f"✅ Prepared {processed}/{self.results['total_jobs']}: {job.get('opening_title', 'Unknown')}")
+        
+        if not (self.automate and job.get('opening_link') and application.get('cover_letter')):
+            logger.info(f"ℹ️  Skipping automation (no URL or cover letter)")
+            return None
+        item['application'] = application
+        return item
+    
+    def _automate(self, item: Dict[str, Any]) -> None:
+        job, application = item['job'], item['application']
+        self.automation_limiter.wait()
+        logger.info(f"🤖 Attempting form automation for: {job.get('opening_title', 'Unknown')}")
+        with self.lock:
+            self.results['automation_attempts'] += 1
+        self._update_job(job, automation='running')
+        
+        automation_result = self.system.automate_form_filling(job.get('id'), application)
+        application['automation'] = automation_result
+        if automation_result["success"]:
+            logger.info(f"✅ Automation successful: {automation_result.get('filled_fields', [])}")
+            with self.lock:
+                self.results['automation_success'] += 1
+        else:
+            logger.warning(f"⚠️ Automation failed: {automation_result.get('error', 'Unknown error')}")
+        self._update_job(job, automation='success' if automation_result["success"] else 'failed')
+        return None
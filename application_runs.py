@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Application Run Store
+Thread-safe state for application runs: the job selection, one record per
+run with per-job states and timings, and a numbered event log that progress
+streams (Server-Sent Events) follow
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from typing import Any, Dict, List, Optional, Tuple
+
+# Job states, in pipeline order; 'completed' and 'error' are final
+JOB_STATES = ('queued', 'analyzing', 'preparing', 'completed', 'error')
+FINAL_JOB_STATES = ('completed', 'error')
+
+class ApplicationRunStore:
+    """
+    Every read and write goes through one lock, so the Flask request threads,
+    the background run and the pipeline's workers can share it. Each change
+    is also appended to a bounded event log with an increasing id, and
+    `wait_for_events` blocks until there is something newer than the id a
+    client last saw, so the UI is pushed progress instead of polling.
+    """
+
+    def __init__(self, max_runs: int = 10, max_events: int = 1000):
+        self.max_runs = max_runs
+        self.lock = threading.Lock()
+        self.changed = threading.Condition(self.lock)
+        self.selection = []
+        self.selection_by_id = {}
+        self.runs = OrderedDict()  # run_id -> run record, oldest first
+        self.active_run_id = None
+        self.events = deque(maxlen=max_events)
+        self.last_event_id = 0
+
+    # Selection
+
+    def select(self, jobs: List[Dict[str, Any]]):
+        selection_by_id = {}
+        for job in jobs:
+            selection_by_id.setdefault(job.get('id'), job)
+        with self.lock:
+            self.selection = list(jobs)
+            self.selection_by_id = selection_by_id
+
+    def selected(self) -> List[Dict[str, Any]]:
+        with self.lock:
+            return list(self.selection)
+
+    def selected_job(self, job_id: Any) -> Optional[Dict[str, Any]]:
+        """First selected job with this id"""
+        with self.lock:
+            return self.selection_by_id.get(job_id)
+
+    # Runs
+
+    def start_run(self, jobs: List[Dict[str, Any]]) -> Optional[str]:
+        """Start a run over jobs and return its id, or None if a run is already in progress"""
+        now = time.time()
+        with self.lock:
+            if self.active_run_id is not None:
+                return None
+            run_id = uuid.uuid4().hex[:12]
+            self.runs[run_id] = {
+                'run_id': run_id,
+                'status': 'running',
+                'started_at': now,
+                'finished_at': None,
+                'total_jobs': len(jobs),
+                'results': None,
+                'job_list': list(jobs),  # what the run processes, whatever is selected later
+                'jobs': OrderedDict(
+                    (job.get('id'), {
+                        'job_id': job.get('id'),
+                        'title': job.get('opening_title', 'Unknown'),
+                        'company': job.get('company_name', 'Unknown'),
+                        'status': 'queued',
+                        'state_since': now,
+                        'updated_at': now,
+                        'finished_at': None,
+                        'timings': {}
+                    })
+                    for job in jobs
+                )
+            }
+            while len(self.runs) > self.max_runs:
+                self.runs.popitem(last=False)
+            self.active_run_id = run_id
+            self._emit('run', self._run_summary(self.runs[run_id]))
+        return run_id
+
+    def update_job(self, run_id: str, job_id: Any, status: Optional[str] = None, **fields):
+        """Move a job to a new state and/or set fields on it (e.g. application, error, automation)"""
+        now = time.time()
+        with self.lock:
+            run = self.runs.get(run_id)
+            if run is None or job_id not in run['jobs']:
+                return
+            job = run['jobs'][job_id]
+            if status is not None and status != job['status']:
+                # Time spent in the state being left
+                job['timings'][job['status']] = round(now - job['state_since'], 3)
+                job['status'] = status
+                job['state_since'] = now
+                if status in FINAL_JOB_STATES:
+                    job['finished_at'] = now
+            job.update(fields)
+            job['updated_at'] = now
+            self._emit('job', dict(self._job_view(job), run_id=run_id, counts=self._counts(run)))
+
+    def finish_run(self, run_id: str, results: Optional[Dict[str, Any]] = None, status: str = 'completed'):
+        with self.lock:
+            run = self.runs.get(run_id)
+            if run is None:
+                return
+            run['status'] = status
+            run['finished_at'] = time.time()
+            run['results'] = results
+            if self.active_run_id == run_id:
+                self.active_run_id = None
+            self._emit('run', self._run_summary(run))
+
+    def run_jobs(self, run_id: str) -> List[Dict[str, Any]]:
+        """The jobs a run was started with"""
+        with self.lock:
+            run = self.runs.get(run_id)
+            return list(run['job_list']) if run is not None else []
+
+    def is_running(self) -> bool:
+        with self.lock:
+            return self.active_run_id is not None
+
+    def get_run(self, run_id: Optional[str] = None, include_jobs: bool = True) -> Optional[Dict[str, Any]]:
+        """Snapshot of a run (the latest one by default), without the prepared applications"""
+        with self.lock:
+            run = self._find_run(run_id)
+            if run is None:
+                return None
+            summary = self._run_summary(run)
+            if include_jobs:
+                summary['jobs'] = [self._job_view(job) for job in run['jobs'].values()]
+            return summary
+
+    def job_statuses(self, run_id: Optional[str] = None) -> Dict[Any, Dict[str, Any]]:
+        """{job_id: {'status', 'application' or 'error', ...}} for a run's jobs (the latest run by default)"""
+        with self.lock:
+            run = self._find_run(run_id)
+            if run is None:
+                return {}
+            return {
+                job_id: {key: value for key, value in job.items() if key != 'state_since'}
+                for job_id, job in run['jobs'].items()
+                if job['status'] != 'queued'
+            }
+
+    # Events
+
+    def wait_for_events(self, after_id: int, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Events newer than after_id, waiting up to timeout for one to arrive"""
+        with self.changed:
+            self.changed.wait_for(lambda: self.last_event_id > after_id, timeout)
+            return [event for event in self.events if event['id'] > after_id]
+
+    def snapshot(self) -> Tuple[int, Dict[str, Any]]:
+        """(last event id, {'run': latest run summary, 'is_processing'}) taken together, for a stream to start from"""
+        with self.lock:
+            run = self._find_run(None)
+            return self.last_event_id, {
+                'run': self._run_summary(run) if run is not None else None,
+                'is_processing': self.active_run_id is not None
+            }
+
+    # Helpers, called with the lock held
+
+    def _emit(self, event_type: str, data: Dict[str, Any]):
+        self.last_event_id += 1
+        self.events.append({'id': self.last_event_id, 'event': event_type, 'data': data})
+        self.changed.notify_all()
+
+    def _find_run(self, run_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        if run_id is not None:
+            return self.runs.get(run_id)
+        if not self.runs:
+            return None
+        return self.runs[next(reversed(self.runs))]
+
+    def _counts(self, run: Dict[str, Any]) -> Dict[str, int]:
+        counts = dict.fromkeys(JOB_STATES, 0)
+        for job in run['jobs'].values():
+            counts[job['status']] += 1
+        return counts
+
+    def _run_summary(self, run: Dict[str, Any]) -> Dict[str, Any]:
+        finished_at = run['finished_at'] or time.time()
+        return {
+            'run_id': run['run_id'],
+            'status': run['status'],
+            'started_at': run['started_at'],
+            'finished_at': run['finished_at'],
+            'elapsed': round(finished_at - run['started_at'], 3),
+            'total_jobs': run['total_jobs'],
+            'counts': self._counts(run)
+        }
+
+    def _job_view(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        # Prepared applications are large; they're served by /api/applications instead
+        view = {
+            key: value for key, value in job.items()
+            if key not in ('application', 'state_since')
+        }
+        view['timings'] = dict(job['timings'])  # logged events must not change later
+        return view
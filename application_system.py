@@ -4,13 +4,19 @@ Job Application System - Prototype
 Handles job selection, resume tailoring, and application processing
 """
 
-import json
-import time
+import atexit
 import threading
 import logging
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import openai
+from scrapers.utils.job_analyzer import get_tailoring_experience_level
+from job_description_analyzer import ANALYSIS_CACHE_FILE, JobAnalysisCache, JobDescriptionAnalyzer
+from application_pipeline import ApplicationPipeline
+from application_runs import ApplicationRunStore
+from browser_pool import BrowserPool
+from form_templates import FORM_TEMPLATE_FILE, FormTemplateCache
+from job_store import JobStore, get_job_store
 
 # Set up logging
 logging.basicConfig(
@@ -21,12 +27,31 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 class JobApplicationSystem:
-    def __init__(self):
-        self.selected_jobs = []
+    def __init__(self, analysis_cache_file: str = ANALYSIS_CACHE_FILE, job_store: Optional[JobStore] = None,
+                 browser_pool_size: int = 2, browser_headless: bool = False,
+                 form_template_file: str = FORM_TEMPLATE_FILE):
+        # Scraped jobs, indexed by id and shared with the web app
+        self.job_store = job_store or get_job_store()
+        # Selection and run state, shared by request threads and background runs
+        self.runs = ApplicationRunStore()
         self.application_queue = []
-        self.processing_status = {}
         self.resume_data = {}
         
+        # Job analyses shared by every pipeline stage and persisted across runs
+        self.analysis_cache = JobAnalysisCache(analysis_cache_file)
+        self.description_analyzer = None  # built on first use, reused for every job
+        
+        # Browsers shared by form automation, started on first use. They're visible by default:
+        # nothing is submitted, so each filled form stays open for review before its browser is reused
+        self.browser_pool_size = browser_pool_size
+        self.browser_headless = browser_headless  # headless sessions skip the review hold
+        self.browser_pool = None
+        self.browser_pool_lock = threading.Lock()
+        
+        # Per-board form templates, so repeat applications to a board skip field discovery
+        self.form_template_file = form_template_file
+        self.form_templates = None
+        
         # TODO: Add your resume data here or use setup_resume.py
         # Example resume data structure:
         # self.resume_data = {
@@ -47,68 +72,43 @@ class JobApplicationSystem:
         #     'languages': ['English', 'Spanish'],
         #     'certifications': ['AWS Certified Developer', 'Google Cloud Professional']
         # }
+    
+    @property
+    def selected_jobs(self) -> List[Dict[str, Any]]:
+        return self.runs.selected()
+    
+    @selected_jobs.setter
+    def selected_jobs(self, jobs: List[Dict[str, Any]]):
+        self.runs.select(jobs)
+    
+    @property
+    def processing_status(self) -> Dict[str, Any]:
+        """Per-job status of the latest run: {job_id: {'status', 'application' or 'error', ...}}"""
+        return self.runs.job_statuses()
         
     def load_jobs(self) -> List[Dict[str, Any]]:
         """Load available jobs from scraped data"""
-        try:
-            logger.info("📂 Loading jobs from scraped_data.json...")
-            with open('scraped_data.json', 'r') as f:
-                data = json.load(f)
-            jobs = [job for job in data if 'opening_title' in job]
-            logger.info(f"✅ Loaded {len(jobs)} jobs successfully")
-            return jobs
-        except Exception as e:
-            logger.error(f"❌ Error loading jobs: {e}")
-            return []
+        jobs = self.job_store.jobs()
+        logger.info(f"✅ {len(jobs)} jobs available")
+        return jobs
     
     def select_jobs(self, job_ids: List[str]) -> bool:
         """Select jobs for application"""
         logger.info(f"🎯 Selecting {len(job_ids)} jobs for application...")
         logger.info(f"📋 Job IDs: {job_ids}")
         
-        # Clear previous selections first
-        self.selected_jobs = []
-        self.processing_status = {}
-        
-        jobs = self.load_jobs()
-        
-        # Create a mapping of unique job identifiers to jobs
-        # Use combination of job ID and company name to make it unique
-        job_mapping = {}
-        for job in jobs:
-            job_id = job.get('id')
-            company = job.get('company_name', '')
-            unique_id = f"{job_id}_{company}"  # Make ID unique per company
-            job_mapping[unique_id] = job
-            # Also keep the original ID mapping for backward compatibility
-            if job_id not in job_mapping:
-                job_mapping[job_id] = job
-        
-        # Try to find jobs by unique ID first, then fallback to original ID
-        selected_jobs = []
-        seen_ids = set()
-        
-        for job_id in job_ids:
-            # First try to find by unique ID (job_id_company format)
-            if '_' in job_id:
-                if job_id in job_mapping:
-                    selected_jobs.append(job_mapping[job_id])
-                    seen_ids.add(job_id)
-            else:
-                # Try to find by original ID
-                if job_id in job_mapping:
-                    selected_jobs.append(job_mapping[job_id])
-                    seen_ids.add(job_id)
+        # "<id>_<company>" ids are unique across companies; plain ids are kept for backward compatibility
+        selected_jobs = self.job_store.find(job_ids)
         
         self.selected_jobs = selected_jobs
         
-        logger.info(f"✅ Selected {len(self.selected_jobs)} jobs:")
-        for job in self.selected_jobs:
+        logger.info(f"✅ Selected {len(selected_jobs)} jobs:")
+        for job in selected_jobs:
             logger.info(f"   - {job.get('opening_title', 'Unknown')} at {job.get('company_name', 'Unknown')}")
             logger.info(f"     ID: {job.get('id', 'Unknown')}")
             logger.info(f"     Link: {job.get('opening_link', 'Unknown')}")
         
-        return len(self.selected_jobs) > 0
+        return len(selected_jobs) > 0
     
     def analyze_job_description(self, job: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze job description to extract key requirements using AI"""
@@ -120,19 +120,24 @@ class JobApplicationSystem:
         # Use AI-powered job description analysis
         try:
             from job_description_analyzer import analyze_job_with_ai
-            from setup_groq import load_groq_api_key
             
             # Get resume skills for comparison
             resume_skills = self.resume_data.get('skills', [])
             
-            # Load Groq API key
-            groq_api_key = load_groq_api_key()
+            if self.description_analyzer is None:
+                from setup_groq import load_groq_api_key
+                
+                # Load Groq API key
+                self.description_analyzer = JobDescriptionAnalyzer(load_groq_api_key())
             
             logger.info(f"🤖 Using AI to analyze job description...")
-            logger.info(f"🌐 Fetching job description from: {job_url}")
+            logger.info(f"🌐 Job description source: {job_url}")
             
-            # Analyze with AI (will fallback to keyword matching if no API key)
-            analysis = analyze_job_with_ai(job, resume_skills, groq_api_key)
+            # Analyze with AI (will fallback to keyword matching if no API key);
+            # an unchanged posting is served from the analysis cache
+            analysis = analyze_job_with_ai(
+                job, resume_skills, cache=self.analysis_cache, analyzer=self.description_analyzer
+            )
             
             # Convert to our format
             keywords = {
@@ -168,22 +173,19 @@ class JobApplicationSystem:
             }
             
             # Extract experience level from title
-            if any(word in title.lower() for word in ['senior', 'lead', 'principal']):
-                keywords['experience_level'] = 'senior'
-            elif any(word in title.lower() for word in ['junior', 'entry', 'associate']):
-                keywords['experience_level'] = 'entry'
-            else:
-                keywords['experience_level'] = 'mid'
+            keywords['experience_level'] = get_tailoring_experience_level(title)
             
             logger.info(f"📊 Basic analysis complete: {len(keywords['technologies'])} technologies found")
             return keywords
     
-    def tailor_resume_for_job(self, job: Dict[str, Any], resume_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Tailor resume based on job requirements using AI analysis"""
+    def tailor_resume_for_job(self, job: Dict[str, Any], resume_data: Dict[str, Any],
+                              job_analysis: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Tailor resume based on job requirements using AI analysis (pass job_analysis to reuse one)"""
         title = job.get('opening_title', '')
         logger.info(f"📝 Tailoring resume for: {title}")
         
-        job_analysis = self.analyze_job_description(job)
+        if job_analysis is None:
+            job_analysis = self.analyze_job_description(job)
         
         tailored_resume = resume_data.copy()
         original_skills = resume_data.get('skills', [])
@@ -279,8 +281,8 @@ Best regards,
         logger.info(f"✅ Cover letter generated successfully")
         return cover_letter.strip()
     
-    def prepare_application(self, job: Dict[str, Any]) -> Dict[str, Any]:
-        """Prepare complete application for a job"""
+    def prepare_application(self, job: Dict[str, Any], job_analysis: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Prepare complete application for a job (pass job_analysis if the job was already analyzed)"""
         job_id = job.get('id', 'unknown')
         title = job.get('opening_title', 'Unknown')
         company = job.get('company_name', 'Unknown')
@@ -290,11 +292,12 @@ Best regards,
         
         # Analyze job requirements
         logger.info(f"📊 Step 1: Analyzing job requirements...")
-        job_analysis = self.analyze_job_description(job)
+        if job_analysis is None:
+            job_analysis = self.analyze_job_description(job)
         
         # Tailor resume
         logger.info(f"📝 Step 2: Tailoring resume...")
-        tailored_resume = self.tailor_resume_for_job(job, self.resume_data)
+        tailored_resume = self.tailor_resume_for_job(job, self.resume_data, job_analysis)
         
         # Generate cover letter
         logger.info(f"📄 Step 3: Generating cover letter...")
@@ -317,76 +320,42 @@ Best regards,
         
         return application
     
-    def process_applications(self) -> Dict[str, Any]:
-        """Process all selected jobs in background"""
-        logger.info(f"🚀 Starting application processing for {len(self.selected_jobs)} jobs")
-        logger.info(f"⏰ Start time: {datetime.now().strftime('%H:%M:%S')}")
+    def start_run(self) -> Optional[str]:
+        """Open a run over the selected jobs; None if one is already in progress"""
+        return self.runs.start_run(self.selected_jobs)
+    
+    def process_applications(self, automate: bool = True, run_id: Optional[str] = None,
+                             **pipeline_options) -> Dict[str, Any]:
+        """
+        Process all selected jobs in background
         
-        results = {
-            'total_jobs': len(self.selected_jobs),
-            'processed': 0,
-            'applications': [],
-            'errors': [],
-            'automation_attempts': 0,
-            'automation_success': 0,
-            'start_time': datetime.now().isoformat()
-        }
+        Jobs go through ApplicationPipeline: analysis, preparation and form
+        automation each run in their own bounded worker pool, so many jobs are
+        in flight at once. pipeline_options (e.g. analysis_workers,
+        automation_workers) are passed on to the pipeline.
         
-        for i, job in enumerate(self.selected_jobs, 1):
-            job_title = job.get('opening_title', 'Unknown')
-            company = job.get('company_name', 'Unknown')
-            
-            logger.info(f"")
-            logger.info(f"📋 Processing job {i}/{len(self.selected_jobs)}: {job_title} at {company}")
-            logger.info(f"🔄 Progress: {i}/{len(self.selected_jobs)} ({(i/len(self.selected_jobs)*100):.1f}%)")
-            
-            try:
-                application = self.prepare_application(job)
-                results['applications'].append(application)
-                results['processed'] += 1
-                
-                # Update status
-                self.processing_status[job.get('id')] = {
-                    'status': 'completed',
-                    'application': application
-                }
-                
-                logger.info(f"✅ Successfully processed: {job_title}")
-                
-                # Attempt automation if job URL is available
-                job_url = job.get('opening_link')
-                if job_url and application.get('cover_letter'):
-                    logger.info(f"🤖 Attempting form automation for: {job_title}")
-                    results['automation_attempts'] += 1
-                    automation_result = self.automate_form_filling(job.get('id'), application)
-                    
-                    if automation_result["success"]:
-                        logger.info(f"✅ Automation successful: {automation_result.get('filled_fields', [])}")
-                        results['automation_success'] += 1
-                        # Update application with automation results
-                        application['automation'] = automation_result
-                    else:
-                        logger.warning(f"⚠️ Automation failed: {automation_result.get('error', 'Unknown error')}")
-                        application['automation'] = automation_result
-                else:
-                    logger.info(f"ℹ️  Skipping automation (no URL or cover letter)")
-                
-                # Small delay to prevent overwhelming
-                if i < len(self.selected_jobs):  # Don't delay after last job
-                    logger.info(f"⏳ Waiting 1 second before next job...")
-                    time.sleep(1)
-                
-            except Exception as e:
-                error_msg = f"Error processing {job_title}: {str(e)}"
-                logger.error(f"❌ {error_msg}")
-                results['errors'].append(error_msg)
-                self.processing_status[job.get('id')] = {
-                    'status': 'error',
-                    'error': str(e)
-                }
-        
-        results['end_time'] = datetime.now().isoformat()
-        results['status'] = 'completed'
+        Progress is recorded in self.runs under run_id (from start_run); a run
+        is opened here when none is given.
+        """
+        if run_id is None:
+            run_id = self.start_run()
+            if run_id is None:
+                raise RuntimeError("Application processing is already running")
+        jobs = self.runs.run_jobs(run_id)
+        
+        logger.info(f"🚀 Starting application processing for {len(jobs)} jobs (run {run_id})")
+        logger.info(f"⏰ Start time: {datetime.now().strftime('%H:%M:%S')}")
+        
+        # One automation worker per pooled browser, so that many forms are filled at once
+        pipeline_options.setdefault('automation_workers', self.browser_pool_size)
+        pipeline = ApplicationPipeline(self, automate=automate, run_id=run_id, **pipeline_options)
+        try:
+            results = pipeline.run(jobs)
+        except Exception:
+            self.runs.finish_run(run_id, status='failed')
+            raise
+        results['run_id'] = run_id
+        self.runs.finish_run(run_id, results={key: value for key, value in results.items() if key != 'applications'})
         
         logger.info(f"")
         logger.info(f"🎉 Application processing completed!")
@@ -409,20 +378,31 @@ Best regards,
         return {
             'selected_jobs_count': len(self.selected_jobs),
             'processing_status': self.processing_status,
-            'is_processing': len(self.processing_status) > 0
+            'is_processing': self.runs.is_running(),
+            'run': self.runs.get_run(include_jobs=False)
         }
     
+    def get_browser_pool(self) -> BrowserPool:
+        """Browser sessions reused across applications (automation_workers forms can be filled at once)"""
+        with self.browser_pool_lock:
+            if self.browser_pool is None:
+                self.browser_pool = BrowserPool(size=self.browser_pool_size, headless=self.browser_headless)
+                atexit.register(self.browser_pool.close)
+            return self.browser_pool
+    
+    def get_form_templates(self) -> FormTemplateCache:
+        """Form templates learned by automation, opened on first use"""
+        with self.browser_pool_lock:
+            if self.form_templates is None:
+                self.form_templates = FormTemplateCache(self.form_template_file)
+            return self.form_templates
+    
     def automate_form_filling(self, job_id: str, application_result: Dict[str, Any], keep_browser_open: bool = True, delay_seconds: int = 30) -> Dict[str, Any]:
         """Automate form filling for a job application"""
         try:
             from form_automation import JobFormAutomation
             
-            # Find job in selected jobs
-            job = None
-            for selected_job in self.selected_jobs:
-                if selected_job.get('id') == job_id:
-                    job = selected_job
-                    break
+            job = self.runs.selected_job(job_id)
             
             if not job:
                 return {"success": False, "error": "Job not found"}
@@ -436,13 +416,16 @@ Best regards,
             
             logger.info(f"🤖 Starting form automation for: {job.get('opening_title', 'Unknown')}")
             logger.info(f"🌐 Job URL: {job_url}")
-            logger.info(f"⏰ Browser will stay open for {delay_seconds} seconds after filling")
+            if keep_browser_open and not self.browser_headless:
+                logger.info(f"⏰ Browser will stay open for {delay_seconds} seconds after filling")
             
-            # Create automation instance with custom settings
+            # Create automation instance with custom settings; the browser comes from the shared pool
             automation = JobFormAutomation(
-                headless=False,
+                headless=self.browser_headless,
                 keep_open=keep_browser_open,
-                delay_after_fill=delay_seconds
+                delay_after_fill=delay_seconds,
+                pool=self.get_browser_pool(),
+                templates=self.get_form_templates()
             )
             
             # Attempt automation
@@ -455,8 +438,10 @@ Best regards,
             if automation_result["success"]:
                 logger.info(f"✅ Form automation successful!")
                 logger.info(f"   📝 Filled fields: {automation_result.get('filled_fields', [])}")
-                if keep_browser_open:
-                    logger.info(f"   ⏰ Browser will close in {delay_seconds} seconds")
+                if automation_result.get('form_template') == 'used':
+                    logger.info(f"   📐 Filled from the board's form template")
+                if automation_result.get('browser_kept_open'):
+                    logger.info(f"   ⏰ Browser stays open for {delay_seconds} seconds for review")
             else:
                 logger.warning(f"⚠️ Form automation failed: {automation_result.get('error', 'Unknown error')}")
             
@@ -469,14 +454,9 @@ Best regards,
     def preview_form_fields(self, job_id: str) -> Dict[str, Any]:
         """Preview form fields for a job application"""
         try:
-            from form_automation import form_automation
+            from form_automation import JobFormAutomation
             
-            # Find job in selected jobs
-            job = None
-            for selected_job in self.selected_jobs:
-                if selected_job.get('id') == job_id:
-                    job = selected_job
-                    break
+            job = self.runs.selected_job(job_id)
             
             if not job:
                 return {"success": False, "error": "Job not found"}
@@ -488,8 +468,8 @@ Best regards,
             logger.info(f"🔍 Previewing form fields for: {job.get('opening_title', 'Unknown')}")
             logger.info(f"🌐 Job URL: {job_url}")
             
-            # Preview form fields
-            preview_result = form_automation.preview_form_fields(job_url)
+            # Preview form fields in a pooled browser
+            preview_result = JobFormAutomation(pool=self.get_browser_pool()).preview_form_fields(job_url)
             
             if preview_result["success"]:
                 logger.info(f"✅ Form preview successful!")
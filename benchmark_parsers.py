@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Offline parser benchmark
+Feeds the saved board pages in fixtures/boards through each spider's parse
+and reports items/sec, peak memory and per-stage time. No network is used.
+
+Usage:
+    python benchmark_parsers.py                 # direct item path
+    python benchmark_parsers.py --legacy        # ItemLoader path, for comparison
+    python benchmark_parsers.py --rounds 50 --json bench_output.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from scrapy import Request
+from scrapy.http import HtmlResponse
+from scrapers.spiders.greenhouse_job_departments_spider import GreenhouseJobDepartmentsSpider
+from scrapers.spiders.greenhouse_jobs_outline_spider import GreenhouseJobsOutlineSpider
+from scrapers.spiders.lever_jobs_outline_spider import LeverJobsOutlineSpider
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'boards')
+
+SPIDERS = {
+    spider_class.name: spider_class
+    for spider_class in (GreenhouseJobDepartmentsSpider, GreenhouseJobsOutlineSpider, LeverJobsOutlineSpider)
+}
+
+STAGES = ('load', 'init', 'parse', 'serialize')
+
+
+def load_manifest(fixtures_dir=FIXTURES_DIR):
+    """Load the fixture corpus description (file, careers page URL, expected items per spider)"""
+    with open(os.path.join(fixtures_dir, 'manifest.json'), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def create_offline_spider(spider_class, careers_page_url, use_item_loader=0):
+    """Create a spider that never touches S3 or the network"""
+    spider = spider_class(
+        careers_page_url=careers_page_url,
+        run_hash='benchmark',
+        use_existing_html=0,
+        use_item_loader=use_item_loader,
+    )
+    spider.settings = spider.settings.copy()
+    spider.settings.set('S3_HTML_BUCKET', None)
+    return spider
+
+
+def run_parse_once(spider_class, careers_page_url, body, use_item_loader=0):
+    """Run one parse pass and return (items, stage timings in seconds)"""
+    timings = {}
+
+    start_time = time.perf_counter()
+    response = HtmlResponse(url=careers_page_url, body=body, encoding='utf-8', request=Request(careers_page_url))
+    timings['load'] = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    spider = create_offline_spider(spider_class, careers_page_url, use_item_loader)
+    timings['init'] = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    items = [result for result in spider.parse(response) if not isinstance(result, Request)]
+    timings['parse'] = time.perf_counter() - start_time
+
+    # Same conversion the JSON export pipeline does
+    start_time = time.perf_counter()
+    json.dumps([dict(item) for item in items], ensure_ascii=False)
+    timings['serialize'] = time.perf_counter() - start_time
+
+    return items, timings
+
+
+def benchmark_case(spider_class, careers_page_url, body, rounds=10, use_item_loader=0):
+    """Benchmark one spider over one fixture"""
+    stage_totals = dict.fromkeys(STAGES, 0.0)
+    item_count = 0
+
+    for _ in range(rounds):
+        items, timings = run_parse_once(spider_class, careers_page_url, body, use_item_loader)
+        item_count = len(items)
+        for stage, seconds in timings.items():
+            stage_totals[stage] += seconds
+
+    # Separate pass for memory so tracemalloc overhead doesn't skew the timings
+    tracemalloc.start()
+    run_parse_once(spider_class, careers_page_url, body, use_item_loader)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    parse_seconds = stage_totals['parse']
+    return {
+        'items': item_count,
+        'rounds': rounds,
+        'items_per_sec': (item_count * rounds) / parse_seconds if parse_seconds else 0.0,
+        'peak_memory_kb': peak_memory / 1024,
+        'stage_ms': {stage: seconds * 1000 / rounds for stage, seconds in stage_totals.items()},
+    }
+
+
+def run_benchmark(rounds=10, use_item_loader=0, fixtures_dir=FIXTURES_DIR):
+    """Run every spider over every fixture in the manifest"""
+    results = []
+    for entry in load_manifest(fixtures_dir):
+        with open(os.path.join(fixtures_dir, entry['file']), 'rb') as f:
+            body = f.read()
+
+        for spider_name, expected_items in entry['spiders'].items():
+            result = benchmark_case(
+                SPIDERS[spider_name], entry['careers_page_url'], body, rounds, use_item_loader
+            )
+            result.update({
+                'spider': spider_name,
+                'fixture': entry['file'],
+                'expected_items': expected_items,
+                'ok': result['items'] == expected_items,
+            })
+            results.append(result)
+    return results
+
+
+def print_report(results, use_item_loader=0):
+    """Print a table of the benchmark results"""
+    path_name = 'ItemLoader' if use_item_loader else 'direct items'
+    print(f"🚀 Parser Benchmark ({path_name})")
+    print("=" * 110)
+    print(f"{'spider':<28}{'fixture':<36}{'items':>7}{'items/sec':>11}{'peak KB':>10}  "
+          + " ".join(f"{stage + ' ms':>12}" for stage in STAGES))
+
+    for result in results:
+        status = '' if result['ok'] else f"  ❌ expected {result['expected_items']}"
+        print(f"{result['spider']:<28}{result['fixture']:<36}{result['items']:>7}"
+              f"{result['items_per_sec']:>11.0f}{result['peak_memory_kb']:>10.0f}  "
+              + " ".join(f"{result['stage_ms'][stage]:>12.2f}" for stage in STAGES)
+              + status)
+
+    total_items = sum(result['items'] * result['rounds'] for result in results)
+    total_parse = sum(result['stage_ms']['parse'] * result['rounds'] / 1000 for result in results)
+    print("-" * 110)
+    print(f"📈 Overall: {total_items / total_parse:.0f} items/sec" if total_parse else "📈 Overall: no items")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline parse benchmark over saved board pages')
+    parser.add_argument('--rounds', type=int, default=10, help='parse passes per spider/fixture')
+    parser.add_argument('--legacy', action='store_true', help='use the ItemLoader path')
+    parser.add_argument('--json', help='write results to this file')
+    args = parser.parse_args()
+
+    use_item_loader = 1 if args.legacy else 0
+    results = run_benchmark(rounds=args.rounds, use_item_loader=use_item_loader)
+    print_report(results, use_item_loader)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    # Non-zero exit when a fixture no longer yields the expected items
+    if not all(result['ok'] for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
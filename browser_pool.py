@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Browser Pool
+Warm Selenium sessions shared by form automation, so a job application
+borrows a running browser instead of launching Chrome for every job
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Optional
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+def create_chrome_driver(headless: bool = True):
+    """Chrome WebDriver with the options form automation uses"""
+    chrome_options = Options()
+
+    if headless:
+        chrome_options.add_argument("--headless")
+
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+
+    # User agent to avoid detection
+    chrome_options.add_argument(f"--user-agent={USER_AGENT}")
+
+    driver = webdriver.Chrome(options=chrome_options)
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    return driver
+
+class BrowserPool:
+    """
+    Up to `size` browser sessions, started on demand and reused across jobs.
+
+    acquire() hands out an idle session (or starts one while under `size`,
+    otherwise waits for one to be released). release() resets the session
+    for the next job: extra windows closed, cookies and site storage cleared,
+    back on about:blank. A session that fails its reset (crashed or hung
+    driver) or has served `max_uses` jobs is quit, and a fresh one takes its
+    place on the next acquire.
+    """
+
+    def __init__(self, size: int = 2, headless: bool = True,
+                 driver_factory: Optional[Callable[[], Any]] = None,
+                 max_uses: int = 50, acquire_timeout: float = 300.0):
+        self.size = size
+        self.headless = headless
+        self.driver_factory = driver_factory or (lambda: create_chrome_driver(headless))
+        self.max_uses = max_uses  # jobs per session before it's replaced
+        self.acquire_timeout = acquire_timeout
+        self.condition = threading.Condition()
+        self.idle = []  # most recently released last
+        self.uses = {}  # driver -> jobs served, for every live session
+        self.starting = 0  # sessions being launched
+        self.closed = False
+        self.stats = {'started': 0, 'reused': 0, 'recycled': 0, 'crashed': 0}
+
+    def acquire(self, timeout: Optional[float] = None):
+        """A reset, ready session; raises TimeoutError if none frees up within timeout"""
+        timeout = self.acquire_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        with self.condition:
+            while True:
+                if self.closed:
+                    raise RuntimeError("Browser pool is closed")
+                if self.idle:
+                    driver = self.idle.pop()
+                    self.uses[driver] += 1
+                    self.stats['reused'] += 1
+                    return driver
+                if len(self.uses) + self.starting < self.size:
+                    self.starting += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"No browser session free after {timeout:.0f}s")
+                self.condition.wait(remaining)
+
+        # Launch outside the lock; other threads keep borrowing and returning sessions meanwhile
+        try:
+            driver = self.driver_factory()
+        except Exception:
+            with self.condition:
+                self.starting -= 1
+                self.condition.notify()
+            raise
+        with self.condition:
+            self.starting -= 1
+            self.uses[driver] = 1
+            self.stats['started'] += 1
+        logger.info(f"🌐 Started browser session {len(self.uses)}/{self.size}")
+        return driver
+
+    def release(self, driver):
+        """Give a session back: reset it for the next job, or replace it if it's crashed or worn out"""
+        with self.condition:
+            if driver not in self.uses:
+                return
+            reusable = not self.closed and self.uses[driver] < self.max_uses
+
+        if reusable and self._reset(driver):
+            with self.condition:
+                self.idle.append(driver)
+                self.condition.notify()
+            return
+
+        if reusable:
+            logger.warning("⚠️ Browser session failed its reset, replacing it")
+        with self.condition:
+            self.stats['crashed' if reusable else 'recycled'] += 1
+        self._discard(driver)
+
+    @contextmanager
+    def session(self, timeout: Optional[float] = None):
+        """with pool.session() as driver: ... (released even if the job fails)"""
+        driver = self.acquire(timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def warm(self, count: Optional[int] = None):
+        """Start sessions ahead of the first jobs (all `size` by default)"""
+        count = min(self.size, count or self.size)
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            drivers = list(executor.map(lambda _: self.acquire(), range(count)))
+        for driver in drivers:
+            with self.condition:
+                self.idle.append(driver)
+                self.condition.notify()
+
+    def close(self):
+        """Quit idle sessions now; sessions in use are quit when released"""
+        with self.condition:
+            self.closed = True
+            idle, self.idle = self.idle, []
+            self.condition.notify_all()
+        for driver in idle:
+            self._discard(driver)
+
+    def status(self) -> Dict[str, Any]:
+        with self.condition:
+            return dict(self.stats, size=self.size, live=len(self.uses), idle=len(self.idle),
+                        in_use=len(self.uses) - len(self.idle))
+
+    def _reset(self, driver) -> bool:
+        """Clear everything the last job left behind; False if the driver doesn't respond"""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            # Storage of the page still open, then the current domain's cookies
+            origin = driver.execute_script(
+                "try { localStorage.clear(); sessionStorage.clear(); } catch (e) {} return location.origin;"
+            )
+            driver.delete_all_cookies()
+        except Exception as e:
+            logger.debug(f"Browser reset failed: {e}")
+            return False
+
+        if hasattr(driver, 'execute_cdp_cmd'):
+            # Chrome: cookies of every domain, and the rest of the job origin's storage (IndexedDB, cache...).
+            # Best effort; a session that answered the checks above is still reusable if these are refused
+            try:
+                driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+                if isinstance(origin, str) and origin.startswith('http'):
+                    driver.execute_cdp_cmd('Storage.clearDataForOrigin', {'origin': origin, 'storageTypes': 'all'})
+            except Exception as e:
+                logger.debug(f"Browser storage cleanup skipped: {e}")
+
+        try:
+            driver.get('about:blank')
+            return True
+        except Exception as e:
+            logger.debug(f"Browser reset failed: {e}")
+            return False
+
+    def _discard(self, driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass  # already gone
+        with self.condition:
+            self.uses.pop(driver, None)
+            self.condition.notify()
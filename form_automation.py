@@ -6,24 +6,140 @@ Automatically fills out job application forms using analyzed data
 
 import time
 import logging
+import threading
 from typing import Dict, Any, List, Optional
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 import re
+from browser_pool import BrowserPool, create_chrome_driver
+from form_templates import MATCHED_ATTRIBUTES, FormTemplateCache, template_field
 
 logger = logging.getLogger(__name__)
 
+# Any form control; its presence means the application form has rendered
+FORM_FIELD_SELECTOR = 'input:not([type="hidden"]), textarea, select'
+
+FIELD_TAGS = ('input', 'textarea', 'select')
+
+# A form control with what field matching needs; elements come back as WebElements
+FIELD_DESCRIBE_JS = """
+function isVisible(el) {
+    var style = window.getComputedStyle(el);
+    return el.getClientRects().length > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+}
+function describeField(el) {
+    var labels = Array.from(el.labels || []).map(function (label) { return label.textContent; });
+    (el.getAttribute('aria-labelledby') || '').split(/\\s+/).forEach(function (id) {
+        var label = id && document.getElementById(id);
+        if (label) { labels.push(label.textContent); }
+    });
+    return {
+        element: el,
+        tag: el.tagName.toLowerCase(),
+        type: el.getAttribute('type'),
+        name: el.getAttribute('name'),
+        id: el.getAttribute('id'),
+        placeholder: el.getAttribute('placeholder'),
+        'aria-label': el.getAttribute('aria-label'),
+        'data-field': el.getAttribute('data-field'),
+        label: labels.join(' ').replace(/\\s+/g, ' ').trim(),
+        visible: isVisible(el),
+        readonly: el.hasAttribute('readonly'),
+        disabled: el.disabled
+    };
+}
+"""
+
+# Every form control on the page, in one round trip
+FIELD_SNAPSHOT_SCRIPT = FIELD_DESCRIBE_JS + """
+return Array.from(document.querySelectorAll('input, textarea, select')).map(describeField);
+"""
+
+# A learned template's fields, looked up by locator (null where one is gone), and the number of
+# visible form fields on the page to compare with the template's, in one round trip
+TEMPLATE_LOCATE_SCRIPT = FIELD_DESCRIBE_JS + """
+return {
+    fields: arguments[0].map(function (selector) {
+        var el = document.querySelector(selector);
+        return el ? describeField(el) : null;
+    }),
+    visible_fields: Array.from(document.querySelectorAll('input, textarea, select')).filter(isVisible).length
+};
+"""
+
+# (tag, attribute, exact) in the order an alias is matched against the snapshot:
+# exact name/id, then case-insensitive substrings of name/id/placeholder, aria-label, data-field, label text
+FIELD_MATCH_RULES = (
+    ('input', 'name', True), ('input', 'id', True),
+    ('textarea', 'name', True), ('textarea', 'id', True),
+    ('select', 'name', True), ('select', 'id', True),
+    ('input', 'name', False), ('input', 'id', False), ('input', 'placeholder', False),
+    ('textarea', 'name', False), ('textarea', 'id', False), ('textarea', 'placeholder', False),
+    ('select', 'name', False), ('select', 'id', False),
+    ('input', 'aria-label', False), ('textarea', 'aria-label', False), ('select', 'aria-label', False),
+    ('input', 'data-field', False), ('textarea', 'data-field', False), ('select', 'data-field', False),
+    ('input', 'label', False), ('textarea', 'label', False), ('select', 'label', False),
+)
+
+def alias_matches(field_name: str, field: Dict[str, Any], attribute: str, exact: bool) -> bool:
+    """Whether a snapshot field's attribute matches an alias under one of FIELD_MATCH_RULES"""
+    value = field.get(attribute) or ''
+    return value == field_name if exact else field_name.lower() in value.lower()
+
+# Browsers handed off for manual review: driver -> (close timer, pool it came from)
+held_sessions = {}
+held_sessions_lock = threading.Lock()
+
+def end_hold(driver) -> bool:
+    """Close a held browser now (or hand it back to its pool); False if it was already closed"""
+    with held_sessions_lock:
+        held = held_sessions.pop(driver, None)
+    if held is None:
+        return False
+    timer, pool = held
+    timer.cancel()
+    try:
+        if pool is not None:
+            pool.release(driver)
+        else:
+            driver.quit()
+    except Exception as e:
+        logger.debug(f"Error closing held browser: {e}")
+    logger.info("✅ Review time over, browser closed")
+    return True
+
 class JobFormAutomation:
-    def __init__(self, headless: bool = False, keep_open: bool = True, delay_after_fill: int = 30):
-        """Initialize the form automation system"""
+    def __init__(self, headless: bool = False, keep_open: bool = True, delay_after_fill: int = 30,
+                 pool: Optional[BrowserPool] = None, page_timeout: float = 10,
+                 field_timeout: float = 5, hold_in_background: bool = True,
+                 templates: Optional[FormTemplateCache] = None):
+        """
+        Initialize the form automation system
+        
+        With a pool, the browser is borrowed from it for each job and handed
+        back (reset) afterwards instead of being launched and quit.
+        Pages and fields are waited for (up to page_timeout / field_timeout
+        seconds) rather than slept on. With hold_in_background, a browser kept
+        open for review is handed off and closed by a timer, so the caller
+        doesn't block for delay_after_fill. With templates, fields found on a
+        Greenhouse/Lever board are remembered and later applications to that
+        board fill from the template instead of discovering the form again.
+        """
         self.headless = headless
         self.keep_open = keep_open
         self.delay_after_fill = delay_after_fill
+        self.pool = pool
+        self.page_timeout = page_timeout
+        self.field_timeout = field_timeout
+        self.hold_in_background = hold_in_background
+        self.templates = templates
+        self.template_fields = None  # logical field -> element, while filling from a template
+        self.template_snapshot = None  # page snapshot for fields the template lacks, taken when first needed
+        self.learned_locators = {}  # logical field -> template entry, for fields discovered on this page
+        self.absent_fields = set()  # logical fields looked for and not on the page
         self.driver = None
         self.wait = None
         
@@ -199,26 +315,14 @@ class JobFormAutomation:
         }
     
     def setup_driver(self):
-        """Set up Chrome WebDriver with appropriate options"""
+        """Set up Chrome WebDriver with appropriate options (borrowed from the pool if there is one)"""
         try:
-            chrome_options = Options()
-            
-            if self.headless:
-                chrome_options.add_argument("--headless")
-            
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
-            
-            # User agent to avoid detection
-            chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-            
-            self.driver = webdriver.Chrome(options=chrome_options)
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            if self.pool is not None:
+                self.driver = self.pool.acquire()
+            else:
+                self.driver = create_chrome_driver(self.headless)
             
-            self.wait = WebDriverWait(self.driver, 10)
+            self.wait = WebDriverWait(self.driver, self.page_timeout)
             
             logger.info("✅ Chrome WebDriver setup complete")
             return True
@@ -227,74 +331,157 @@ class JobFormAutomation:
             logger.error(f"❌ Error setting up WebDriver: {e}")
             return False
     
-    def find_form_field(self, field_names: List[str]) -> Optional[Any]:
-        """Find form field by multiple possible names with improved detection"""
+    def close_driver(self):
+        """Quit the browser, or hand it back to the pool"""
+        if self.driver is None:
+            return
+        if self.pool is not None:
+            self.pool.release(self.driver)
+        else:
+            self.driver.quit()
+        self.driver = None
+        self.wait = None
+    
+    def hold_open(self):
+        """Hand the open browser off for manual review; a timer closes it after delay_after_fill seconds"""
+        driver = self.driver
+        self.driver = None
+        self.wait = None
+        timer = threading.Timer(self.delay_after_fill, end_hold, args=(driver,))
+        timer.daemon = True
+        with held_sessions_lock:
+            held_sessions[driver] = (timer, self.pool)
+        timer.start()
+    
+    def wait_for_page(self) -> bool:
+        """Wait until the document has loaded and a form field is on it (many boards render the form with JS)"""
+        try:
+            self.wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
+            self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, FORM_FIELD_SELECTOR)))
+            return True
+        except TimeoutException:
+            logger.warning(f"⚠️ No form field appeared within {self.page_timeout}s, using the page as it is")
+            return False
+    
+    def wait_until_interactable(self, element) -> bool:
+        """Wait until a field is visible and enabled"""
+        try:
+            WebDriverWait(self.driver, self.field_timeout).until(
+                lambda driver: element.is_displayed() and element.is_enabled()
+            )
+            return True
+        except (TimeoutException, StaleElementReferenceException):
+            logger.debug(f"Field not interactable after {self.field_timeout}s")
+            return False
+    
+    def snapshot_form_fields(self) -> List[Dict[str, Any]]:
+        """Every input, textarea and select on the page with its attributes, label text and visibility"""
+        try:
+            return self.driver.execute_script(FIELD_SNAPSHOT_SCRIPT) or []
+        except Exception as e:
+            logger.error(f"❌ Error reading form fields: {e}")
+            return []
+    
+    def find_form_field(self, field_names: List[str], fields: Optional[List[Dict[str, Any]]] = None) -> Optional[Any]:
+        """Find form field by multiple possible names, matched against a snapshot of the page's fields"""
+        if fields is None:
+            fields = self.snapshot_form_fields()
+        field = self.match_form_field(field_names, fields)
+        return field['element'] if field is not None else None
+    
+    def match_form_field(self, field_names: List[str], fields: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Snapshot entry of the best match for any of the names, with the name it matched as 'alias'"""
+        candidates = {tag: [] for tag in FIELD_TAGS}
+        for field in fields:
+            if field['visible'] and not field['disabled'] and field['tag'] in candidates:
+                candidates[field['tag']].append(field)
+        
         for field_name in field_names:
-            try:
-                # Try different selectors with better detection
-                selectors = [
-                    # Exact matches first
-                    f'input[name="{field_name}"]',
-                    f'input[id="{field_name}"]',
-                    f'textarea[name="{field_name}"]',
-                    f'textarea[id="{field_name}"]',
-                    f'select[name="{field_name}"]',
-                    f'select[id="{field_name}"]',
-                    
-                    # Case-insensitive matches
-                    f'input[name*="{field_name}" i]',
-                    f'input[id*="{field_name}" i]',
-                    f'input[placeholder*="{field_name}" i]',
-                    f'textarea[name*="{field_name}" i]',
-                    f'textarea[id*="{field_name}" i]',
-                    f'textarea[placeholder*="{field_name}" i]',
-                    f'select[name*="{field_name}" i]',
-                    f'select[id*="{field_name}" i]',
-                    
-                    # Label-based detection
-                    f'input[aria-label*="{field_name}" i]',
-                    f'textarea[aria-label*="{field_name}" i]',
-                    f'select[aria-label*="{field_name}" i]',
-                    
-                    # Data attributes
-                    f'input[data-field*="{field_name}" i]',
-                    f'textarea[data-field*="{field_name}" i]',
-                    f'select[data-field*="{field_name}" i]',
-                ]
-                
-                for selector in selectors:
-                    try:
-                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                        for element in elements:
-                            if element.is_displayed() and element.is_enabled():
-                                # Check if field is not read-only
-                                readonly = element.get_attribute("readonly")
-                                disabled = element.get_attribute("disabled")
-                                
-                                if not readonly and not disabled:
-                                    logger.info(f"✅ Found field: {field_name} using selector: {selector}")
-                                    return element
-                                else:
-                                    logger.debug(f"⚠️ Field {field_name} is read-only or disabled")
-                    except NoSuchElementException:
+            for tag, attribute, exact in FIELD_MATCH_RULES:
+                for field in candidates[tag]:
+                    if not alias_matches(field_name, field, attribute, exact):
+                        continue
+                    if field['readonly']:
+                        logger.debug(f"⚠️ Field {field_name} is read-only or disabled")
                         continue
-                        
-            except Exception as e:
-                logger.debug(f"Field {field_name} not found: {e}")
-                continue
+                    match = 'exact' if exact else 'contains'
+                    logger.info(f"✅ Found field: {field_name} by {tag} {attribute} ({match})")
+                    return dict(field, alias=field_name)
         
         logger.warning(f"⚠️ Could not find field for: {field_names}")
         return None
     
+    def locate_template_fields(self, template: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        {logical field: element} for a template, or None if it doesn't match the page: one of its
+        fields is missing or unusable, is no longer the field it was learned from (a different
+        alias match, name, label or placeholder), or the page has a different number of visible fields
+        """
+        entries = template['fields']
+        field_types = list(entries)
+        try:
+            located = self.driver.execute_script(TEMPLATE_LOCATE_SCRIPT, [entries[field_type]['locator'] for field_type in field_types])
+            fields = located['fields']
+            visible_fields = located['visible_fields']
+        except Exception as e:
+            logger.warning(f"⚠️ Could not check form template: {e}")
+            return None
+        
+        if len(fields) != len(field_types):
+            return None
+        changed = [field_type for field_type, field in zip(field_types, fields)
+                   if not self.is_template_field(entries[field_type], field)]
+        if changed:
+            logger.info(f"📐 Form template no longer matches the page (changed: {changed}), discovering fields")
+            return None
+        if visible_fields != template['visible_fields']:
+            logger.info(f"📐 Form has {visible_fields} visible fields, template has {template['visible_fields']}, discovering fields")
+            return None
+        return {field_type: field['element'] for field_type, field in zip(field_types, fields)}
+    
+    def is_template_field(self, entry: Dict[str, str], field: Optional[Dict[str, Any]]) -> bool:
+        """
+        Whether the element a template locator found is still the field the template learned:
+        usable, matched by the same alias under the matching rules, with the same name, label and placeholder
+        (Greenhouse ids are per question index, so another posting can put a different question there)
+        """
+        if field is None or not field['visible'] or field['disabled'] or field['readonly']:
+            return False
+        if any((field.get(attribute) or '') != entry[attribute] for attribute in MATCHED_ATTRIBUTES):
+            return False
+        return any(alias_matches(entry['alias'], field, attribute, exact)
+                   for tag, attribute, exact in FIELD_MATCH_RULES if tag == field['tag'])
+    
+    def locate_field(self, field_type: str, fields: Optional[List[Dict[str, Any]]]) -> Optional[Any]:
+        """Element for a logical field: from the template if it has it, otherwise discovered on the page (and learned)"""
+        if self.template_fields is not None:
+            if field_type in self.template_fields:
+                return self.template_fields[field_type]
+            if field_type in self.absent_fields:
+                return None  # not on this board's form, which still has the same fields
+            # Not in the template (e.g. no id/name to locate it by): look on this page
+            if self.template_snapshot is None:
+                self.template_snapshot = self.snapshot_form_fields()
+            fields = self.template_snapshot
+        
+        field = self.match_form_field(self.field_mappings[field_type], fields)
+        if field is None:
+            self.absent_fields.add(field_type)
+            return None
+        entry = template_field(field)
+        if entry:
+            self.learned_locators[field_type] = entry
+        return field['element']
+    
     def fill_text_field(self, element, value: str):
         """Fill a text input field with improved interaction"""
         try:
+            # Fields can be rendered before they're enabled; the JS fallback below works either way
+            self.wait_until_interactable(element)
+            
             # Clear the field first
             element.clear()
             
-            # Wait a moment for the clear to take effect
-            time.sleep(0.5)
-            
             # Try different methods to fill the field
             try:
                 # Method 1: Direct send_keys
@@ -304,7 +491,6 @@ class JobFormAutomation:
                 try:
                     # Method 2: Click and then send_keys
                     element.click()
-                    time.sleep(0.2)
                     element.send_keys(value)
                 except Exception as e2:
                     logger.debug(f"Method 2 failed: {e2}")
@@ -327,12 +513,12 @@ class JobFormAutomation:
     def fill_textarea_field(self, element, value: str):
         """Fill a textarea field with improved interaction"""
         try:
+            # Fields can be rendered before they're enabled; the JS fallback below works either way
+            self.wait_until_interactable(element)
+            
             # Clear the field first
             element.clear()
             
-            # Wait a moment for the clear to take effect
-            time.sleep(0.5)
-            
             # Try different methods to fill the field
             try:
                 # Method 1: Direct send_keys
@@ -342,7 +528,6 @@ class JobFormAutomation:
                 try:
                     # Method 2: Click and then send_keys
                     element.click()
-                    time.sleep(0.2)
                     element.send_keys(value)
                 except Exception as e2:
                     logger.debug(f"Method 2 failed: {e2}")
@@ -545,14 +730,33 @@ class JobFormAutomation:
             
             # Navigate to job application page
             logger.info(f"🌐 Navigating to: {job_url}")
+            start_time = time.perf_counter()
             self.driver.get(job_url)
             
-            # Wait for page to load
-            time.sleep(5)  # Increased wait time
-            
-            # Debug form fields on the page
-            logger.info("🔍 Analyzing form fields on the page...")
-            visible_fields = self.debug_form_fields()
+            # Wait for the form to render
+            self.wait_for_page()
+            page_ready = time.perf_counter() - start_time
+            
+            # Fill from this board's form template if it still matches the page
+            template = self.templates.get(job_url) if self.templates is not None else None
+            self.template_fields = self.locate_template_fields(template) if template else None
+            self.template_snapshot = None
+            self.learned_locators = {}
+            self.absent_fields = set(template.get('absent', [])) if self.template_fields is not None else set()
+            
+            if self.template_fields is not None:
+                logger.info(f"📐 Filling from the board's form template ({len(self.template_fields)} fields)")
+                fields = None
+                visible_fields = []
+                total_visible_fields = template['visible_fields']  # the page's count, checked above
+            else:
+                if template:
+                    self.templates.invalidate(job_url)
+                # Debug form fields on the page; every field below is matched against this one snapshot
+                logger.info("🔍 Analyzing form fields on the page...")
+                fields = self.snapshot_form_fields()
+                visible_fields = self.debug_form_fields(fields)
+                total_visible_fields = len(visible_fields)
             
             # Track filled fields
             filled_fields = []
@@ -562,14 +766,14 @@ class JobFormAutomation:
             logger.info("📝 Filling personal information...")
             
             # First Name
-            first_name_field = self.find_form_field(self.field_mappings['first_name'])
+            first_name_field = self.locate_field('first_name', fields)
             if first_name_field:
                 first_name = self.get_field_value('first_name', resume_data)
                 if first_name and self.fill_text_field(first_name_field, first_name):
                     filled_fields.append('first_name')
             
             # Last Name
-            last_name_field = self.find_form_field(self.field_mappings['last_name'])
+            last_name_field = self.locate_field('last_name', fields)
             if last_name_field:
                 last_name = self.get_field_value('last_name', resume_data)
                 if last_name and self.fill_text_field(last_name_field, last_name):
@@ -577,28 +781,28 @@ class JobFormAutomation:
             
             # Full Name (if separate first/last name fields not found)
             if 'first_name' not in filled_fields and 'last_name' not in filled_fields:
-                full_name_field = self.find_form_field(self.field_mappings['full_name'])
+                full_name_field = self.locate_field('full_name', fields)
                 if full_name_field:
                     full_name = self.get_field_value('full_name', resume_data)
                     if full_name and self.fill_text_field(full_name_field, full_name):
                         filled_fields.append('full_name')
             
             # Email
-            email_field = self.find_form_field(self.field_mappings['email'])
+            email_field = self.locate_field('email', fields)
             if email_field:
                 email = self.get_field_value('email', resume_data)
                 if email and self.fill_text_field(email_field, email):
                     filled_fields.append('email')
             
             # Phone
-            phone_field = self.find_form_field(self.field_mappings['phone'])
+            phone_field = self.locate_field('phone', fields)
             if phone_field:
                 phone = self.get_field_value('phone', resume_data)
                 if phone and self.fill_text_field(phone_field, phone):
                     filled_fields.append('phone')
             
             # LinkedIn
-            linkedin_field = self.find_form_field(self.field_mappings['linkedin'])
+            linkedin_field = self.locate_field('linkedin', fields)
             if linkedin_field:
                 linkedin = self.get_field_value('linkedin', resume_data)
                 if linkedin and self.fill_text_field(linkedin_field, linkedin):
@@ -608,21 +812,21 @@ class JobFormAutomation:
             logger.info("📍 Filling location information...")
             
             # City
-            city_field = self.find_form_field(self.field_mappings['city'])
+            city_field = self.locate_field('city', fields)
             if city_field:
                 city = self.get_field_value('city', resume_data)
                 if city and self.fill_text_field(city_field, city):
                     filled_fields.append('city')
             
             # State
-            state_field = self.find_form_field(self.field_mappings['state'])
+            state_field = self.locate_field('state', fields)
             if state_field:
                 state = self.get_field_value('state', resume_data)
                 if state and self.fill_text_field(state_field, state):
                     filled_fields.append('state')
             
             # Country
-            country_field = self.find_form_field(self.field_mappings['country'])
+            country_field = self.locate_field('country', fields)
             if country_field:
                 country = self.get_field_value('country', resume_data)
                 if country and self.fill_text_field(country_field, country):
@@ -632,28 +836,28 @@ class JobFormAutomation:
             logger.info("🎓 Filling education information...")
             
             # School
-            school_field = self.find_form_field(self.field_mappings['school'])
+            school_field = self.locate_field('school', fields)
             if school_field:
                 school = self.get_field_value('school', resume_data)
                 if school and self.fill_text_field(school_field, school):
                     filled_fields.append('school')
             
             # Degree
-            degree_field = self.find_form_field(self.field_mappings['degree'])
+            degree_field = self.locate_field('degree', fields)
             if degree_field:
                 degree = self.get_field_value('degree', resume_data)
                 if degree and self.fill_text_field(degree_field, degree):
                     filled_fields.append('degree')
             
             # Discipline
-            discipline_field = self.find_form_field(self.field_mappings['discipline'])
+            discipline_field = self.locate_field('discipline', fields)
             if discipline_field:
                 discipline = self.get_field_value('discipline', resume_data)
                 if discipline and self.fill_text_field(discipline_field, discipline):
                     filled_fields.append('discipline')
             
             # Graduation Year
-            graduation_year_field = self.find_form_field(self.field_mappings['graduation_year'])
+            graduation_year_field = self.locate_field('graduation_year', fields)
             if graduation_year_field:
                 graduation_year = self.get_field_value('graduation_year', resume_data)
                 if graduation_year and self.fill_text_field(graduation_year_field, graduation_year):
@@ -662,7 +866,7 @@ class JobFormAutomation:
             # GPA Fields
             gpa_fields = ['gpa_undergraduate', 'gpa_graduate', 'gpa_doctorate']
             for gpa_field_type in gpa_fields:
-                gpa_field = self.find_form_field(self.field_mappings[gpa_field_type])
+                gpa_field = self.locate_field(gpa_field_type, fields)
                 if gpa_field:
                     gpa_value = self.get_field_value(gpa_field_type, resume_data)
                     if gpa_value and self.fill_text_field(gpa_field, gpa_value):
@@ -671,7 +875,7 @@ class JobFormAutomation:
             # Test Score Fields
             test_score_fields = ['sat_score', 'act_score', 'gre_score']
             for test_field_type in test_score_fields:
-                test_field = self.find_form_field(self.field_mappings[test_field_type])
+                test_field = self.locate_field(test_field_type, fields)
                 if test_field:
                     test_value = self.get_field_value(test_field_type, resume_data)
                     if test_value and self.fill_text_field(test_field, test_value):
@@ -681,28 +885,28 @@ class JobFormAutomation:
             logger.info("🔐 Filling work authorization information...")
             
             # Work Authorization
-            work_auth_field = self.find_form_field(self.field_mappings['work_authorization'])
+            work_auth_field = self.locate_field('work_authorization', fields)
             if work_auth_field:
                 work_auth = self.get_field_value('work_authorization', resume_data)
                 if work_auth and self.fill_text_field(work_auth_field, work_auth):
                     filled_fields.append('work_authorization')
             
             # Citizenship Status
-            citizenship_field = self.find_form_field(self.field_mappings['citizenship_status'])
+            citizenship_field = self.locate_field('citizenship_status', fields)
             if citizenship_field:
                 citizenship = self.get_field_value('citizenship_status', resume_data)
                 if citizenship and self.fill_text_field(citizenship_field, citizenship):
                     filled_fields.append('citizenship_status')
             
             # Security Clearance
-            clearance_field = self.find_form_field(self.field_mappings['security_clearance'])
+            clearance_field = self.locate_field('security_clearance', fields)
             if clearance_field:
                 clearance = self.get_field_value('security_clearance', resume_data)
                 if clearance and self.fill_text_field(clearance_field, clearance):
                     filled_fields.append('security_clearance')
             
             # Can Perform Essential Functions
-            essential_functions_field = self.find_form_field(self.field_mappings['can_perform_essential_functions'])
+            essential_functions_field = self.locate_field('can_perform_essential_functions', fields)
             if essential_functions_field:
                 essential_functions = self.get_field_value('can_perform_essential_functions', resume_data)
                 if essential_functions and self.fill_text_field(essential_functions_field, essential_functions):
@@ -711,14 +915,14 @@ class JobFormAutomation:
             # Fill how did you hear about this job (MEDIUM PRIORITY)
             logger.info("📢 Filling how did you hear about this job...")
             
-            how_heard_field = self.find_form_field(self.field_mappings['how_heard'])
+            how_heard_field = self.locate_field('how_heard', fields)
             if how_heard_field:
                 how_heard = self.get_field_value('how_heard', resume_data)
                 if how_heard and self.fill_text_field(how_heard_field, how_heard):
                     filled_fields.append('how_heard')
             
             # How heard other (if applicable)
-            how_heard_other_field = self.find_form_field(self.field_mappings['how_heard_other'])
+            how_heard_other_field = self.locate_field('how_heard_other', fields)
             if how_heard_other_field:
                 how_heard_other = self.get_field_value('how_heard_other', resume_data)
                 if how_heard_other and self.fill_text_field(how_heard_other_field, how_heard_other):
@@ -728,14 +932,14 @@ class JobFormAutomation:
             logger.info("💼 Filling professional information...")
             
             # Current Company
-            company_field = self.find_form_field(self.field_mappings['current_company'])
+            company_field = self.locate_field('current_company', fields)
             if company_field:
                 company = self.get_field_value('current_company', resume_data)
                 if company and self.fill_text_field(company_field, company):
                     filled_fields.append('current_company')
             
             # Current Title
-            title_field = self.find_form_field(self.field_mappings['current_title'])
+            title_field = self.locate_field('current_title', fields)
             if title_field:
                 title = self.get_field_value('current_title', resume_data)
                 if title and self.fill_text_field(title_field, title):
@@ -743,7 +947,7 @@ class JobFormAutomation:
             
             # Fill skills (LOW PRIORITY)
             logger.info("🔧 Filling skills...")
-            skills_field = self.find_form_field(self.field_mappings['skills'])
+            skills_field = self.locate_field('skills', fields)
             if skills_field:
                 skills = self.get_field_value('skills', resume_data)
                 if skills and self.fill_textarea_field(skills_field, skills):
@@ -751,7 +955,7 @@ class JobFormAutomation:
             
             # Fill cover letter (HIGH PRIORITY)
             logger.info("📄 Filling cover letter...")
-            cover_letter_field = self.find_form_field(self.field_mappings['cover_letter'])
+            cover_letter_field = self.locate_field('cover_letter', fields)
             if cover_letter_field and cover_letter:
                 if self.fill_textarea_field(cover_letter_field, cover_letter):
                     filled_fields.append('cover_letter')
@@ -766,10 +970,27 @@ class JobFormAutomation:
             logger.info("🔧 Making fields editable for manual interaction...")
             self.make_fields_editable()
             
+            # Remember where this board's fields are for its next application
+            if self.template_fields is not None:
+                form_template = 'used'
+                if self.template_snapshot is not None:
+                    visible_fields = self.debug_form_fields(self.template_snapshot)
+                if self.learned_locators:
+                    # Fields found on this posting that the template didn't have yet
+                    self.templates.learn(job_url, dict(template['fields'], **self.learned_locators),
+                                         total_visible_fields, self.absent_fields)
+            else:
+                form_template = None
+                if self.templates is not None and self.templates.learn(job_url, self.learned_locators,
+                                                                       total_visible_fields, self.absent_fields):
+                    form_template = 'learned'
+            self.template_fields = None
+            self.template_snapshot = None
+            
             # Summary
             logger.info(f"✅ Automation completed!")
             logger.info(f"   📝 Filled {len(filled_fields)} fields: {filled_fields}")
-            logger.info(f"   📊 Total visible fields on page: {len(visible_fields)}")
+            logger.info(f"   📊 Total visible fields on page: {total_visible_fields}")
             
             if len(filled_fields) == 0:
                 logger.warning("⚠️ No fields were filled! This might indicate:")
@@ -778,26 +999,32 @@ class JobFormAutomation:
                 logger.warning("   - Form is loaded dynamically")
                 logger.info("💡 You can manually fill the form and submit")
             
-            # Keep browser open for manual review and submission
-            if self.keep_open:
+            fill_time = time.perf_counter() - start_time - page_ready
+            
+            # Keep browser open for manual review and submission (pointless for a headless pooled session)
+            keep_open = self.keep_open and not (self.pool is not None and self.pool.headless)
+            if keep_open:
                 logger.info(f"⏳ Keeping browser open for {self.delay_after_fill} seconds for manual review...")
                 logger.info(f"   📝 You can now review and edit the filled form")
                 logger.info(f"   ✅ All fields should be editable for manual modification")
                 logger.info(f"   📤 You can submit the form manually")
                 logger.info(f"   🔄 Browser will close automatically after {self.delay_after_fill} seconds")
                 
-                try:
-                    time.sleep(self.delay_after_fill)
-                    logger.info(f"✅ Delay completed, closing browser...")
-                except KeyboardInterrupt:
-                    logger.info(f"⚠️ User interrupted, closing browser...")
-                finally:
-                    if self.driver:
-                        self.driver.quit()
-                        logger.info(f"✅ Browser closed")
+                if self.hold_in_background:
+                    self.hold_open()
+                else:
+                    try:
+                        time.sleep(self.delay_after_fill)
+                        logger.info(f"✅ Delay completed, closing browser...")
+                    except KeyboardInterrupt:
+                        logger.info(f"⚠️ User interrupted, closing browser...")
+                    finally:
+                        if self.driver:
+                            self.close_driver()
+                            logger.info(f"✅ Browser closed")
             else:
                 if self.driver:
-                    self.driver.quit()
+                    self.close_driver()
                     logger.info(f"✅ Browser closed immediately")
             
             return {
@@ -805,16 +1032,18 @@ class JobFormAutomation:
                 "filled_fields": filled_fields,
                 "errors": errors,
                 "url": job_url,
-                "browser_kept_open": self.keep_open,
+                "browser_kept_open": keep_open,
                 "delay_seconds": self.delay_after_fill,
-                "total_visible_fields": len(visible_fields),
+                "timings": {"page_ready": round(page_ready, 3), "fill": round(fill_time, 3)},
+                "total_visible_fields": total_visible_fields,
+                "form_template": form_template,
                 "field_detection_debug": visible_fields[:5]  # Include first 5 fields for debugging
             }
             
         except Exception as e:
             logger.error(f"❌ Automation failed: {e}")
             if self.driver:
-                self.driver.quit()
+                self.close_driver()
                 logger.info(f"✅ Browser closed due to error")
             return {
                 "success": False,
@@ -832,58 +1061,26 @@ class JobFormAutomation:
                 return {"success": False, "error": "Failed to setup WebDriver"}
             
             self.driver.get(job_url)
-            time.sleep(3)
+            self.wait_for_page()
             
-            # Find all form elements
+            # Find all form elements (visible inputs, then textareas, then selects)
+            fields = self.snapshot_form_fields()
             form_elements = []
             
-            # Input fields
-            inputs = self.driver.find_elements(By.TAG_NAME, "input")
-            for input_elem in inputs:
-                try:
-                    if input_elem.is_displayed():
-                        element_info = {
-                            "type": "input",
-                            "tag": input_elem.tag_name,
-                            "name": input_elem.get_attribute("name"),
-                            "id": input_elem.get_attribute("id"),
-                            "placeholder": input_elem.get_attribute("placeholder"),
-                            "type_attr": input_elem.get_attribute("type")
-                        }
-                        form_elements.append(element_info)
-                except:
-                    continue
-            
-            # Textarea fields
-            textareas = self.driver.find_elements(By.TAG_NAME, "textarea")
-            for textarea in textareas:
-                try:
-                    if textarea.is_displayed():
-                        element_info = {
-                            "type": "textarea",
-                            "tag": textarea.tag_name,
-                            "name": textarea.get_attribute("name"),
-                            "id": textarea.get_attribute("id"),
-                            "placeholder": textarea.get_attribute("placeholder")
-                        }
-                        form_elements.append(element_info)
-                except:
-                    continue
-            
-            # Select fields
-            selects = self.driver.find_elements(By.TAG_NAME, "select")
-            for select in selects:
-                try:
-                    if select.is_displayed():
-                        element_info = {
-                            "type": "select",
-                            "tag": select.tag_name,
-                            "name": select.get_attribute("name"),
-                            "id": select.get_attribute("id")
-                        }
-                        form_elements.append(element_info)
-                except:
+            for field in sorted(fields, key=lambda field: FIELD_TAGS.index(field['tag'])):
+                if not field['visible']:
                     continue
+                element_info = {
+                    "type": field['tag'],
+                    "tag": field['tag'],
+                    "name": field['name'],
+                    "id": field['id']
+                }
+                if field['tag'] != 'select':
+                    element_info["placeholder"] = field['placeholder']
+                if field['tag'] == 'input':
+                    element_info["type_attr"] = field['type']
+                form_elements.append(element_info)
             
             logger.info(f"✅ Found {len(form_elements)} form elements")
             
@@ -903,30 +1100,16 @@ class JobFormAutomation:
         
         finally:
             if self.driver:
-                self.driver.quit()
+                self.close_driver()
 
     def make_fields_editable(self):
         """Make form fields editable after automation fills them"""
         try:
-            # Remove readonly attributes from all input fields
-            readonly_inputs = self.driver.find_elements(By.CSS_SELECTOR, 'input[readonly]')
-            for input_elem in readonly_inputs:
-                self.driver.execute_script("arguments[0].removeAttribute('readonly');", input_elem)
-            
-            # Remove disabled attributes from all input fields
-            disabled_inputs = self.driver.find_elements(By.CSS_SELECTOR, 'input[disabled]')
-            for input_elem in disabled_inputs:
-                self.driver.execute_script("arguments[0].removeAttribute('disabled');", input_elem)
-            
-            # Remove readonly attributes from all textarea fields
-            readonly_textareas = self.driver.find_elements(By.CSS_SELECTOR, 'textarea[readonly]')
-            for textarea in readonly_textareas:
-                self.driver.execute_script("arguments[0].removeAttribute('readonly');", textarea)
-            
-            # Remove disabled attributes from all textarea fields
-            disabled_textareas = self.driver.find_elements(By.CSS_SELECTOR, 'textarea[disabled]')
-            for textarea in disabled_textareas:
-                self.driver.execute_script("arguments[0].removeAttribute('disabled');", textarea)
+            # Remove readonly and disabled attributes from all input and textarea fields
+            self.driver.execute_script("""
+                document.querySelectorAll('input[readonly], input[disabled], textarea[readonly], textarea[disabled]')
+                    .forEach(function (el) { el.removeAttribute('readonly'); el.removeAttribute('disabled'); });
+            """)
             
             logger.info("✅ Made form fields editable for manual interaction")
             return True
@@ -935,37 +1118,33 @@ class JobFormAutomation:
             logger.warning(f"⚠️ Could not make all fields editable: {e}")
             return False
     
-    def debug_form_fields(self):
-        """Debug and log all available form fields on the page"""
+    def debug_form_fields(self, fields: Optional[List[Dict[str, Any]]] = None):
+        """Debug and log all available form fields on the page (from a snapshot if one is given)"""
         try:
             logger.info("🔍 Debugging form fields on the page...")
             
-            # Find all form elements
-            all_inputs = self.driver.find_elements(By.TAG_NAME, "input")
-            all_textareas = self.driver.find_elements(By.TAG_NAME, "textarea")
-            all_selects = self.driver.find_elements(By.TAG_NAME, "select")
+            if fields is None:
+                fields = self.snapshot_form_fields()
+            counts = {tag: sum(1 for field in fields if field['tag'] == tag) for tag in FIELD_TAGS}
             
-            logger.info(f"📊 Found {len(all_inputs)} input fields, {len(all_textareas)} textareas, {len(all_selects)} selects")
+            logger.info(f"📊 Found {counts['input']} input fields, {counts['textarea']} textareas, {counts['select']} selects")
             
-            # Log details of visible form fields
+            # Log details of visible form fields: inputs, then textareas, then selects
             visible_fields = []
             
-            for elem in all_inputs + all_textareas + all_selects:
-                try:
-                    if elem.is_displayed():
-                        field_info = {
-                            "tag": elem.tag_name,
-                            "name": elem.get_attribute("name"),
-                            "id": elem.get_attribute("id"),
-                            "placeholder": elem.get_attribute("placeholder"),
-                            "type": elem.get_attribute("type"),
-                            "readonly": elem.get_attribute("readonly"),
-                            "disabled": elem.get_attribute("disabled"),
-                            "aria-label": elem.get_attribute("aria-label")
-                        }
-                        visible_fields.append(field_info)
-                except:
-                    continue
+            for field in sorted(fields, key=lambda field: FIELD_TAGS.index(field['tag'])):
+                if field['visible']:
+                    field_info = {
+                        "tag": field['tag'],
+                        "name": field['name'],
+                        "id": field['id'],
+                        "placeholder": field['placeholder'],
+                        "type": field['type'],
+                        "readonly": "true" if field['readonly'] else None,
+                        "disabled": "true" if field['disabled'] else None,
+                        "aria-label": field['aria-label']
+                    }
+                    visible_fields.append(field_info)
             
             logger.info(f"📋 Visible form fields ({len(visible_fields)}):")
             for i, field in enumerate(visible_fields[:10]):  # Show first 10
@@ -984,10 +1163,15 @@ class JobFormAutomation:
 form_automation = JobFormAutomation(keep_open=True, delay_after_fill=30)
 
 def close_browser():
-    """Manually close the browser if it's open"""
+    """Manually close the browser if it's open, and any browsers held open for review"""
+    with held_sessions_lock:
+        held_drivers = list(held_sessions)
+    closed = sum(end_hold(driver) for driver in held_drivers)
     if form_automation.driver:
         form_automation.driver.quit()
         form_automation.driver = None
+        closed += 1
+    if closed:
         logger.info("✅ Browser manually closed")
         return True
     return False 
\ No newline at end of file
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Form Template Cache
+Which form element filled which logical field, learned per ATS board, so later
+applications to the same board skip field discovery
+"""
+
+import logging
+import time
+from typing import Any, Dict, Iterable, Optional
+from urllib.parse import parse_qs, urlparse
+
+from scrapers.utils.sqlite_cache import SQLiteCache
+
+logger = logging.getLogger(__name__)
+
+FORM_TEMPLATE_FILE = 'form_template_cache.db'
+
+# Boards do redesign their forms; a template is relearned at least this often
+TEMPLATE_TTL = 7 * 24 * 3600
+
+# Bump when the stored template layout changes, so older templates are relearned
+TEMPLATE_VERSION = 2
+
+# Snapshot attributes a located element must still have before a template trusts it
+MATCHED_ATTRIBUTES = ('name', 'label', 'placeholder')
+
+def board_key(job_url: str) -> Optional[str]:
+    """'greenhouse:<board>' or 'lever:<board>' for a posting URL, None for other sites"""
+    parsed = urlparse(job_url)
+    host = parsed.netloc.lower()
+    segments = [segment for segment in parsed.path.split('/') if segment]
+
+    if host.endswith('greenhouse.io'):
+        ats = 'greenhouse'
+        if segments[:1] == ['embed']:
+            board = parse_qs(parsed.query).get('for', [None])[0]
+        else:
+            board = segments[0] if segments else None
+    elif host.endswith('lever.co'):
+        ats = 'lever'
+        board = segments[0] if segments else None
+    else:
+        return None
+
+    return f"{ats}:{board.lower()}" if board else None
+
+def field_locator(field: Dict[str, Any]) -> Optional[str]:
+    """CSS selector that finds a snapshot field again (by id, else by name), None if it has neither"""
+    for attribute in ('id', 'name'):
+        value = field.get(attribute)
+        if value:
+            escaped = value.replace('\\', '\\\\').replace('"', '\\"')
+            return f'{field["tag"]}[{attribute}="{escaped}"]'
+    return None
+
+def template_field(field: Dict[str, Any]) -> Optional[Dict[str, str]]:
+    """
+    Template entry for a matched snapshot field: its locator, the alias it matched and its
+    name, label and placeholder to check it against next time; None if it can't be located
+    """
+    locator = field_locator(field)
+    if not locator:
+        return None
+    entry = {'locator': locator, 'alias': field['alias']}
+    entry.update({attribute: field.get(attribute) or '' for attribute in MATCHED_ATTRIBUTES})
+    return entry
+
+class FormTemplateCache:
+    """
+    Form templates keyed by ATS board: {logical field: template entry (locator
+    and what the field was matched on)}, the logical fields the form didn't
+    have, and how many visible fields it had. A template is only a shortcut;
+    the caller checks its fields and field count against the page and falls
+    back to discovery (and relearns the template) when they no longer match.
+    """
+
+    def __init__(self, cache_file: str = FORM_TEMPLATE_FILE, ttl: float = TEMPLATE_TTL):
+        self.store = SQLiteCache(cache_file, table='form_templates', default_ttl=ttl)
+        self.stats = {'hits': 0, 'misses': 0, 'learned': 0, 'invalidated': 0}
+
+    def get(self, job_url: str) -> Optional[Dict[str, Any]]:
+        key = board_key(job_url)
+        template = self.store.get(key) if key else None
+        if template is not None and template.get('version') != TEMPLATE_VERSION:
+            template = None
+        self.stats['hits' if template is not None else 'misses'] += 1
+        return template
+
+    def learn(self, job_url: str, locators: Dict[str, Dict[str, str]], visible_fields: int, absent: Iterable[str] = ()) -> bool:
+        """Remember the template entries discovered on this board's form, and the fields it lacked; False for sites without boards"""
+        key = board_key(job_url)
+        if not key or not locators:
+            return False
+        self.store.set(key, {
+            'fields': locators,
+            'absent': sorted(set(absent) - set(locators)),
+            'visible_fields': visible_fields,
+            'learned_at': time.time(),
+            'version': TEMPLATE_VERSION
+        })
+        self.store.commit()
+        self.stats['learned'] += 1
+        logger.info(f"📐 Learned form template for {key} ({len(locators)} fields)")
+        return True
+
+    def invalidate(self, job_url: str):
+        key = board_key(job_url)
+        if key:
+            self.store.delete(key)
+            self.store.commit()
+            self.stats['invalidated'] += 1
+
+    def close(self):
+        self.store.close()
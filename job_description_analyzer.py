@@ -4,55 +4,91 @@ AI-Powered Job Description Analyzer
 Fetches job descriptions and uses AI to extract skills and requirements
 """
 
-import requests
+import hashlib
+import json
 import time
 import re
 from typing import Dict, Any, List, Optional
 import logging
-from bs4 import BeautifulSoup
 import groq
+from scrapers.utils.job_analyzer import extract_role_category, get_tailoring_experience_level
+from scrapers.utils.job_descriptions import description_hash as content_hash, job_description as scraped_description
+from scrapers.utils.page_fetcher import PageFetcher
+from scrapers.utils.sqlite_cache import SQLiteCache
 
 logger = logging.getLogger(__name__)
 
+ANALYSIS_CACHE_FILE = 'job_analysis_cache.db'
+
+# How long a fetched posting is trusted before its page is fetched again
+DESCRIPTION_TTL = 24 * 3600
+
+_page_fetcher = None
+
+def get_page_fetcher() -> PageFetcher:
+    """Fetcher shared by every analyzer, so they share its connection pool and page cache"""
+    global _page_fetcher
+    if _page_fetcher is None:
+        _page_fetcher = PageFetcher()
+    return _page_fetcher
+
+class JobAnalysisCache:
+    """
+    Job analyses keyed by posting URL + description content hash + resume skills,
+    persisted in SQLite so every pipeline stage and every run shares them.
+    The last fetched description is remembered per URL for DESCRIPTION_TTL,
+    so an unchanged posting needs neither a fetch nor an LLM call.
+    """
+    
+    def __init__(self, cache_file: str = ANALYSIS_CACHE_FILE, description_ttl: float = DESCRIPTION_TTL):
+        self.store = SQLiteCache(cache_file, table='job_analyses')
+        self.description_ttl = description_ttl
+        self.stats = {'hits': 0, 'misses': 0}
+    
+    def _analysis_key(self, job_url: str, description_hash: str, resume_skills: List[str]) -> str:
+        skills = sorted({skill.lower() for skill in resume_skills})
+        key_source = json.dumps([job_url, description_hash, skills])
+        return 'analysis:' + hashlib.sha256(key_source.encode('utf-8')).hexdigest()
+    
+    def get_description(self, job_url: str) -> Optional[str]:
+        """The description last fetched from this URL, while it's fresh"""
+        return self.store.get('description:' + job_url)
+    
+    def remember_description(self, job_url: str, job_description: str):
+        self.store.set('description:' + job_url, job_description, ttl=self.description_ttl)
+    
+    def get_analysis(self, job_url: str, description_hash: str, resume_skills: List[str]) -> Optional[Dict[str, Any]]:
+        analysis = self.store.get(self._analysis_key(job_url, description_hash, resume_skills))
+        self.stats['hits' if analysis is not None else 'misses'] += 1
+        return analysis
+    
+    def set_analysis(self, job_url: str, description_hash: str, resume_skills: List[str],
+                     analysis: Dict[str, Any]):
+        # Keyword fallbacks are only kept for a while, so an AI analysis replaces them later
+        ttl = self.description_ttl if analysis.get('analysis_source') != 'ai' else None
+        self.store.set(self._analysis_key(job_url, description_hash, resume_skills), analysis, ttl=ttl)
+        self.store.commit()
+
 class JobDescriptionAnalyzer:
-    def __init__(self, groq_api_key: Optional[str] = None):
+    def __init__(self, groq_api_key: Optional[str] = None, groq_client: Optional[Any] = None,
+                 fetcher: Optional[PageFetcher] = None):
         self.groq_api_key = groq_api_key
-        self.groq_client = None
-        if groq_api_key:
+        self.groq_client = groq_client
+        if groq_api_key and groq_client is None:
             self.groq_client = groq.Groq(api_key=groq_api_key)
+        self.fetcher = fetcher or get_page_fetcher()
         
     def fetch_job_description(self, job_url: str) -> str:
-        """Fetch job description from job URL"""
-        try:
-            logger.info(f"🌐 Fetching job description from: {job_url}")
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            response = requests.get(job_url, headers=headers, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
-            
-            # Extract text
-            text = soup.get_text()
-            
-            # Clean up text
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            text = ' '.join(chunk for chunk in chunks if chunk)
-            
+        """Fetch job description from job URL (pooled session, conditional GET against the page cache)"""
+        logger.info(f"🌐 Fetching job description from: {job_url}")
+        text = self.fetcher.fetch(job_url)
+        if text:
             logger.info(f"✅ Fetched {len(text)} characters of job description")
-            return text
-            
-        except Exception as e:
-            logger.error(f"❌ Error fetching job description: {e}")
-            return ""
+        return text
+    
+    def fetch_job_descriptions(self, job_urls: List[str]) -> Dict[str, str]:
+        """Fetch many job descriptions concurrently: {url: text}"""
+        return self.fetcher.fetch_many(job_urls)
     
     def analyze_job_description_ai(self, job_title: str, job_description: str, resume_skills: List[str]) -> Dict[str, Any]:
         """Use Groq AI to analyze job description and extract requirements"""
@@ -105,11 +141,11 @@ Focus on technical skills, programming languages, frameworks, tools, and technol
             
             # Try to extract JSON from the response
             try:
-                import json
                 # Find JSON in the response
                 json_match = re.search(r'\{.*\}', ai_response, re.DOTALL)
                 if json_match:
                     result = json.loads(json_match.group())
+                    result['analysis_source'] = 'ai'
                     logger.info(f"✅ Groq AI analysis completed: {len(result.get('technologies', []))} technologies found")
                     return result
                 else:
@@ -148,35 +184,14 @@ Focus on technical skills, programming languages, frameworks, tools, and technol
                 found_technologies.append(tech)
         
         # Determine experience level from title
-        title_lower = job_title.lower()
-        if any(word in title_lower for word in ['senior', 'lead', 'principal', 'staff']):
-            experience_level = 'senior'
-        elif any(word in title_lower for word in ['junior', 'entry', 'associate', 'graduate']):
-            experience_level = 'entry'
-        else:
-            experience_level = 'mid'
+        experience_level = get_tailoring_experience_level(job_title)
         
         # Find matching skills
         matching_skills = [skill for skill in resume_skills if skill.lower() in description_lower]
         missing_skills = [tech for tech in found_technologies if tech.lower() not in [skill.lower() for skill in resume_skills]]
         
         # Determine job category
-        if any(word in title_lower for word in ['engineer', 'developer', 'programmer']):
-            job_category = 'engineering'
-        elif any(word in title_lower for word in ['data', 'ml', 'ai', 'analyst', 'scientist']):
-            job_category = 'data_science'
-        elif any(word in title_lower for word in ['product', 'program']):
-            job_category = 'product'
-        elif any(word in title_lower for word in ['design', 'ux', 'ui']):
-            job_category = 'design'
-        elif any(word in title_lower for word in ['sales', 'business development']):
-            job_category = 'sales'
-        elif any(word in title_lower for word in ['marketing', 'growth']):
-            job_category = 'marketing'
-        elif any(word in title_lower for word in ['operations', 'strategy']):
-            job_category = 'operations'
-        else:
-            job_category = 'other'
+        job_category = extract_role_category(job_title)
         
         result = {
             'technologies': found_technologies,
@@ -186,16 +201,26 @@ Focus on technical skills, programming languages, frameworks, tools, and technol
             'requirements': [],  # Would need more complex parsing
             'matching_skills': matching_skills,
             'missing_skills': missing_skills,
-            'job_category': job_category
+            'job_category': job_category,
+            'analysis_source': 'fallback'
         }
         
         logger.info(f"✅ Fallback analysis completed: {len(found_technologies)} technologies found")
         return result
 
-def analyze_job_with_ai(job_data: Dict[str, Any], resume_skills: List[str], groq_api_key: Optional[str] = None) -> Dict[str, Any]:
-    """Analyze a job using Groq AI-powered description analysis"""
+def analyze_job_with_ai(job_data: Dict[str, Any], resume_skills: List[str], groq_api_key: Optional[str] = None,
+                        cache: Optional[JobAnalysisCache] = None,
+                        analyzer: Optional[JobDescriptionAnalyzer] = None) -> Dict[str, Any]:
+    """
+    Analyze a job using Groq AI-powered description analysis
+    
+    With a cache, an analysis is reused while the posting's description is
+    unchanged. A description already on the job record (plain, or compressed
+    by the spiders' description stage), or the last one fetched from its URL
+    within DESCRIPTION_TTL, is used instead of a fetch.
+    """
     
-    analyzer = JobDescriptionAnalyzer(groq_api_key)
+    analyzer = analyzer or JobDescriptionAnalyzer(groq_api_key)
     
     job_url = job_data.get('opening_link', '')
     job_title = job_data.get('opening_title', '')
@@ -204,16 +229,33 @@ def analyze_job_with_ai(job_data: Dict[str, Any], resume_skills: List[str], groq
         logger.warning("⚠️ No job URL provided, using title-only analysis")
         return analyzer.analyze_job_description_fallback(job_title, "", resume_skills)
     
-    # Fetch job description
-    job_description = analyzer.fetch_job_description(job_url)
+    job_description = scraped_description(job_data) or (cache.get_description(job_url) if cache else None)
     
     if not job_description:
-        logger.warning("⚠️ Could not fetch job description, using title-only analysis")
-        return analyzer.analyze_job_description_fallback(job_title, "", resume_skills)
+        # Fetch job description
+        job_description = analyzer.fetch_job_description(job_url)
+        
+        if not job_description:
+            logger.warning("⚠️ Could not fetch job description, using title-only analysis")
+            return analyzer.analyze_job_description_fallback(job_title, "", resume_skills)
+        
+        if cache:
+            cache.remember_description(job_url, job_description)
+    
+    description_hash = content_hash(job_description)
+    if cache:
+        # Same posting text and skills as an earlier analysis
+        analysis = cache.get_analysis(job_url, description_hash, resume_skills)
+        if analysis is not None:
+            logger.info(f"♻️ Using cached analysis for: {job_title}")
+            return analysis
     
     # Analyze with AI
     analysis = analyzer.analyze_job_description_ai(job_title, job_description, resume_skills)
     
+    if cache:
+        cache.set_analysis(job_url, description_hash, resume_skills, analysis)
+    
     return analysis
 
 if __name__ == "__main__":
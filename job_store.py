@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Job Store
+Scraped jobs held in memory with id indexes, shared by the web app and the
+application system. scraped_data.json is only re-read when it changes on disk
+"""
+
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from scrapers.utils.date_display import to_epoch
+
+logger = logging.getLogger(__name__)
+
+SCRAPED_DATA_FILE = 'scraped_data.json'
+
+def unique_job_id(job: Dict[str, Any]) -> str:
+    """Job id made unique across companies, as sent by the job list's checkboxes"""
+    return f"{job.get('id')}_{job.get('company_name', '')}"
+
+class JobStore:
+    """
+    Jobs from scraped_data.json with lookups by id and by id + company, and
+    posted_date_epoch set on every job that has a scraped posted_date.
+
+    Every read first compares the file's mtime and size with the loaded copy
+    (one stat call) and reloads only if it changed. A file that can't be
+    parsed, e.g. while a spider is rewriting it, leaves the last good copy in
+    place. The loaded lists and indexes are never mutated, only replaced, so
+    readers use them without holding the lock.
+    """
+
+    def __init__(self, data_file: str = SCRAPED_DATA_FILE):
+        self.data_file = data_file
+        self.lock = threading.Lock()
+        self.signature = None  # (mtime_ns, size) of the loaded file
+        self.version = 0  # bumped on every reload
+        self.data = ([], [], {}, {})  # (records, jobs, by_id, by_unique_id), swapped as one
+        self.stats = {'loads': 0, 'load_errors': 0}
+
+    def _refresh(self):
+        try:
+            stat = os.stat(self.data_file)
+            signature = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            signature = None
+        if signature == self.signature:
+            return
+
+        with self.lock:
+            if signature == self.signature:
+                return  # another thread reloaded it meanwhile
+            if signature is None:
+                records = []
+            else:
+                try:
+                    with open(self.data_file, 'r', encoding='utf-8') as f:
+                        records = json.load(f)
+                except (OSError, ValueError) as e:
+                    logger.warning(f"⚠️ Could not read {self.data_file}, keeping the last loaded copy: {e}")
+                    self.stats['load_errors'] += 1
+                    self.signature = signature  # retried once the writer changes the file again
+                    return
+
+            jobs = [job for job in records if 'opening_title' in job]
+            by_id = {}
+            by_unique_id = {}
+            for job in jobs:
+                # Scraped dates are parsed here, once per load, not on every page view
+                if job.get('posted_date'):
+                    job['posted_date_epoch'] = to_epoch(job['posted_date'])
+                # Same precedence as the old per-request mapping: first row per id, last per id + company
+                by_id.setdefault(job.get('id'), job)
+                by_unique_id[unique_job_id(job)] = job
+
+            self.data = (records, jobs, by_id, by_unique_id)
+            self.signature = signature
+            self.version += 1
+            self.stats['loads'] += 1
+            logger.info(f"📂 Loaded {len(jobs)} jobs from {self.data_file}")
+
+    def all_records(self) -> List[Dict[str, Any]]:
+        """Every row of the data file, including non-job rows (e.g. departments)"""
+        self._refresh()
+        return self.data[0]
+
+    def jobs(self) -> List[Dict[str, Any]]:
+        """Job rows (those with an opening_title)"""
+        self._refresh()
+        return self.data[1]
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Job for an id or an "<id>_<company>" unique id"""
+        self._refresh()
+        _, _, by_id, by_unique_id = self.data
+        return by_unique_id.get(job_id) if '_' in job_id else by_id.get(job_id)
+
+    def find(self, job_ids: Iterable[str]) -> List[Dict[str, Any]]:
+        """Jobs for the ids that exist, in the order given"""
+        self._refresh()
+        _, _, by_id, by_unique_id = self.data
+        jobs = []
+        for job_id in job_ids:
+            job = by_unique_id.get(job_id) if '_' in job_id else by_id.get(job_id)
+            if job is not None:
+                jobs.append(job)
+        return jobs
+
+_job_store = None
+_job_store_lock = threading.Lock()
+
+def get_job_store() -> JobStore:
+    """Store shared by the web app and the application system"""
+    global _job_store
+    with _job_store_lock:
+        if _job_store is None:
+            _job_store = JobStore()
+        return _job_store
@@ -39,6 +39,8 @@ class GreenhouseJobsOutlineItem(LevergreenScrapyItem):
     posted_date = scrapy.Field(output_processor=TakeFirst())
     posted_date_confidence = scrapy.Field(output_processor=TakeFirst())
     posted_date_source = scrapy.Field(output_processor=TakeFirst())
+    description_hash = scrapy.Field(output_processor=TakeFirst())
+    description_compressed = scrapy.Field(output_processor=TakeFirst())
 
 
 class LeverJobsOutlineItem(LevergreenScrapyItem):
@@ -51,6 +53,8 @@ class LeverJobsOutlineItem(LevergreenScrapyItem):
     opening_link = scrapy.Field(output_processor=TakeFirst())
     location = scrapy.Field(output_processor=TakeFirst())
     company_name = scrapy.Field(output_processor=TakeFirst())
+    description_hash = scrapy.Field(output_processor=TakeFirst())
+    description_compressed = scrapy.Field(output_processor=TakeFirst())
 
 
 class GreenhouseJobDepartmentsItem(LevergreenScrapyItem):
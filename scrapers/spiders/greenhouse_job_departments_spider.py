@@ -5,7 +5,7 @@ import time
 import boto3
 import os
 from dotenv import load_dotenv
-from scrapers.items import GreenhouseJobDepartmentsItem
+from scrapers.items import GreenhouseJobDepartmentsItem, get_last_word
 from scrapers.utils import general as util
 from scrapy.loader import ItemLoader
 from scrapy.selector import Selector
@@ -27,6 +27,8 @@ class GreenhouseJobDepartmentsSpider(scrapy.Spider):
         self.careers_page_url = kwargs.pop("careers_page_url")
         self.run_hash = kwargs.pop("run_hash")
         self.url_id = kwargs.pop("url_id", 0)
+        # Legacy ItemLoader + re-parsed Selector path, kept for parity checks and benchmarks
+        self.use_item_loader = int(kwargs.pop("use_item_loader", 0))
         self.html_source = (
             self.careers_page_url[:-1]
             if self.careers_page_url[-1] == "/"
@@ -140,6 +142,54 @@ class GreenhouseJobDepartmentsSpider(scrapy.Spider):
             self.export_html(response.text)
             return response.text
 
+    def get_item_metadata(self):
+        # Fields shared by every row of a page, computed once per page instead of per row
+        return {
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "source": self.html_source,
+            "company_name": self.company_name,
+            "run_hash": self.run_hash,
+            "raw_html_file_location": self.full_s3_html_path,
+            "existing_html_used": self.existing_html_used,
+        }
+
+    def build_item(self, item, values):
+        # Same result as ItemLoader with TakeFirst: fields without a usable value are left unset
+        for field, value in values.items():
+            if value is not None and value != "":
+                item[field] = value
+        return item
+
+    def build_job_boards_prefix_item(self, i, department, metadata):
+        department_name = department.get()
+        return self.build_item(
+            GreenhouseJobDepartmentsItem(),
+            {
+                "department_id": self.company_name + "_" + department_name,
+                "department_name": department_name,
+                "department_category": "level-0",
+                "id": self.determine_row_id(i),
+                **metadata,
+            },
+        )
+
+    def build_department_item(self, i, department, metadata):
+        heading = department.xpath("./*[starts-with(name(), 'h')]")
+        section_class = department.xpath("@class").get()
+        return self.build_item(
+            GreenhouseJobDepartmentsItem(),
+            {
+                "department_id": heading.xpath("@id").get(),
+                "department_name": heading.xpath("text()").get(),
+                "department_category": get_last_word(section_class)
+                if section_class
+                else None,
+                "id": self.determine_row_id(i),
+                **metadata,
+            },
+        )
+
     # Greenhouse has exposed a new URL with different features for scraping for some companies
     def parse_job_boards_prefix(self, i, department):
         il = ItemLoader(
@@ -167,13 +217,16 @@ class GreenhouseJobDepartmentsSpider(scrapy.Spider):
     def parse(self, response):
         response_html = self.finalize_response(response)
         selector = Selector(text=response_html, type="html")
+        metadata = self.get_item_metadata()
         if self.careers_page_url.split(".")[0].split("/")[-1] == "job-boards":
             all_departments = selector.xpath(
                 "//div[(@class='job-posts')]/*[starts-with(name(), 'h')]/text()"
             )
             for i, department in enumerate(all_departments):
-                il = self.parse_job_boards_prefix(i, department)
-                yield il.load_item()
+                if self.use_item_loader:
+                    yield self.parse_job_boards_prefix(i, department).load_item()
+                else:
+                    yield self.build_job_boards_prefix_item(i, department, metadata)
             if len(all_departments) != 0:
                 self.page_number += 1
                 yield response.follow(
@@ -210,6 +263,10 @@ class GreenhouseJobDepartmentsSpider(scrapy.Spider):
             all_departments = selector.xpath('//section[contains(@class, "level")]')
 
             for i, department in enumerate(all_departments):
+                if not self.use_item_loader:
+                    yield self.build_department_item(i, department, metadata)
+                    continue
+
                 il = ItemLoader(
                     item=GreenhouseJobDepartmentsItem(),
                     selector=Selector(text=department.get(), type="html"),
@@ -9,6 +9,7 @@ from dotenv import load_dotenv
 from scrapers.items import GreenhouseJobsOutlineItem
 from scrapers.utils import general as util
 from scrapers.utils.job_analyzer import analyze_job_title
+from scrapers.utils.job_descriptions import DESCRIPTION_STORE_FILE, DescriptionStore
 from scrapers.spiders.greenhouse_job_departments_spider import (
     GreenhouseJobDepartmentsSpider,
 )
@@ -29,9 +30,68 @@ class GreenhouseJobsOutlineSpider(GreenhouseJobDepartmentsSpider):
         super().__init__(*args, **kwargs)
         self.spider_id = kwargs.pop("spider_id", 2)
         self.use_existing_html = kwargs.pop("use_existing_html", 1)  # from departments
+        # Follow each opening to its posting page and store the description with the item
+        self.fetch_descriptions = int(kwargs.pop("fetch_descriptions", 0))
+        self.description_store_file = kwargs.pop("description_store_file", DESCRIPTION_STORE_FILE)
+        self._description_store = None
         self.logger.info(f"Initialized Spider, {self.html_source}")
         self.page_number = 1
 
+    @property
+    def description_store(self):
+        if self._description_store is None:
+            self._description_store = DescriptionStore(self.description_store_file)
+        return self._description_store
+
+    def follow_description(self, response, item):
+        # The item itself, or a request for its posting page that yields the item with its description.
+        # Posting pages go through the same downloader (and its concurrency limits) as the boards,
+        # at a lower priority so board pages are never stuck behind them
+        opening_link = item.get("opening_link")
+        if not self.fetch_descriptions or not opening_link:
+            return item
+        return response.follow(
+            opening_link,
+            headers=self.description_store.validators(opening_link),  # unchanged postings come back as a 304
+            callback=self.parse_description,
+            errback=self.description_failed,
+            cb_kwargs={"item": item},
+            meta={"handle_httpstatus_list": [304]},
+            priority=-1,
+            dont_filter=True,  # embedded boards link to the company's own domain
+        )
+
+    def parse_description(self, response, item):
+        if response.status == 304:
+            description = self.description_store.not_modified(item["opening_link"])
+            if description is None:
+                # Stored entry gone since the request was made; ask for the full page
+                yield response.request.replace(headers={}, meta={})
+                return
+            item.update(description)
+            yield item
+            return
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        item.update(self.description_store.describe(
+            item["opening_link"],
+            response.body,
+            etag=etag.decode("latin-1") if etag else None,
+            last_modified=last_modified.decode("latin-1") if last_modified else None,
+        ))
+        yield item
+
+    def description_failed(self, failure):
+        # Keep the posting, just without a description
+        self.logger.warning(f"Could not fetch posting page {failure.request.url}: {failure.value}")
+        yield failure.request.cb_kwargs["item"]
+
+    def closed(self, reason):
+        if self._description_store is not None:
+            self.logger.info(f"Descriptions: {self._description_store.stats}")
+            self._description_store.close()
+
     def get_department_ids(self, job_post):
         stratified_selector = Selector(text=job_post.get(), type="html")
 
@@ -45,6 +105,58 @@ class GreenhouseJobsOutlineSpider(GreenhouseJobDepartmentsSpider):
 
         return department_ids, job_openings
 
+    def get_department_nodes(self, job_post):
+        primary_department = job_post.xpath(
+            ".//*[starts-with(name(), 'h')]/text()"
+        ).get()
+
+        department_ids = self.company_name + "_" + primary_department
+
+        job_openings = job_post.xpath(".//td[@class='cell']")
+
+        return department_ids, job_openings
+
+    def build_job_boards_prefix_item(self, i, j, department_ids, opening, metadata):
+        return self.build_item(
+            GreenhouseJobsOutlineItem(),
+            {
+                "department_ids": department_ids,
+                "opening_link": opening.xpath(".//a/@href").get(),
+                "opening_title": opening.xpath(
+                    ".//p[contains(@class, 'body--medium')]/text()"
+                ).get(),
+                "location": opening.xpath(
+                    ".//p[contains(@class, 'body--metadata')]/text()"
+                ).get(),
+                "id": self.determine_row_id(
+                    int(str(i * 100) + str(j * 100) + str(self.page_number))
+                ),
+                **metadata,
+            },
+        )
+
+    def build_opening_item(self, i, opening, metadata):
+        job_title = opening.xpath(".//a/text()").get()
+        if job_title:
+            analysis = analyze_job_title(job_title)
+        else:
+            analysis = {"experience_level": "unknown", "role_category": "other"}
+
+        return self.build_item(
+            GreenhouseJobsOutlineItem(),
+            {
+                "department_ids": opening.xpath("@department_id").get(),
+                "office_ids": opening.xpath("@office_id").get(),
+                "opening_link": opening.xpath(".//a/@href").get(),
+                "opening_title": job_title,
+                "location": opening.xpath(".//span/text()").get(),
+                "id": self.determine_row_id(i),
+                **metadata,
+                "experience_level": analysis["experience_level"],
+                "role_category": analysis["role_category"],
+            },
+        )
+
     def parse_job_boards_prefix(self, i, j, department_ids, opening):
         il = ItemLoader(
             item=GreenhouseJobsOutlineItem(),
@@ -79,17 +191,25 @@ class GreenhouseJobsOutlineSpider(GreenhouseJobDepartmentsSpider):
     def parse(self, response):
         response_html = self.finalize_response(response)
         selector = Selector(text=response_html, type="html")
+        metadata = self.get_item_metadata()
         if self.careers_page_url.split(".")[0].split("/")[-1] == "job-boards":
             job_posts = selector.xpath("//div[(@class='job-posts')]")
             for i, job_post in enumerate(job_posts):
-                department_ids, job_openings = self.get_department_ids(job_post)
+                if self.use_item_loader:
+                    department_ids, job_openings = self.get_department_ids(job_post)
+                else:
+                    department_ids, job_openings = self.get_department_nodes(job_post)
                 for j, opening in enumerate(job_openings):
-                    il = self.parse_job_boards_prefix(i, j, department_ids, opening)
-                    print(
-                        il.load_item().get("opening_title"),
-                        il.load_item().get("id"),
-                    )
-                    yield il.load_item()
+                    if self.use_item_loader:
+                        il = self.parse_job_boards_prefix(i, j, department_ids, opening)
+                        yield self.follow_description(response, il.load_item())
+                    else:
+                        yield self.follow_description(
+                            response,
+                            self.build_job_boards_prefix_item(
+                                i, j, department_ids, opening, metadata
+                            ),
+                        )
             if len(job_posts) != 0:
                 self.page_number += 1
                 yield response.follow(
@@ -101,6 +221,12 @@ class GreenhouseJobsOutlineSpider(GreenhouseJobDepartmentsSpider):
             job_openings = selector.xpath('//div[@class="opening"]')
 
             for i, opening in enumerate(job_openings):
+                if not self.use_item_loader:
+                    yield self.follow_description(
+                        response, self.build_opening_item(i, opening, metadata)
+                    )
+                    continue
+
                 il = ItemLoader(
                     item=GreenhouseJobsOutlineItem(),
                     selector=Selector(text=opening.get(), type="html"),
@@ -133,4 +259,4 @@ class GreenhouseJobsOutlineSpider(GreenhouseJobDepartmentsSpider):
                     il.add_value("experience_level", "unknown")
                     il.add_value("role_category", "other")
 
-                yield il.load_item()
+                yield self.follow_description(response, il.load_item())
@@ -9,7 +9,7 @@ from dotenv import load_dotenv
 from scrapers.spiders.greenhouse_jobs_outline_spider import (
     GreenhouseJobsOutlineSpider,
 )
-from scrapers.items import LeverJobsOutlineItem
+from scrapers.items import LeverJobsOutlineItem, get_first_word
 from scrapers.utils import general as util
 from scrapy.loader import ItemLoader
 from scrapy.selector import Selector
@@ -29,22 +29,48 @@ class LeverJobsOutlineSpider(GreenhouseJobsOutlineSpider):
         self.spider_id = kwargs.pop("spider_id", 3)
         self.logger.info(f"Initialized Spider, {self.html_source}")
 
+    def build_posting_item(self, i, j, departments, opening, metadata):
+        workplace_type = opening.xpath(
+            ".//span[contains(@class, 'workplaceType')]/text()"
+        ).get()
+        return self.build_item(
+            LeverJobsOutlineItem(),
+            {
+                "department_names": departments,
+                "opening_link": opening.xpath("@href").get(),
+                "opening_title": opening.xpath(".//h5/text()").get(),
+                "workplace_type": get_first_word(workplace_type)
+                if workplace_type is not None
+                else None,
+                "location": opening.xpath(
+                    ".//span[contains(@class, 'location')]/text()"
+                ).get(),
+                "id": self.determine_row_id(i * 1000 + j),
+                **metadata,
+            },
+        )
+
     def parse(self, response):
         response_html = self.finalize_response(response)
         selector = Selector(text=response_html, type="html")
+        metadata = self.get_item_metadata()
         postings_groups = selector.xpath('//div[@class="postings-group"]')
         # departments = selector.xpath("//div[contains(@class, 'large-category')]/text()")
         # job_openings = selector.xpath('//a[@class="posting-title"]')
 
         for i, postings_group in enumerate(postings_groups):
-            stratified_selector = Selector(text=postings_group.get(), type="html")
+            if self.use_item_loader:
+                stratified_selector = Selector(text=postings_group.get(), type="html")
+            else:
+                # Relative XPaths below work on the group node itself, no re-parse needed
+                stratified_selector = postings_group
 
             potential_primary_department = stratified_selector.xpath(
-                f"//div[contains(@class, 'large-category-header')]/text()"
+                f".//div[contains(@class, 'large-category-header')]/text()"
             )
 
             label_department = stratified_selector.xpath(
-                f"//div[contains(@class, 'large-category-label')]/text()"
+                f".//div[contains(@class, 'large-category-label')]/text()"
             )
 
             if i == 0:
@@ -61,9 +87,16 @@ class LeverJobsOutlineSpider(GreenhouseJobsOutlineSpider):
             else:
                 departments = label_department.get()
 
-            job_openings = stratified_selector.xpath("//a[@class='posting-title']")
+            job_openings = stratified_selector.xpath(".//a[@class='posting-title']")
 
             for j, opening in enumerate(job_openings):
+                if not self.use_item_loader:
+                    yield self.follow_description(
+                        response,
+                        self.build_posting_item(i, j, departments, opening, metadata),
+                    )
+                    continue
+
                 il = ItemLoader(
                     item=LeverJobsOutlineItem(),
                     selector=Selector(text=opening.get(), type="html"),
@@ -90,5 +123,5 @@ class LeverJobsOutlineSpider(GreenhouseJobsOutlineSpider):
                 il.add_value("raw_html_file_location", self.full_s3_html_path)
                 il.add_value("existing_html_used", self.existing_html_used)
 
-                yield il.load_item()
+                yield self.follow_description(response, il.load_item())
             # self.logger.info(f"{dep_xpath} Department here")
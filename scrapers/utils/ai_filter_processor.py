@@ -1,37 +1,430 @@
+import asyncio
+import hashlib
 import json
 import os
-from typing import Dict, List, Optional, Any
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Dict, List, Optional, Any
 from groq import Groq
+from .cache_utils import TTLLRUCache
+from .circuit_breaker import CircuitBreaker, CircuitOpenError
+from .job_analyzer import extract_experience_level, extract_role_category
+from .rate_limit import AsyncTokenBucket
+from .sqlite_cache import SQLiteCache
+
+# Bump a method's version whenever its prompt changes, so old cached answers aren't reused
+PROMPT_VERSIONS = {
+    'parse_location': 1,
+    'extract_experience': 1,
+    'categorize_role': 1,
+    'normalize_company': 1
+}
+
+EXPERIENCE_LEVELS = ['entry', 'mid', 'senior', 'staff', 'director', 'unknown']
+ROLE_CATEGORIES = ['engineering', 'data_science', 'product', 'design', 'sales',
+                   'marketing', 'operations', 'hr', 'finance', 'legal', 'other']
+REMOTE_LOCATIONS = ['n/a', 'remote', 'anywhere']
+
+# Distinct inputs packed into one batch request
+DEFAULT_BATCH_SIZE = 20
+
+# Groq free tier limits for llama3-8b-8192
+DEFAULT_REQUESTS_PER_MINUTE = 30
+DEFAULT_TOKENS_PER_MINUTE = 30000
+DEFAULT_MAX_CONCURRENCY = 8
+ASYNC_MAX_RETRIES = 5
+
+# Rule-based classification uses job_analyzer's scale; map it onto the AI categories
+RULE_EXPERIENCE_LEVELS = {'intern': 'entry', 'expert': 'director'}
+RULE_ROLE_CATEGORIES = {'research': 'data_science', 'support': 'other', 'management': 'other'}
+
+US_STATES = {
+    'al': 'alabama', 'ak': 'alaska', 'az': 'arizona', 'ar': 'arkansas', 'ca': 'california',
+    'co': 'colorado', 'ct': 'connecticut', 'de': 'delaware', 'dc': 'district of columbia',
+    'fl': 'florida', 'ga': 'georgia', 'hi': 'hawaii', 'id': 'idaho', 'il': 'illinois',
+    'in': 'indiana', 'ia': 'iowa', 'ks': 'kansas', 'ky': 'kentucky', 'la': 'louisiana',
+    'me': 'maine', 'md': 'maryland', 'ma': 'massachusetts', 'mi': 'michigan', 'mn': 'minnesota',
+    'ms': 'mississippi', 'mo': 'missouri', 'mt': 'montana', 'ne': 'nebraska', 'nv': 'nevada',
+    'nh': 'new hampshire', 'nj': 'new jersey', 'nm': 'new mexico', 'ny': 'new york',
+    'nc': 'north carolina', 'nd': 'north dakota', 'oh': 'ohio', 'ok': 'oklahoma', 'or': 'oregon',
+    'pa': 'pennsylvania', 'ri': 'rhode island', 'sc': 'south carolina', 'sd': 'south dakota',
+    'tn': 'tennessee', 'tx': 'texas', 'ut': 'utah', 'vt': 'vermont', 'va': 'virginia',
+    'wa': 'washington', 'wv': 'west virginia', 'wi': 'wisconsin', 'wy': 'wyoming'
+}
+US_STATE_NAMES = set(US_STATES.values())
+
+# Location words that identify a country when there's no US state
+COUNTRY_PATTERNS = {
+    'united states': ['united states', 'usa', 'u.s.'],
+    'canada': ['canada', 'toronto', 'vancouver', 'montreal'],
+    'united kingdom': ['united kingdom', 'uk', 'england', 'london'],
+    'ireland': ['ireland', 'dublin'],
+    'france': ['france', 'paris'],
+    'germany': ['germany', 'berlin', 'munich'],
+    'mexico': ['mexico'],
+    'singapore': ['singapore'],
+    'japan': ['japan', 'tokyo'],
+    'india': ['india', 'bangalore', 'bengaluru']
+}
+
+COMPANY_SUFFIXES = {'inc', 'llc', 'pbc', 'corp', 'corporation', 'co', 'ltd', 'limited', 'plc', 'gmbh'}
+
+# Which batch request answers each single-item method
+BATCH_KINDS = {
+    'parse_location': 'location',
+    'extract_experience': 'title',
+    'categorize_role': 'title',
+    'normalize_company': 'company'
+}
+
+def normalize_cache_input(*parts: str) -> str:
+    """Lowercase and collapse whitespace so repeated strings share a cache entry"""
+    return "\x1f".join(" ".join((part or "").lower().split()) for part in parts)
+
+def extract_json_text(result: str, pattern: str) -> str:
+    """Strip markdown fences and surrounding text from a JSON answer"""
+    # Clean up the response - remove any markdown formatting
+    if result.startswith('```json'):
+        result = result[7:]
+    if result.startswith('```'):
+        result = result[3:]
+    if result.endswith('```'):
+        result = result[:-3]
+    
+    # Remove any quotes around the entire response
+    result = result.strip('"')
+    
+    # Try to extract JSON from the response (in case there's text before/after)
+    json_match = re.search(pattern, result, re.DOTALL)
+    if json_match:
+        result = json_match.group()
+    return result
+
+def parse_location_rules(location_str: str) -> Dict[str, Any]:
+    """Rule-based parse_location for when the AI backend is unavailable"""
+    states, cities = [], []
+    for part in re.split(r'[|;/]', location_str):
+        pieces = [piece.strip().lower() for piece in part.split(',') if piece.strip()]
+        if len(pieces) >= 2:
+            state = US_STATES.get(pieces[1], pieces[1])
+            if state in US_STATE_NAMES:
+                if state not in states:
+                    states.append(state)
+                if pieces[0] not in cities:
+                    cities.append(pieces[0])
+    
+    location_lower = location_str.lower()
+    is_remote = 'remote' in location_lower
+    if states:
+        country = 'united states'
+    else:
+        words = set(re.findall(r'[a-z.]+', location_lower))
+        country = next((
+            country for country, patterns in COUNTRY_PATTERNS.items()
+            if any((pattern in words) if ' ' not in pattern else (pattern in location_lower) for pattern in patterns)
+        ), 'remote' if is_remote else 'other')
+    
+    return {
+        'country': country,
+        'states': states,
+        'cities': cities,
+        'is_remote': is_remote,
+        'raw_location': location_str
+    }
+
+def normalize_company_rules(company: str) -> str:
+    """Rule-based normalize_company: drop legal suffixes like Inc., LLC, PBC"""
+    words = company.replace(',', ' ').split()
+    while len(words) > 1 and words[-1].lower().strip('.') in COMPANY_SUFFIXES:
+        words.pop()
+    return ' '.join(words) or company
+
+def is_rate_limit_error(error: Exception) -> bool:
+    return "429" in str(error) or "rate_limit" in str(error).lower()
+
+def estimate_tokens(prompt: str, max_tokens: int) -> int:
+    """Rough token cost of a request (about 4 characters per prompt token) for TPM pacing"""
+    return len(prompt) // 4 + max_tokens
+
+def is_valid_location_info(location_info: Any) -> bool:
+    """Whether a parsed location has the fields the filters rely on"""
+    return (
+        isinstance(location_info, dict)
+        and isinstance(location_info.get('country'), str)
+        and isinstance(location_info.get('states'), list)
+        and isinstance(location_info.get('cities'), list)
+        and isinstance(location_info.get('is_remote'), bool)
+    )
+
+class CacheMissError(LookupError):
+    """Raised instead of calling the API when only cached answers may be used"""
 
 class AIFilterProcessor:
     """AI-powered job filtering processor using Groq's Llama3-8b-8192 model"""
     
-    def __init__(self, api_key: Optional[str] = None):
-        """Initialize the AI filter processor"""
+    def __init__(self, api_key: Optional[str] = None, cache_file: str = 'ai_cache.db',
+                 memory_cache_size: int = 20000, client: Optional[Any] = None,
+                 base_url: Optional[str] = None,
+                 requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE,
+                 tokens_per_minute: float = DEFAULT_TOKENS_PER_MINUTE,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 request_timeout: float = 10.0, failure_threshold: int = 3, reset_timeout: float = 30.0):
+        """
+        Initialize the AI filter processor
+        
+        No request is made here: the Groq client is built on first use and a
+        health probe runs in the background. While the backend is failing the
+        circuit breaker is open and the filters fall back to rule-based
+        classification.
+        """
         # Use provided API key, then environment variable, then default key
         self.api_key = api_key or os.getenv('GROQ_API_KEY') or "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"
+        self.model = "llama3-8b-8192"
+        
+        # Spacing between API calls to prevent rate limiting (cache hits don't wait)
+        self.min_request_interval = 0.1
+        self.last_request_time = 0.0
+        self.request_count = 0
         
+        # Async requests share one pair of buckets, so throughput tracks the provider's limits
+        self.request_bucket = AsyncTokenBucket(requests_per_minute)
+        self.token_bucket = AsyncTokenBucket(tokens_per_minute)
+        self.retry_base_delay = 1.0
+        self.max_concurrency = max_concurrency
+        # The client is synchronous; async requests run on a dedicated pool
+        self.request_executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix='ai-request')
+        
+        # Responses are content-addressed: (method, model, prompt version, normalized input)
+        self.memory_cache = TTLLRUCache(max_size=memory_cache_size)
+        self.response_cache = SQLiteCache(cache_file, table='ai_responses')
+        
+        self.breaker = CircuitBreaker(failure_threshold=failure_threshold, reset_timeout=reset_timeout)
+        self.health = {'status': 'unknown', 'checked_at': None, 'error': None}
+        self.health_thread = None
+        
+        # base_url points the client at any chat-completions compatible server
+        self.base_url = base_url
+        self.request_timeout = request_timeout
+        self.client_lock = threading.Lock()
+        self._client = client
+        if client is None:
+            # Injected clients (tests, shared clients) skip the connectivity check
+            self.start_health_probe()
+    
+    @property
+    def client(self):
+        """The chat client, built on first use"""
+        if self._client is None:
+            with self.client_lock:
+                if self._client is None:
+                    self._client = Groq(api_key=self.api_key, base_url=self.base_url, timeout=self.request_timeout)
+        return self._client
+    
+    @client.setter
+    def client(self, client):
+        self._client = client
+    
+    def check_health(self) -> Dict[str, Any]:
+        """Make one tiny request and record whether the backend answered"""
         try:
-            self.client = Groq(api_key=self.api_key)
-            self.model = "llama3-8b-8192"
-            # Test the API key
-            test_response = self.client.chat.completions.create(
+            self.client.chat.completions.create(
                 model=self.model,
                 messages=[{"role": "user", "content": "test"}],
                 max_tokens=10
             )
-            print(f"✅ AI Processor initialized with API key: {self.api_key[:10]}...")
+            self.breaker.record_success()
+            self.health = {'status': 'ok', 'checked_at': time.time(), 'error': None}
+            print(f"✅ AI Processor connected with API key: {self.api_key[:10]}...")
         except Exception as e:
-            print(f"❌ Failed to initialize AI Processor: {e}")
+            # Don't wait for more failures; use rule-based filters until the breaker retries
+            self.breaker.trip()
+            self.health = {'status': 'error', 'checked_at': time.time(), 'error': str(e)}
+            print(f"❌ AI backend unavailable, using rule-based filters: {e}")
             print("🔧 Please check your API key or try generating a new one from https://console.groq.com/")
-            raise ValueError(f"Invalid API key: {e}")
+        return self.health
+    
+    def start_health_probe(self):
+        """Run check_health in the background"""
+        self.health_thread = threading.Thread(target=self.check_health, name='ai-health-probe', daemon=True)
+        self.health_thread.start()
+    
+    def is_available(self) -> bool:
+        """Whether AI requests are currently going through (circuit not open)"""
+        return self.breaker.state != 'open'
     
-    def process_job(self, job_data: Dict[str, Any]) -> Dict[str, Any]:
+    def status(self) -> Dict[str, Any]:
+        """Health probe result, circuit breaker state and cache stats"""
+        return {
+            'health': self.health,
+            'circuit': self.breaker.status(),
+            'cache': self.cache_stats()
+        }
+    
+    def _cache_key(self, method: str, normalized_input: str) -> str:
+        key_source = json.dumps([method, self.model, PROMPT_VERSIONS[method], normalized_input])
+        return hashlib.sha256(key_source.encode('utf-8')).hexdigest()
+    
+    def _chat(self, prompt: str, max_tokens: int) -> str:
+        """One chat completion through the circuit breaker"""
+        if not self.breaker.allow_request():
+            raise CircuitOpenError("AI backend unavailable (circuit open)")
+        try:
+            result = self._chat_with_retries(prompt, max_tokens)
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_success()
+        return result
+    
+    def _chat_with_retries(self, prompt: str, max_tokens: int) -> str:
+        """One chat completion with retries on rate limits and transient key errors"""
+        max_retries = 3
+        for attempt in range(max_retries):
+            wait_time = self.last_request_time + self.min_request_interval - time.time()
+            if wait_time > 0:
+                time.sleep(wait_time)
+            self.last_request_time = time.time()
+            self.request_count += 1
+            try:
+                response = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=0.1,
+                    max_tokens=max_tokens
+                )
+                return response.choices[0].message.content.strip()
+                
+            except Exception as api_error:
+                if attempt == max_retries - 1:
+                    raise api_error
+                if "401" in str(api_error) and "invalid_api_key" in str(api_error).lower():
+                    print(f"❌ Invalid API key on attempt {attempt + 1}")
+                    continue
+                elif "429" in str(api_error) or "rate_limit" in str(api_error).lower():
+                    print(f"⏳ Rate limit hit, waiting {2 ** attempt} seconds... (attempt {attempt + 1})")
+                    time.sleep(2 ** attempt)  # Exponential backoff
+                    continue
+                else:
+                    raise api_error
+    
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        """Jittered exponential backoff, never shorter than the server's retry-after"""
+        delay = self.retry_base_delay * 2 ** attempt * random.uniform(0.5, 1.5)
+        headers = getattr(getattr(error, 'response', None), 'headers', None) or {}
+        try:
+            return max(delay, float(headers.get('retry-after', 0)))
+        except (TypeError, ValueError):
+            return delay
+    
+    async def _chat_async(self, prompt: str, max_tokens: int) -> str:
+        """Async counterpart of _chat"""
+        if not self.breaker.allow_request():
+            raise CircuitOpenError("AI backend unavailable (circuit open)")
+        try:
+            result = await self._chat_with_retries_async(prompt, max_tokens)
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_success()
+        return result
+    
+    async def _chat_with_retries_async(self, prompt: str, max_tokens: int) -> str:
+        """Async chat completion, paced by the shared request/token buckets and retried on rate limits"""
+        loop = asyncio.get_running_loop()
+        for attempt in range(ASYNC_MAX_RETRIES):
+            await self.request_bucket.acquire()
+            await self.token_bucket.acquire(estimate_tokens(prompt, max_tokens))
+            self.request_count += 1
+            try:
+                response = await loop.run_in_executor(self.request_executor, partial(
+                    self.client.chat.completions.create,
+                    model=self.model,
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=0.1,
+                    max_tokens=max_tokens
+                ))
+                return response.choices[0].message.content.strip()
+                
+            except Exception as api_error:
+                if attempt == ASYNC_MAX_RETRIES - 1 or not is_rate_limit_error(api_error):
+                    raise api_error
+                delay = self._retry_delay(api_error, attempt)
+                print(f"⏳ Rate limit hit, retrying in {delay:.1f} seconds... (attempt {attempt + 1})")
+                await asyncio.sleep(delay)
+    
+    def _complete(self, method: str, normalized_input: str, prompt: str, max_tokens: int,
+                  cached_only: bool = False) -> str:
+        """
+        Chat completion text, served from the response cache when this input was seen before.
+        With cached_only, a miss raises CacheMissError instead of calling the API.
+        """
+        cache_key = self._cache_key(method, normalized_input)
+        
+        result = self.memory_cache.get(cache_key)
+        if result is None:
+            result = self.response_cache.get(cache_key)
+            if result is None:
+                if cached_only:
+                    raise CacheMissError(f"No cached {method} answer")
+                result = self._chat(prompt, max_tokens)
+                self.response_cache.set(cache_key, result)
+            self.memory_cache.set(cache_key, result)
+        return result
+    
+    async def _complete_async(self, method: str, normalized_input: str, prompt: str, max_tokens: int) -> str:
+        """Async counterpart of _complete"""
+        cache_key = self._cache_key(method, normalized_input)
+        
+        result = self.memory_cache.get(cache_key)
+        if result is None:
+            result = self.response_cache.get(cache_key)
+            if result is None:
+                result = await self._chat_async(prompt, max_tokens)
+                self.response_cache.set(cache_key, result)
+            self.memory_cache.set(cache_key, result)
+        return result
+    
+    def _store(self, method: str, normalized_input: str, result: str) -> str:
+        """Cache an answer obtained outside _complete (e.g. from a batch request); returns its key"""
+        cache_key = self._cache_key(method, normalized_input)
+        self.response_cache.set(cache_key, result)
+        self.memory_cache.set(cache_key, result)
+        return cache_key
+    
+    def _uncached_keys(self, cache_keys: List[str]) -> List[str]:
+        """The cache keys that have no answer stored yet"""
+        not_in_memory = [cache_key for cache_key in cache_keys if self.memory_cache.get(cache_key) is None]
+        stored = self.response_cache.get_many(not_in_memory)
+        return [cache_key for cache_key in not_in_memory if cache_key not in stored]
+    
+    def _forget(self, method: str, normalized_input: str):
+        """Drop a cached response that turned out to be unusable"""
+        cache_key = self._cache_key(method, normalized_input)
+        self.memory_cache.delete(cache_key)
+        self.response_cache.delete(cache_key)
+    
+    def flush_cache(self):
+        """Commit pending response cache writes"""
+        self.response_cache.commit()
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Memory tier hit/miss stats plus the persistent cache size"""
+        stats = self.memory_cache.stats()
+        stats['store_size'] = len(self.response_cache)
+        stats['api_requests'] = self.request_count
+        return stats
+    
+    def process_job(self, job_data: Dict[str, Any], cached_only: bool = False) -> Dict[str, Any]:
         """
         Process a single job through all AI filters
         
         Args:
             job_data: Raw job data with title, location, company, etc.
+            cached_only: Only use cached answers; rules fill in for the rest
             
         Returns:
             Processed job data with AI-extracted information
@@ -43,15 +436,11 @@ class AIFilterProcessor:
             company = job_data.get('company', '')
             description = job_data.get('description', '')
             
-            # Add delay to prevent rate limiting
-            import time
-            time.sleep(0.1)  # 100ms delay between API calls
-            
             # Process through AI filters
-            location_info = self.parse_location(location)
-            experience_level = self.extract_experience(title, description)
-            role_category = self.categorize_role(title, description)
-            company_normalized = self.normalize_company(company)
+            location_info = self.parse_location(location, cached_only)
+            experience_level = self.extract_experience(title, description, cached_only)
+            role_category = self.categorize_role(title, description, cached_only)
+            company_normalized = self.normalize_company(company, cached_only)
             
             # Add AI-processed data to job
             processed_job = job_data.copy()
@@ -70,26 +459,275 @@ class AIFilterProcessor:
             # Return original job data if AI processing fails
             return job_data
     
-    def parse_location(self, location_str: str) -> Dict[str, Any]:
+    def process_jobs(self, jobs: List[Dict[str, Any]], batch_size: int = DEFAULT_BATCH_SIZE,
+                     progress_callback: Optional[Callable[[int, int], None]] = None) -> List[Dict[str, Any]]:
         """
-        Parse location string using AI
+        Process many jobs with batched, concurrent AI requests (see process_jobs_async)
         
         Args:
-            location_str: Raw location string
+            jobs: Raw job dictionaries
+            batch_size: Distinct inputs per batch request
+            progress_callback: Called with (answers done, answers needed) as requests finish
             
         Returns:
-            Structured location information
+            Processed jobs, in the same order
         """
-        if not location_str or location_str.lower() in ['n/a', 'remote', 'anywhere']:
-            return {
-                'country': 'remote',
-                'states': [],
-                'cities': [],
-                'is_remote': True,
-                'raw_location': location_str
-            }
+        return asyncio.run(self.process_jobs_async(jobs, batch_size, progress_callback=progress_callback))
+    
+    async def process_jobs_async(self, jobs: List[Dict[str, Any]], batch_size: int = DEFAULT_BATCH_SIZE,
+                                 max_concurrency: Optional[int] = None,
+                                 progress_callback: Optional[Callable[[int, int], None]] = None) -> List[Dict[str, Any]]:
+        """
+        Process many jobs with batched, concurrent AI requests
         
-        prompt = f"""
+        Distinct locations, titles and company names that aren't cached yet are
+        packed batch_size at a time into one request per filter, and up to
+        max_concurrency requests are in flight at once, paced by the shared
+        requests/tokens per minute buckets. Every answer that validates is
+        cached; entries a batch couldn't answer fall back to single requests.
+        The per-job pass at the end only reads the cache, so it never blocks
+        the event loop on a request; anything still unanswered gets the rules.
+        
+        Args:
+            jobs: Raw job dictionaries
+            batch_size: Distinct inputs per batch request
+            max_concurrency: Requests in flight at once (defaults to the processor's setting)
+            progress_callback: Called with (answers done, answers needed) as requests finish
+            
+        Returns:
+            Processed jobs, in the same order
+        """
+        requests = {}
+        for job in jobs:
+            for request in self._single_requests(job):
+                requests.setdefault(self._cache_key(request['method'], request['normalized_input']), request)
+        uncached = set(self._uncached_keys(list(requests)))
+        pending = {cache_key: request for cache_key, request in requests.items() if cache_key in uncached}
+        total = len(pending)
+        done = 0
+        
+        def resolve(cache_keys):
+            nonlocal done
+            for cache_key in cache_keys:
+                if pending.pop(cache_key, None) is not None:
+                    done += 1
+            if progress_callback:
+                progress_callback(done, total)
+        
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+        
+        # One batch request per batch_size distinct inputs of each kind
+        groups = {}
+        for request in pending.values():
+            group = groups.setdefault(BATCH_KINDS[request['method']], {})
+            group.setdefault(request['normalized_input'], request['item'])
+        
+        async def run_batch(kind, chunk):
+            async with semaphore:
+                resolve(await self._run_batch_async(kind, chunk))
+        
+        batches = []
+        for kind, group in groups.items():
+            entries = list(group.items())
+            for start in range(0, len(entries), batch_size):
+                batches.append(run_batch(kind, entries[start:start + batch_size]))
+        await asyncio.gather(*batches)
+        
+        # Whatever the batches couldn't answer goes out as single requests
+        async def run_single(cache_key, request):
+            async with semaphore:
+                try:
+                    await self._complete_async(
+                        request['method'], request['normalized_input'], request['prompt'], request['max_tokens']
+                    )
+                except CircuitOpenError:
+                    pass  # process_job falls back to rules
+                except Exception as e:
+                    print(f"Error in {request['method']} request: {e}")
+            resolve([cache_key])
+        
+        await asyncio.gather(*(run_single(cache_key, request) for cache_key, request in list(pending.items())))
+        
+        processed_jobs = [self.process_job(job, cached_only=True) for job in jobs]
+        self.flush_cache()
+        return processed_jobs
+    
+    def _single_requests(self, job_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """The requests process_job would make for a job, with the item a batch prompt needs"""
+        title = job_data.get('title', '')
+        location = job_data.get('location', '')
+        company = job_data.get('company', '')
+        description = job_data.get('description', '')
+        title_input = normalize_cache_input(title, description[:500])
+        title_item = {'title': title, 'description': description[:500]}
+        
+        requests = []
+        if location and location.lower() not in REMOTE_LOCATIONS:
+            requests.append({
+                'method': 'parse_location', 'normalized_input': normalize_cache_input(location),
+                'prompt': self._location_prompt(location), 'max_tokens': 500, 'item': {'location': location}
+            })
+        requests.append({
+            'method': 'extract_experience', 'normalized_input': title_input,
+            'prompt': self._experience_prompt(title, description), 'max_tokens': 50, 'item': title_item
+        })
+        requests.append({
+            'method': 'categorize_role', 'normalized_input': title_input,
+            'prompt': self._role_prompt(title, description), 'max_tokens': 50, 'item': title_item
+        })
+        if company:
+            requests.append({
+                'method': 'normalize_company', 'normalized_input': normalize_cache_input(company),
+                'prompt': self._company_prompt(company), 'max_tokens': 100, 'item': {'company': company}
+            })
+        return requests
+    
+    def _batch_handler(self, kind: str):
+        """(prompt builder, answer store, completion tokens per item) for a batch kind"""
+        return {
+            'location': (self._location_batch_prompt, self._store_location_answer, 60),
+            'title': (self._title_batch_prompt, self._store_title_answer, 30),
+            'company': (self._company_batch_prompt, self._store_company_answer, 20),
+        }[kind]
+    
+    async def _run_batch_async(self, kind: str, chunk: List[Any]) -> List[str]:
+        """
+        Send one batch request and cache every answer that validates
+        
+        Args:
+            kind: 'location', 'title' or 'company'
+            chunk: (normalized_input, prompt item) pairs
+            
+        Returns:
+            Cache keys of the answers stored
+        """
+        build_prompt, store_answer, tokens_per_item = self._batch_handler(kind)
+        prompt = build_prompt([dict(item, id=index) for index, (_, item) in enumerate(chunk)])
+        try:
+            result = await self._chat_async(prompt, max_tokens=tokens_per_item * len(chunk) + 100)
+            answers = json.loads(extract_json_text(result, r'\[.*\]'))
+        except CircuitOpenError:
+            return []
+        except Exception as e:
+            print(f"Batch {kind} request failed, falling back to single requests: {e}")
+            return []
+        
+        answers_by_id = {
+            answer.get('id'): answer for answer in answers if isinstance(answer, dict)
+        } if isinstance(answers, list) else {}
+        stored = []
+        for index, (normalized_input, item) in enumerate(chunk):
+            answer = answers_by_id.get(index)
+            if answer is not None:
+                stored.extend(store_answer(normalized_input, item, answer))
+        return stored
+    
+    def _location_batch_prompt(self, items: List[Dict[str, Any]]) -> str:
+        return f"""
+Parse each job location below into structured data. Return only a valid JSON array without any markdown formatting.
+
+Locations:
+{json.dumps(items)}
+
+Return one JSON object per location with these exact fields:
+- id: The id of the location
+- country: The country (e.g., "united states", "canada", "remote")
+- states: Array of states/provinces (e.g., ["california", "washington"])
+- cities: Array of cities (e.g., ["san francisco", "seattle"])
+- is_remote: Boolean (true/false)
+
+Example:
+[{{"id": 0, "location": "San Francisco, CA"}}, {{"id": 1, "location": "New York, NY | Seattle, WA"}}] → [{{"id": 0, "country": "united states", "states": ["california"], "cities": ["san francisco"], "is_remote": false}}, {{"id": 1, "country": "united states", "states": ["new york", "washington"], "cities": ["new york", "seattle"], "is_remote": false}}]
+
+Return only the JSON array:
+"""
+    
+    def _store_location_answer(self, normalized_input: str, item: Dict[str, Any], answer: Dict[str, Any]) -> List[str]:
+        """Cache a batch location answer as a parse_location answer"""
+        if not is_valid_location_info(answer):
+            return []
+        location_info = {field: answer[field] for field in ('country', 'states', 'cities', 'is_remote')}
+        location_info['raw_location'] = item['location']
+        return [self._store('parse_location', normalized_input, json.dumps(location_info))]
+    
+    def _title_batch_prompt(self, items: List[Dict[str, Any]]) -> str:
+        return f"""
+Classify each job below by experience level and role category. Return only a valid JSON array without any markdown formatting.
+
+Jobs (descriptions truncated):
+{json.dumps(items)}
+
+Experience levels:
+- entry: Entry level, junior, 0-2 years, recent graduate
+- mid: Mid-level, 3-5 years, intermediate
+- senior: Senior, 5+ years, lead, principal
+- staff: Staff, senior staff, 7+ years
+- director: Director, VP, executive level
+- unknown: Cannot determine
+
+Role categories:
+- engineering: Software engineer, developer, programmer, DevOps, SRE
+- data_science: Data scientist, ML engineer, AI engineer, analyst
+- product: Product manager, product owner, program manager
+- design: UX designer, UI designer, graphic designer
+- sales: Sales, business development, account executive
+- marketing: Marketing, growth, content, SEO
+- operations: Operations, strategy, business operations
+- hr: HR, recruiting, talent acquisition
+- finance: Finance, accounting, controller
+- legal: Legal, compliance, counsel
+- other: Other roles not listed above
+
+Return one JSON object per job with these exact fields:
+- id: The id of the job
+- experience_level: One of the experience levels above
+- role_category: One of the role categories above
+
+Return only the JSON array:
+"""
+    
+    def _store_title_answer(self, normalized_input: str, item: Dict[str, Any], answer: Dict[str, Any]) -> List[str]:
+        """Cache a batch title answer as extract_experience and categorize_role answers"""
+        experience = str(answer.get('experience_level', '')).strip().lower()
+        role = str(answer.get('role_category', '')).strip().lower()
+        # Each half is cached on its own; an invalid half falls back to a single request
+        stored = []
+        if experience in EXPERIENCE_LEVELS:
+            stored.append(self._store('extract_experience', normalized_input, experience))
+        if role in ROLE_CATEGORIES:
+            stored.append(self._store('categorize_role', normalized_input, role))
+        return stored
+    
+    def _company_batch_prompt(self, items: List[Dict[str, Any]]) -> str:
+        return f"""
+Normalize each company name below to a standard format. Return only a valid JSON array without any markdown formatting.
+
+Companies:
+{json.dumps(items)}
+
+Examples:
+- "Anthropic PBC" → "Anthropic"
+- "Google LLC" → "Google"
+- "Microsoft Corporation" → "Microsoft"
+- "Meta Platforms Inc." → "Meta"
+
+Return one JSON object per company with these exact fields:
+- id: The id of the company
+- normalized: The normalized company name
+
+Return only the JSON array:
+"""
+    
+    def _store_company_answer(self, normalized_input: str, item: Dict[str, Any], answer: Dict[str, Any]) -> List[str]:
+        """Cache a batch company answer as a normalize_company answer"""
+        normalized = answer.get('normalized')
+        if not isinstance(normalized, str) or not normalized.strip():
+            return []
+        return [self._store('normalize_company', normalized_input, normalized.strip())]
+    
+    def _location_prompt(self, location_str: str) -> str:
+        """Single-location prompt for parse_location"""
+        return f"""
 Parse this job location into structured data. Return only valid JSON without any markdown formatting.
 
 Location: "{location_str}"
@@ -108,83 +746,57 @@ Examples:
 
 Return only the JSON object:
 """
+    
+    def parse_location(self, location_str: str, cached_only: bool = False) -> Dict[str, Any]:
+        """
+        Parse location string using AI
         
-        try:
-            # Add retry logic for API calls
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    response = self.client.chat.completions.create(
-                        model=self.model,
-                        messages=[{"role": "user", "content": prompt}],
-                        temperature=0.1,
-                        max_tokens=500
-                    )
-                    
-                    result = response.choices[0].message.content.strip()
-                    break  # Success, exit retry loop
-                    
-                except Exception as api_error:
-                    if "401" in str(api_error) and "invalid_api_key" in str(api_error).lower():
-                        print(f"❌ Invalid API key on attempt {attempt + 1}")
-                        if attempt == max_retries - 1:
-                            raise api_error
-                        continue
-                    elif "429" in str(api_error) or "rate_limit" in str(api_error).lower():
-                        print(f"⏳ Rate limit hit, waiting {2 ** attempt} seconds... (attempt {attempt + 1})")
-                        import time
-                        time.sleep(2 ** attempt)  # Exponential backoff
-                        continue
-                    else:
-                        raise api_error
-            
-            # Clean up the response - remove any markdown formatting
-            if result.startswith('```json'):
-                result = result[7:]
-            if result.startswith('```'):
-                result = result[3:]
-            if result.endswith('```'):
-                result = result[:-3]
+        Args:
+            location_str: Raw location string
+            cached_only: Only use a cached answer; rules otherwise
             
-            # Remove any quotes around the entire response
-            result = result.strip('"')
+        Returns:
+            Structured location information
+        """
+        if not location_str or location_str.lower() in REMOTE_LOCATIONS:
+            return {
+                'country': 'remote',
+                'states': [],
+                'cities': [],
+                'is_remote': True,
+                'raw_location': location_str
+            }
+        
+        prompt = self._location_prompt(location_str)
+        
+        try:
+            result = self._complete(
+                'parse_location', normalize_cache_input(location_str), prompt, max_tokens=500,
+                cached_only=cached_only
+            )
             
-            # Try to extract JSON from the response (in case there's text before/after)
-            import re
-            json_match = re.search(r'\{.*\}', result, re.DOTALL)
-            if json_match:
-                result = json_match.group()
+            result = extract_json_text(result, r'\{.*\}')
             
             try:
                 location_info = json.loads(result)
             except json.JSONDecodeError as e:
                 print(f"JSON decode error: {e}")
                 print(f"Raw response: {result}")
+                # Don't keep serving an unparseable answer from the cache
+                self._forget('parse_location', normalize_cache_input(location_str))
                 raise e
+            # The cached answer may come from a differently formatted string
+            location_info['raw_location'] = location_str
             return location_info
             
         except Exception as e:
-            print(f"Error parsing location '{location_str}': {e}")
-            return {
-                'country': 'other',
-                'states': [],
-                'cities': [],
-                'is_remote': False,
-                'raw_location': location_str
-            }
+            if not isinstance(e, (CircuitOpenError, CacheMissError)):
+                print(f"Error parsing location '{location_str}': {e}")
+            return parse_location_rules(location_str)
     
-    def extract_experience(self, title: str, description: str) -> str:
-        """
-        Extract experience level from job title and description
-        
-        Args:
-            title: Job title
-            description: Job description
-            
-        Returns:
-            Experience level category
-        """
-        prompt = f"""
+    def _experience_prompt(self, title: str, description: str) -> str:
+        """Single-job prompt for extract_experience"""
+        return f"""
 Analyze this job and determine the experience level. Return only the experience level category.
 
 Job Title: "{title}"
@@ -200,59 +812,44 @@ Experience levels:
 
 Return only the experience level category (entry, mid, senior, staff, director, or unknown):
 """
+    
+    def extract_experience(self, title: str, description: str, cached_only: bool = False) -> str:
+        """
+        Extract experience level from job title and description
+        
+        Args:
+            title: Job title
+            description: Job description
+            cached_only: Only use a cached answer; rules otherwise
+            
+        Returns:
+            Experience level category
+        """
+        prompt = self._experience_prompt(title, description)
         
         try:
-            # Add retry logic for API calls
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    response = self.client.chat.completions.create(
-                        model=self.model,
-                        messages=[{"role": "user", "content": prompt}],
-                        temperature=0.1,
-                        max_tokens=50
-                    )
-                    
-                    experience = response.choices[0].message.content.strip().lower()
-                    break  # Success, exit retry loop
-                    
-                except Exception as api_error:
-                    if "401" in str(api_error) and "invalid_api_key" in str(api_error).lower():
-                        print(f"❌ Invalid API key on attempt {attempt + 1}")
-                        if attempt == max_retries - 1:
-                            raise api_error
-                        continue
-                    elif "rate_limit" in str(api_error).lower():
-                        print(f"⏳ Rate limit hit, waiting... (attempt {attempt + 1})")
-                        import time
-                        time.sleep(2 ** attempt)  # Exponential backoff
-                        continue
-                    else:
-                        raise api_error
+            experience = self._complete(
+                'extract_experience', normalize_cache_input(title, description[:500]), prompt, max_tokens=50,
+                cached_only=cached_only
+            ).lower()
             
             # Validate response
-            valid_levels = ['entry', 'mid', 'senior', 'staff', 'director', 'unknown']
-            if experience in valid_levels:
+            if experience in EXPERIENCE_LEVELS:
                 return experience
             else:
+                # Don't keep serving an answer outside the levels from the cache
+                self._forget('extract_experience', normalize_cache_input(title, description[:500]))
                 return 'unknown'
                 
         except Exception as e:
-            print(f"Error extracting experience: {e}")
-            return 'unknown'
+            if not isinstance(e, (CircuitOpenError, CacheMissError)):
+                print(f"Error extracting experience: {e}")
+            level = extract_experience_level(title)
+            return RULE_EXPERIENCE_LEVELS.get(level, level)
     
-    def categorize_role(self, title: str, description: str) -> str:
-        """
-        Categorize job role from title and description
-        
-        Args:
-            title: Job title
-            description: Job description
-            
-        Returns:
-            Role category
-        """
-        prompt = f"""
+    def _role_prompt(self, title: str, description: str) -> str:
+        """Single-job prompt for categorize_role"""
+        return f"""
 Categorize this job into a role category. Return only the role category.
 
 Job Title: "{title}"
@@ -273,62 +870,44 @@ Role categories:
 
 Return only the role category:
 """
+    
+    def categorize_role(self, title: str, description: str, cached_only: bool = False) -> str:
+        """
+        Categorize job role from title and description
+        
+        Args:
+            title: Job title
+            description: Job description
+            cached_only: Only use a cached answer; rules otherwise
+            
+        Returns:
+            Role category
+        """
+        prompt = self._role_prompt(title, description)
         
         try:
-            # Add retry logic for API calls
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    response = self.client.chat.completions.create(
-                        model=self.model,
-                        messages=[{"role": "user", "content": prompt}],
-                        temperature=0.1,
-                        max_tokens=50
-                    )
-                    
-                    role = response.choices[0].message.content.strip().lower()
-                    break  # Success, exit retry loop
-                    
-                except Exception as api_error:
-                    if "401" in str(api_error) and "invalid_api_key" in str(api_error).lower():
-                        print(f"❌ Invalid API key on attempt {attempt + 1}")
-                        if attempt == max_retries - 1:
-                            raise api_error
-                        continue
-                    elif "rate_limit" in str(api_error).lower():
-                        print(f"⏳ Rate limit hit, waiting... (attempt {attempt + 1})")
-                        import time
-                        time.sleep(2 ** attempt)  # Exponential backoff
-                        continue
-                    else:
-                        raise api_error
+            role = self._complete(
+                'categorize_role', normalize_cache_input(title, description[:500]), prompt, max_tokens=50,
+                cached_only=cached_only
+            ).lower()
             
             # Validate response
-            valid_roles = ['engineering', 'data_science', 'product', 'design', 'sales', 
-                          'marketing', 'operations', 'hr', 'finance', 'legal', 'other']
-            if role in valid_roles:
+            if role in ROLE_CATEGORIES:
                 return role
             else:
+                # Don't keep serving an answer outside the categories from the cache
+                self._forget('categorize_role', normalize_cache_input(title, description[:500]))
                 return 'other'
                 
         except Exception as e:
-            print(f"Error categorizing role: {e}")
-            return 'other'
+            if not isinstance(e, (CircuitOpenError, CacheMissError)):
+                print(f"Error categorizing role: {e}")
+            role = extract_role_category(title)
+            return RULE_ROLE_CATEGORIES.get(role, role)
     
-    def normalize_company(self, company: str) -> str:
-        """
-        Normalize company name
-        
-        Args:
-            company: Raw company name
-            
-        Returns:
-            Normalized company name
-        """
-        if not company:
-            return 'Unknown'
-        
-        prompt = f"""
+    def _company_prompt(self, company: str) -> str:
+        """Single-company prompt for normalize_company"""
+        return f"""
 Normalize this company name to a standard format. Return only the normalized name.
 
 Company: "{company}"
@@ -341,42 +920,36 @@ Examples:
 
 Return only the normalized company name:
 """
+    
+    def normalize_company(self, company: str, cached_only: bool = False) -> str:
+        """
+        Normalize company name
+        
+        Args:
+            company: Raw company name
+            cached_only: Only use a cached answer; rules otherwise
+            
+        Returns:
+            Normalized company name
+        """
+        if not company:
+            return 'Unknown'
+        
+        prompt = self._company_prompt(company)
         
         try:
-            # Add retry logic for API calls
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    response = self.client.chat.completions.create(
-                        model=self.model,
-                        messages=[{"role": "user", "content": prompt}],
-                        temperature=0.1,
-                        max_tokens=100
-                    )
-                    
-                    normalized = response.choices[0].message.content.strip()
-                    break  # Success, exit retry loop
-                    
-                except Exception as api_error:
-                    if "401" in str(api_error) and "invalid_api_key" in str(api_error).lower():
-                        print(f"❌ Invalid API key on attempt {attempt + 1}")
-                        if attempt == max_retries - 1:
-                            raise api_error
-                        continue
-                    elif "rate_limit" in str(api_error).lower():
-                        print(f"⏳ Rate limit hit, waiting... (attempt {attempt + 1})")
-                        import time
-                        time.sleep(2 ** attempt)  # Exponential backoff
-                        continue
-                    else:
-                        raise api_error
+            normalized = self._complete(
+                'normalize_company', normalize_cache_input(company), prompt, max_tokens=100,
+                cached_only=cached_only
+            )
             # Remove quotes if present
             normalized = normalized.strip('"').strip("'")
             return normalized if normalized else company
             
         except Exception as e:
-            print(f"Error normalizing company: {e}")
-            return company
+            if not isinstance(e, (CircuitOpenError, CacheMissError)):
+                print(f"Error normalizing company: {e}")
+            return normalize_company_rules(company)
     
     def get_hierarchical_filters(self, jobs: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -0,0 +1,79 @@
+import threading
+import time
+from typing import Any, Dict
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a backend whose circuit is open"""
+
+class CircuitBreaker:
+    """
+    Stops calling a backend after repeated failures.
+    closed: requests go through; `failure_threshold` failures in a row open it.
+    open: requests are rejected straight away for `reset_timeout` seconds.
+    half_open: one trial request is let through; success closes the circuit,
+    failure opens it for another `reset_timeout`.
+    """
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_progress = False
+        self.lock = threading.Lock()
+        self.stats = {'trips': 0, 'rejected': 0}
+
+    def _state(self) -> str:
+        if self.opened_at is None:
+            return 'closed'
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return 'half_open'
+        return 'open'
+
+    def _open(self):
+        self.opened_at = time.monotonic()
+        self.trial_in_progress = False
+        self.stats['trips'] += 1
+
+    @property
+    def state(self) -> str:
+        with self.lock:
+            return self._state()
+
+    def allow_request(self) -> bool:
+        """Whether a request may go to the backend now (claims the trial slot when half open)"""
+        with self.lock:
+            state = self._state()
+            if state == 'closed':
+                return True
+            if state == 'half_open' and not self.trial_in_progress:
+                self.trial_in_progress = True
+                return True
+            self.stats['rejected'] += 1
+            return False
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial_in_progress = False
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            # A failed trial re-opens the circuit straight away
+            if self.opened_at is not None or self.failures >= self.failure_threshold:
+                self._open()
+
+    def trip(self):
+        """Open the circuit now, e.g. after a failed health check"""
+        with self.lock:
+            self._open()
+
+    def status(self) -> Dict[str, Any]:
+        with self.lock:
+            state = self._state()
+            retry_in = 0.0
+            if state == 'open':
+                retry_in = round(self.reset_timeout - (time.monotonic() - self.opened_at), 1)
+            return dict(self.stats, state=state, failures=self.failures, retry_in=retry_in)
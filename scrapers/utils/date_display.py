@@ -0,0 +1,71 @@
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Optional
+
+SECONDS_PER_DAY = 86400
+
+# Badge color per posted-date confidence
+CONFIDENCE_COLORS = {
+    'high': 'success',
+    'medium': 'warning',
+    'low': 'info',
+    'very_low': 'secondary',
+    'unknown': 'secondary'
+}
+
+def to_epoch(value: Any) -> Optional[int]:
+    """Unix seconds for a datetime, ISO string or number. None when unknown or unparseable"""
+    if value is None or value == '' or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, datetime):
+        return int(value.timestamp())
+    if isinstance(value, str):
+        return iso_to_epoch(value)
+    return None
+
+@lru_cache(maxsize=65536)
+def iso_to_epoch(value: str) -> Optional[int]:
+    """to_epoch for ISO strings; memoized, as estimated dates repeat across jobs and page views"""
+    try:
+        return int(datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp())
+    except ValueError:
+        return None
+
+def age_label(age_days: int) -> str:
+    """Relative label for an age in whole days"""
+    if age_days <= 0:
+        return "Today"
+    elif age_days == 1:
+        return "Yesterday"
+    elif age_days < 7:
+        return f"{age_days} days ago"
+    elif age_days < 30:
+        weeks = age_days // 7
+        return f"{weeks} week{'s' if weeks > 1 else ''} ago"
+    else:
+        months = age_days // 30
+        return f"{months} month{'s' if months > 1 else ''} ago"
+
+# Labels for the first year, indexed by age in days
+AGE_LABELS = tuple(age_label(age_days) for age_days in range(366))
+
+def relative_date_label(epoch: Optional[int], now: Optional[float] = None) -> str:
+    """
+    'Today', '3 days ago', '2 weeks ago'... for a unix timestamp.
+    Pass the same `now` for a whole snapshot so every job is labelled against one clock tick.
+    """
+    if epoch is None:
+        return "Unknown"
+    if now is None:
+        now = time.time()
+    age_days = int(now - epoch) // SECONDS_PER_DAY
+    if age_days < len(AGE_LABELS):
+        return AGE_LABELS[max(age_days, 0)]
+    return age_label(age_days)
+
+def confidence_color(confidence: str) -> str:
+    """Color class for a posted-date confidence level"""
+    return CONFIDENCE_COLORS.get(confidence, 'secondary')
@@ -0,0 +1,126 @@
+import logging
+import queue
+import threading
+from typing import Any, Dict, Optional
+
+from .cache_utils import TTLLRUCache
+
+logger = logging.getLogger(__name__)
+
+class DateEnrichmentWorker:
+    """
+    Resolves accurate posted dates in the background.
+    Page loads get a provisional date straight away (cached estimate or a
+    pattern guess); jobs that still need a platform lookup are queued, and a
+    worker thread resolves them in batches through the estimator's concurrent
+    batch lookup. Results land in the estimator's cache, so the next snapshot
+    picks them up.
+    """
+
+    def __init__(self, estimator, batch_size: int = 50, retry_after: float = 3600):
+        self.estimator = estimator
+        self.batch_size = batch_size
+        self.queue = queue.Queue()
+        self.pending = set()  # (title, company, location) queued or being resolved
+        # Keys looked up recently, so failed lookups aren't retried on every page load
+        self.attempted = TTLLRUCache(max_size=50000, default_ttl=retry_after)
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.stats = {'enqueued': 0, 'resolved': 0, 'improved': 0, 'batches': 0, 'errors': 0}
+
+    def estimate(self, job_title: str, company_name: str, location: Optional[str] = None,
+                 first_seen: Optional[int] = None) -> Dict[str, Any]:
+        """Return a date estimate for a job without waiting on the network"""
+        if not self.estimator.use_external_apis:
+            # Fast mode is pattern analysis only, nothing to enrich
+            return self.estimator.estimate_job_date(job_title, company_name, location, first_seen)
+
+        result = self.estimator.get_cached_estimate(job_title, company_name, location)
+        if result is None or self.estimator.is_pattern_result(result):
+            self.enqueue(job_title, company_name, location, first_seen)
+        if result is None:
+            result = self.estimator.estimate_from_patterns(job_title, company_name, location, first_seen)
+            result['provisional'] = True
+        return result
+
+    def enqueue(self, job_title: str, company_name: str, location: Optional[str] = None,
+                first_seen: Optional[int] = None) -> bool:
+        """Queue a job for an accurate lookup. Returns False if already queued or tried recently"""
+        job_key = (job_title, company_name, location)
+        with self.lock:
+            if job_key in self.pending or self.attempted.get(job_key) is not None:
+                return False
+            self.pending.add(job_key)
+            self.stats['enqueued'] += 1
+        self.queue.put({'title': job_title, 'company': company_name, 'location': location, 'first_seen': first_seen})
+        self.start()
+        return True
+
+    def start(self):
+        """Start the worker thread if it isn't running"""
+        with self.lock:
+            if self.thread is not None and self.thread.is_alive():
+                return
+            self.stop_event.clear()
+            self.thread = threading.Thread(target=self._run, name='date-enrichment', daemon=True)
+            self.thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """Ask the worker to stop after its current batch"""
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join(timeout)
+
+    def wait_until_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until every queued job has been resolved (mainly for tests and scripts)"""
+        with self.queue.all_tasks_done:
+            return self.queue.all_tasks_done.wait_for(lambda: self.queue.unfinished_tasks == 0, timeout)
+
+    def _next_batch(self):
+        """Up to batch_size queued jobs, waiting briefly for the first one"""
+        try:
+            batch = [self.queue.get(timeout=1.0)]
+        except queue.Empty:
+            return []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while not self.stop_event.is_set():
+            batch = self._next_batch()
+            if not batch:
+                continue
+            try:
+                results = self.estimator.estimate_job_dates(batch, use_external_apis=True)
+                with self.lock:
+                    self.stats['batches'] += 1
+                    self.stats['resolved'] += len(results)
+                    self.stats['improved'] += sum(
+                        1 for result in results if not self.estimator.is_pattern_result(result)
+                    )
+            except Exception as e:
+                logger.warning(f"Date enrichment batch failed: {e}")
+                with self.lock:
+                    self.stats['errors'] += 1
+            finally:
+                with self.lock:
+                    for job in batch:
+                        job_key = (job['title'], job['company'], job['location'])
+                        self.pending.discard(job_key)
+                        self.attempted.set(job_key, True)
+                for _ in batch:
+                    self.queue.task_done()
+
+    def status(self) -> Dict[str, Any]:
+        """Queue depth and counters"""
+        with self.lock:
+            return dict(
+                self.stats,
+                queued=len(self.pending),
+                running=self.thread is not None and self.thread.is_alive()
+            )
@@ -1,5 +1,9 @@
 import re
-from typing import Dict, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Pattern, Tuple
+
+# Distinct normalized titles kept in the classification memo
+TITLE_CACHE_SIZE = 50000
 
 # Experience level patterns
 EXPERIENCE_PATTERNS = {
@@ -67,6 +71,75 @@ ROLE_CATEGORIES = {
     ]
 }
 
+def compile_pattern_matcher(pattern_dict: Dict[str, List[str]]) -> Pattern:
+    """
+    Compile a {category: [patterns]} dictionary into a single regex.
+    Patterns only match whole words (plus a plural/-ing suffix), so 'ai' does
+    not match "maintenance" and 'pr' does not match "product". The lookahead reports a match at every word
+    start, so overlapping patterns from different categories are all seen.
+    Each category is a named group; the dictionary order is the priority.
+    """
+    alternatives = []
+    for category, patterns in pattern_dict.items():
+        # Longest first so multi-word patterns win over their prefixes
+        escaped = sorted({re.escape(pattern) for pattern in patterns}, key=len, reverse=True)
+        alternatives.append(f"(?P<{category}>{'|'.join(escaped)})")
+    return re.compile(r"\b(?=(?:" + "|".join(alternatives) + r")(?:s|ing)?\b)")
+
+# Mapping onto the 'entry'/'mid'/'senior' scale of the job description analysis
+TAILORING_EXPERIENCE_LEVELS = {
+    'intern': 'entry',
+    'entry': 'entry',
+    'mid': 'mid',
+    'senior': 'senior',
+    'expert': 'senior',
+    'unknown': 'mid'
+}
+
+EXPERIENCE_MATCHER = compile_pattern_matcher(EXPERIENCE_PATTERNS)
+EXPERIENCE_PRIORITY = {level: rank for rank, level in enumerate(EXPERIENCE_PATTERNS)}
+
+ROLE_MATCHER = compile_pattern_matcher(ROLE_CATEGORIES)
+ROLE_PRIORITY = {category: rank for rank, category in enumerate(ROLE_CATEGORIES)}
+
+def match_highest_priority(matcher: Pattern, priority: Dict[str, int], text: str, default: str) -> str:
+    """Return the highest priority category matched anywhere in text"""
+    best_rank = len(priority)
+    best_category = default
+    for match in matcher.finditer(text):
+        rank = priority[match.lastgroup]
+        if rank < best_rank:
+            best_rank = rank
+            best_category = match.lastgroup
+            if rank == 0:
+                break
+    return best_category
+
+def normalize_job_title(job_title: str) -> str:
+    """Lowercase and collapse whitespace so trivially different titles share a memo entry"""
+    return ' '.join(job_title.lower().split())
+
+@lru_cache(maxsize=TITLE_CACHE_SIZE)
+def classify_normalized_title(normalized_title: str) -> Tuple[str, str]:
+    """
+    Classify a normalized title into (experience_level, role_category).
+    Titles repeat heavily across companies, so most calls are memo hits.
+    """
+    return (
+        match_highest_priority(EXPERIENCE_MATCHER, EXPERIENCE_PRIORITY, normalized_title, 'unknown'),
+        match_highest_priority(ROLE_MATCHER, ROLE_PRIORITY, normalized_title, 'other'),
+    )
+
+def classification_cache_info() -> Dict[str, Any]:
+    """Hit/miss counters for the title classification memo"""
+    info = classify_normalized_title.cache_info()
+    return {
+        'hits': info.hits,
+        'misses': info.misses,
+        'size': info.currsize,
+        'max_size': info.maxsize
+    }
+
 def extract_experience_level(job_title: str) -> str:
     """
     Extract experience level from job title
@@ -75,14 +148,7 @@ def extract_experience_level(job_title: str) -> str:
     if not job_title:
         return 'unknown'
     
-    title_lower = job_title.lower()
-    
-    for level, patterns in EXPERIENCE_PATTERNS.items():
-        for pattern in patterns:
-            if pattern in title_lower:
-                return level
-    
-    return 'unknown'
+    return classify_normalized_title(normalize_job_title(job_title))[0]
 
 def extract_role_category(job_title: str) -> str:
     """
@@ -92,92 +158,167 @@ def extract_role_category(job_title: str) -> str:
     if not job_title:
         return 'other'
     
-    title_lower = job_title.lower()
-    
-    for category, patterns in ROLE_CATEGORIES.items():
-        for pattern in patterns:
-            if pattern in title_lower:
-                return category
-    
-    return 'other'
+    return classify_normalized_title(normalize_job_title(job_title))[1]
 
 def analyze_job_title(job_title: str) -> Dict[str, str]:
     """
     Analyze job title and return experience level and role category
     """
+    if not job_title:
+        return {'experience_level': 'unknown', 'role_category': 'other'}
+    
+    experience_level, role_category = classify_normalized_title(normalize_job_title(job_title))
     return {
-        'experience_level': extract_experience_level(job_title),
-        'role_category': extract_role_category(job_title)
+        'experience_level': experience_level,
+        'role_category': role_category
     }
 
+def get_tailoring_experience_level(job_title: str) -> str:
+    """
+    Experience level on the coarser scale used by job description analysis
+    and resume tailoring. Returns: 'entry', 'mid' or 'senior'
+    """
+    return TAILORING_EXPERIENCE_LEVELS[extract_experience_level(job_title)]
+
+def analyze_job_titles(job_titles: List[str]) -> List[Dict[str, str]]:
+    """
+    Analyze a whole list of job titles in one call.
+    Each distinct title is classified once and shared by its duplicates.
+    """
+    analyses = {}
+    results = []
+    for job_title in job_titles:
+        analysis = analyses.get(job_title)
+        if analysis is None:
+            analysis = analyses[job_title] = analyze_job_title(job_title)
+        results.append(analysis)
+    return results
+
+# Display names and color classes, shared by the per-title helpers and the columnar batch
+EXPERIENCE_LEVEL_DISPLAY = {
+    'intern': 'Intern',
+    'entry': 'Entry Level',
+    'mid': 'Mid Level',
+    'senior': 'Senior',
+    'expert': 'Expert/Leadership',
+    'unknown': 'Unknown'
+}
+
+ROLE_CATEGORY_DISPLAY = {
+    'engineering': 'Engineering',
+    'data_science': 'Data Science & AI',
+    'product': 'Product & Program Management',
+    'design': 'Design & UX',
+    'marketing': 'Marketing & Communications',
+    'sales': 'Sales & Business Development',
+    'operations': 'Operations & Strategy',
+    'finance': 'Finance & Accounting',
+    'hr': 'Human Resources',
+    'legal': 'Legal & Compliance',
+    'support': 'Customer Support',
+    'research': 'Research & Academia',
+    'management': 'Management & Leadership',
+    'other': 'Other'
+}
+
+EXPERIENCE_LEVEL_COLORS = {
+    'intern': 'info',
+    'entry': 'success',
+    'mid': 'primary',
+    'senior': 'warning',
+    'expert': 'danger',
+    'unknown': 'secondary'
+}
+
+ROLE_CATEGORY_COLORS = {
+    'engineering': 'primary',
+    'data_science': 'info',
+    'product': 'success',
+    'design': 'warning',
+    'marketing': 'danger',
+    'sales': 'dark',
+    'operations': 'secondary',
+    'finance': 'success',
+    'hr': 'info',
+    'legal': 'dark',
+    'support': 'secondary',
+    'research': 'info',
+    'management': 'danger',
+    'other': 'light'
+}
+
 def get_experience_level_display(level: str) -> str:
     """
     Get display name for experience level
     """
-    display_names = {
-        'intern': 'Intern',
-        'entry': 'Entry Level',
-        'mid': 'Mid Level',
-        'senior': 'Senior',
-        'expert': 'Expert/Leadership',
-        'unknown': 'Unknown'
-    }
-    return display_names.get(level, 'Unknown')
+    return EXPERIENCE_LEVEL_DISPLAY.get(level, 'Unknown')
 
 def get_role_category_display(category: str) -> str:
     """
     Get display name for role category
     """
-    display_names = {
-        'engineering': 'Engineering',
-        'data_science': 'Data Science & AI',
-        'product': 'Product & Program Management',
-        'design': 'Design & UX',
-        'marketing': 'Marketing & Communications',
-        'sales': 'Sales & Business Development',
-        'operations': 'Operations & Strategy',
-        'finance': 'Finance & Accounting',
-        'hr': 'Human Resources',
-        'legal': 'Legal & Compliance',
-        'support': 'Customer Support',
-        'research': 'Research & Academia',
-        'management': 'Management & Leadership',
-        'other': 'Other'
-    }
-    return display_names.get(category, 'Other')
+    return ROLE_CATEGORY_DISPLAY.get(category, 'Other')
 
 def get_experience_level_color(level: str) -> str:
     """
     Get color class for experience level
     """
-    colors = {
-        'intern': 'info',
-        'entry': 'success',
-        'mid': 'primary',
-        'senior': 'warning',
-        'expert': 'danger',
-        'unknown': 'secondary'
-    }
-    return colors.get(level, 'secondary')
+    return EXPERIENCE_LEVEL_COLORS.get(level, 'secondary')
 
 def get_role_category_color(category: str) -> str:
     """
     Get color class for role category
     """
-    colors = {
-        'engineering': 'primary',
-        'data_science': 'info',
-        'product': 'success',
-        'design': 'warning',
-        'marketing': 'danger',
-        'sales': 'dark',
-        'operations': 'secondary',
-        'finance': 'success',
-        'hr': 'info',
-        'legal': 'dark',
-        'support': 'secondary',
-        'research': 'info',
-        'management': 'danger',
-        'other': 'light'
+    return ROLE_CATEGORY_COLORS.get(category, 'light')
+
+# Category codes for the columnar batch: position in these tuples
+EXPERIENCE_LEVEL_CODES = tuple(EXPERIENCE_LEVEL_DISPLAY)
+ROLE_CATEGORY_CODES = tuple(ROLE_CATEGORY_DISPLAY)
+
+# Code -> value lookup tables for each output column
+TITLE_COLUMN_TABLES = {
+    'experience_level': ('experience', EXPERIENCE_LEVEL_CODES),
+    'role_category': ('role', ROLE_CATEGORY_CODES),
+    'experience_display': ('experience', tuple(EXPERIENCE_LEVEL_DISPLAY[level] for level in EXPERIENCE_LEVEL_CODES)),
+    'role_display': ('role', tuple(ROLE_CATEGORY_DISPLAY[category] for category in ROLE_CATEGORY_CODES)),
+    'experience_color': ('experience', tuple(EXPERIENCE_LEVEL_COLORS[level] for level in EXPERIENCE_LEVEL_CODES)),
+    'role_color': ('role', tuple(ROLE_CATEGORY_COLORS[category] for category in ROLE_CATEGORY_CODES)),
+}
+
+def factorize_titles(job_titles: List[str]) -> Tuple[List[str], List[int]]:
+    """
+    Split a title column into (distinct titles, row -> distinct index).
+    """
+    index = {}
+    inverse = [index.setdefault(job_title, len(index)) for job_title in job_titles]
+    return list(index), inverse
+
+def classify_title_codes(job_titles: List[str]) -> Dict[str, List[int]]:
+    """
+    Experience and role category codes for every row of a title column.
+    Only the distinct titles are classified; rows pick up their codes by index.
+    """
+    unique_titles, inverse = factorize_titles(job_titles)
+    unique_experience = []
+    unique_role = []
+    for job_title in unique_titles:
+        analysis = analyze_job_title(job_title)
+        unique_experience.append(EXPERIENCE_LEVEL_CODES.index(analysis['experience_level']))
+        unique_role.append(ROLE_CATEGORY_CODES.index(analysis['role_category']))
+
+    return {
+        'experience': [unique_experience[i] for i in inverse],
+        'role': [unique_role[i] for i in inverse]
+    }
+
+def classify_title_columns(job_titles: List[str]) -> Dict[str, List[str]]:
+    """
+    Columnar batch classification.
+    Returns one list per field (experience_level, role_category, experience_display,
+    role_display, experience_color, role_color), each aligned with job_titles.
+    """
+    codes = classify_title_codes(job_titles)
+    return {
+        field: [table[code] for code in codes[code_column]]
+        for field, (code_column, table) in TITLE_COLUMN_TABLES.items()
     }
-    return colors.get(category, 'light') 
\ No newline at end of file
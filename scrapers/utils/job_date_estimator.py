@@ -1,4 +1,7 @@
+import asyncio
+import hashlib
 import requests
+from concurrent.futures import ThreadPoolExecutor
 import time
 import re
 from datetime import datetime, timedelta
@@ -6,19 +9,103 @@ from bs4 import BeautifulSoup
 import json
 import logging
 from urllib.parse import quote_plus, urljoin
-import random
 import os
 import pickle
+from .cache_utils import TTLLRUCache
+from .date_display import confidence_color, relative_date_label, to_epoch
+from .rate_limit import AsyncRateLimiter
+from .sqlite_cache import SQLiteCache
 
 logger = logging.getLogger(__name__)
 
+# Pattern guesses are refreshed daily; dates found on job platforms are kept longer
+PATTERN_CACHE_TTL = 24 * 3600
+EXTERNAL_CACHE_TTL = 7 * 24 * 3600
+
+# Search result page per platform; {query} is the URL-encoded search string
+PLATFORM_SEARCH_URLS = {
+    'LinkedIn': 'https://www.linkedin.com/jobs/search/?keywords={query}',
+    'Indeed': 'https://www.indeed.com/jobs?q={query}',
+    'Glassdoor': 'https://www.glassdoor.com/Job/jobs.htm?sc.keyword={query}',
+    'ZipRecruiter': 'https://www.ziprecruiter.com/candidate/search?search={query}'
+}
+
+# (result card tag, card class, look for a <time> element first) per platform
+PLATFORM_RESULT_SELECTORS = {
+    'LinkedIn': ('div', 'job-search-card', True),
+    'Indeed': ('div', 'job_seen_beacon', False),
+    'Glassdoor': ('li', 'react-job-listing', False),
+    'ZipRecruiter': ('article', 'job_result', True)
+}
+
+# Common patterns that indicate recent postings
+RECENT_INDICATORS = [
+    'urgent', 'immediate', 'asap', 'quick', 'fast',
+    'new', 'recent', 'fresh', 'latest'
+]
+
+# Patterns that might indicate older postings
+OLDER_INDICATORS = [
+    'senior', 'lead', 'principal', 'staff', 'director',
+    'vp', 'head', 'chief', 'manager'
+]
+
+RELATIVE_DATE_PATTERN = re.compile(r'\d+ (day|week|month|hour)s? ago')
+
+def stable_offset(low, high, *parts):
+    """Integer in [low, high] picked by a hash of parts - the same on every run and every worker"""
+    key = "|".join(str(part or '').lower().strip() for part in parts)
+    digest = hashlib.sha1(key.encode('utf-8')).digest()
+    return low + int.from_bytes(digest[:4], 'big') % (high - low + 1)
+
+def estimate_date_from_patterns(job_title, company_name='', location=None, first_seen=None):
+    """
+    Deterministic posted date guess from job title patterns.
+    The title picks the range, a hash of (title, company, location) picks the
+    day within it. The guess is anchored at first_seen (unix time the job was
+    first scraped) when known, otherwise at today's midnight.
+    """
+    title_lower = (job_title or '').lower()
+    
+    # Check for recent indicators
+    has_recent = any(indicator in title_lower for indicator in RECENT_INDICATORS)
+    has_older = any(indicator in title_lower for indicator in OLDER_INDICATORS)
+    
+    if has_recent:
+        # Recent posting: 1-7 days ago
+        low, high, confidence = 1, 7, 'low'
+    elif has_older:
+        # Older posting: 2-4 weeks ago
+        low, high, confidence = 14, 28, 'low'
+    else:
+        # Default: 1-2 weeks ago
+        low, high, confidence = 7, 14, 'very_low'
+    days_ago = stable_offset(low, high, job_title, company_name, location)
+    
+    if first_seen:
+        anchor = datetime.fromtimestamp(first_seen)
+        date_range = f"{days_ago} days before first seen (estimated)"
+    else:
+        anchor = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        date_range = f"{days_ago} days ago (estimated)"
+    
+    return {
+        'estimated_date': anchor - timedelta(days=days_ago),
+        'confidence': confidence,
+        'source': 'pattern_analysis',
+        'date_range': date_range
+    }
+
 class JobDateEstimator:
     """
     Estimates job posted dates by searching multiple job platforms
     Optimized for performance with caching and pattern analysis
     """
     
-    def __init__(self, cache_file='date_cache.pkl', use_external_apis=False):
+    def __init__(self, cache_file='date_cache.db', use_external_apis=False,
+                 legacy_cache_file='date_cache.pkl', memory_cache_size=5000,
+                 pattern_cache_ttl=PATTERN_CACHE_TTL, external_cache_ttl=EXTERNAL_CACHE_TTL,
+                 platform_urls=None, max_concurrency=10):
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
@@ -28,26 +115,102 @@ class JobDateEstimator:
         self.request_delay = 2  # seconds between requests
         self.last_request_time = 0
         self.use_external_apis = use_external_apis  # Disable external APIs by default for speed
+        # Platforms searched in accurate mode, overridable (e.g. to point at a local stub server)
+        self.platform_urls = dict(PLATFORM_SEARCH_URLS, **(platform_urls or {}))
+        self.max_concurrency = max_concurrency  # jobs estimated at once by the batch estimator
+        # Own pool for platform lookups, so a batch can return while slower lookups finish
+        lookup_workers = max_concurrency * len(self.platform_urls)
+        self.lookup_executor = ThreadPoolExecutor(max_workers=lookup_workers, thread_name_prefix='date-lookup')
+        # Keep-alive connections for every concurrent lookup
+        adapter = requests.adapters.HTTPAdapter(pool_connections=len(self.platform_urls), pool_maxsize=lookup_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.cache_file = cache_file
-        self.cache = self._load_cache()
+        self.pattern_cache_ttl = pattern_cache_ttl
+        self.external_cache_ttl = external_cache_ttl
+        # Bounded in-memory tier in front of the persistent store
+        self.cache = TTLLRUCache(max_size=memory_cache_size)
+        # Per-key reads and batched writes; nothing is loaded up front
+        self.store = SQLiteCache(cache_file, table='date_estimates', default_ttl=external_cache_ttl)
+        self._import_legacy_cache(legacy_cache_file)
         
-    def _load_cache(self):
-        """Load cached date estimates"""
+    def _import_legacy_cache(self, legacy_cache_file):
+        """One-time import of the old pickle cache into the SQLite store"""
+        if not legacy_cache_file or not os.path.exists(legacy_cache_file):
+            return
         try:
-            if os.path.exists(self.cache_file):
-                with open(self.cache_file, 'rb') as f:
-                    return pickle.load(f)
+            with open(legacy_cache_file, 'rb') as f:
+                legacy_cache = pickle.load(f)
+            # Old entries were never refreshed, treat them like pattern guesses
+            self.store.set_many(
+                ((key, self._serialize_result(result)) for key, result in legacy_cache.items()),
+                ttl=self.pattern_cache_ttl
+            )
+            self.store.commit()
+            os.rename(legacy_cache_file, legacy_cache_file + '.imported')
+            logger.info(f"Imported {len(legacy_cache)} cached dates from {legacy_cache_file}")
         except Exception as e:
-            logger.warning(f"Could not load cache: {e}")
-        return {}
+            logger.warning(f"Could not import legacy cache: {e}")
     
-    def _save_cache(self):
-        """Save cached date estimates"""
-        try:
-            with open(self.cache_file, 'wb') as f:
-                pickle.dump(self.cache, f)
-        except Exception as e:
-            logger.warning(f"Could not save cache: {e}")
+    def _serialize_result(self, result):
+        """JSON-safe copy of an estimate (dates as ISO strings, no display fields)"""
+        stored = {
+            key: value for key, value in result.items()
+            if key not in ('posted_date_display', 'posted_date_color')
+        }
+        if isinstance(stored.get('estimated_date'), datetime):
+            stored['estimated_date'] = stored['estimated_date'].isoformat()
+        return stored
+    
+    def _deserialize_result(self, stored):
+        """Inverse of _serialize_result"""
+        if isinstance(stored.get('estimated_date'), str):
+            try:
+                stored['estimated_date'] = datetime.fromisoformat(stored['estimated_date'])
+            except ValueError:
+                pass
+        return stored
+    
+    def is_pattern_result(self, result):
+        """True for guesses from title patterns rather than a platform date"""
+        return result.get('source') in (None, 'pattern_analysis')
+    
+    def _cache_ttl(self, result):
+        """Seconds an estimate stays cached, shorter for pattern guesses"""
+        if self.is_pattern_result(result):
+            return self.pattern_cache_ttl
+        return self.external_cache_ttl
+    
+    def _get_cached_result(self, cache_key):
+        """Look in the memory tier, then the persistent store"""
+        cached_result = self.cache.get(cache_key)
+        if cached_result is None:
+            stored = self.store.get(cache_key)
+            if stored is None:
+                return None
+            cached_result = self._deserialize_result(stored)
+            self.cache.set(cache_key, cached_result, ttl=self._cache_ttl(cached_result))
+        # Callers add display fields, keep the cached dict clean
+        return dict(cached_result)
+    
+    def _cache_result(self, cache_key, result):
+        """Write an estimate to both tiers with its TTL"""
+        ttl = self._cache_ttl(result)
+        stored = self._serialize_result(result)
+        self.store.set(cache_key, stored, ttl=ttl)
+        self.cache.set(cache_key, self._deserialize_result(dict(stored)), ttl=ttl)
+    
+    def flush_cache(self):
+        """Commit pending cache writes, e.g. after a batch of estimates"""
+        self.store.commit()
+    
+    def cache_stats(self):
+        """Memory tier hit/miss/eviction stats plus the persistent store size"""
+        stats = self.cache.stats()
+        stats['store_size'] = len(self.store)
+        stats['pattern_ttl'] = self.pattern_cache_ttl
+        stats['external_ttl'] = self.external_cache_ttl
+        return stats
     
     def _get_cache_key(self, job_title, company_name, location=None):
         """Generate cache key for a job"""
@@ -68,7 +231,13 @@ class JobDateEstimator:
             time.sleep(sleep_time)
         self.last_request_time = time.time()
     
-    def estimate_job_date(self, job_title, company_name, location=None):
+    def _with_display_fields(self, result):
+        """Add display formatting to an estimate"""
+        result['posted_date_display'] = self.format_date_for_display(result.get('estimated_date'))
+        result['posted_date_color'] = self.get_confidence_color(result.get('confidence', 'low'))
+        return result
+    
+    def estimate_job_date(self, job_title, company_name, location=None, first_seen=None):
         """
         Estimate job posted date - optimized for performance
         
@@ -76,193 +245,202 @@ class JobDateEstimator:
             job_title (str): Job title to search for
             company_name (str): Company name
             location (str): Optional location
+            first_seen (int): Optional unix time the job was first scraped, anchors pattern guesses
             
         Returns:
             dict: Contains estimated_date, confidence, and source
         """
         # Check cache first
         cache_key = self._get_cache_key(job_title, company_name, location)
-        if cache_key in self.cache:
-            cached_result = self.cache[cache_key]
-            # Add display formatting
-            cached_result['posted_date_display'] = self.format_date_for_display(cached_result.get('estimated_date'))
-            cached_result['posted_date_color'] = self.get_confidence_color(cached_result.get('confidence', 'low'))
-            return cached_result
+        cached_result = self._get_cached_result(cache_key)
+        if cached_result is not None:
+            return self._with_display_fields(cached_result)
         
         # Use pattern analysis by default (fast)
         if not self.use_external_apis:
-            result = self._estimate_based_on_patterns(job_title)
+            result = self._estimate_based_on_patterns(job_title, company_name, location, first_seen)
         else:
             # Try external platforms only if explicitly enabled
             result = self._try_external_platforms(job_title, company_name, location)
             if not result.get('estimated_date'):
-                result = self._estimate_based_on_patterns(job_title)
+                result = self._estimate_based_on_patterns(job_title, company_name, location, first_seen)
         
-        # Cache the result
-        self.cache[cache_key] = result
-        self._save_cache()
+        # Cache the result (committed in batches by the store)
+        self._cache_result(cache_key, result)
         
-        # Add display formatting
-        result['posted_date_display'] = self.format_date_for_display(result.get('estimated_date'))
-        result['posted_date_color'] = self.get_confidence_color(result.get('confidence', 'low'))
+        return self._with_display_fields(result)
+    
+    def get_cached_estimate(self, job_title, company_name, location=None):
+        """Cached estimate with display fields, or None. Never computes or fetches anything"""
+        cached_result = self._get_cached_result(self._get_cache_key(job_title, company_name, location))
+        if cached_result is None:
+            return None
+        return self._with_display_fields(cached_result)
+    
+    def estimate_from_patterns(self, job_title, company_name='', location=None, first_seen=None):
+        """Uncached pattern guess with display fields, used as a provisional date"""
+        return self._with_display_fields(
+            self._estimate_based_on_patterns(job_title, company_name, location, first_seen)
+        )
+    
+    def estimate_job_dates(self, jobs, use_external_apis=None):
+        """
+        Estimate dates for many jobs at once (see estimate_job_dates_async)
         
-        return result
+        Args:
+            jobs (list): dicts with 'title', 'company' and optional 'location' / 'first_seen'
+            use_external_apis (bool): override the estimator's mode for this batch
+            
+        Returns:
+            list: one result per job, in order
+        """
+        return asyncio.run(self.estimate_job_dates_async(jobs, use_external_apis))
     
-    def _try_external_platforms(self, job_title, company_name, location=None):
-        """Try external platforms for date estimation"""
+    async def estimate_job_dates_async(self, jobs, use_external_apis=None):
+        """
+        Estimate dates for many jobs concurrently.
+        Up to max_concurrency jobs are in flight; each one queries every platform
+        at once and takes the first answer with a date. Requests to the same
+        platform are spaced request_delay apart across the whole batch.
+        """
+        if use_external_apis is None:
+            use_external_apis = self.use_external_apis
+        limiters = {platform: AsyncRateLimiter(self.request_delay) for platform in self.platform_urls}
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def estimate_one(job):
+            async with semaphore:
+                return await self._estimate_job_date_async(
+                    job['title'], job['company'], job.get('location'), job.get('first_seen'),
+                    limiters, use_external_apis
+                )
+        
+        results = await asyncio.gather(*(estimate_one(job) for job in jobs))
+        self.flush_cache()
+        return results
+    
+    async def _estimate_job_date_async(self, job_title, company_name, location, first_seen, limiters,
+                                       use_external_apis):
+        """Async counterpart of estimate_job_date"""
+        cache_key = self._get_cache_key(job_title, company_name, location)
+        cached_result = self._get_cached_result(cache_key)
+        # In accurate mode a cached pattern guess is upgraded rather than reused
+        if cached_result is not None and not (use_external_apis and self.is_pattern_result(cached_result)):
+            return self._with_display_fields(cached_result)
+        
+        if not use_external_apis:
+            result = self._estimate_based_on_patterns(job_title, company_name, location, first_seen)
+        else:
+            result = await self._try_external_platforms_async(job_title, company_name, location, limiters)
+            if not result.get('estimated_date'):
+                result = self._estimate_based_on_patterns(job_title, company_name, location, first_seen)
+        
+        self._cache_result(cache_key, result)
+        return self._with_display_fields(result)
+    
+    def _build_search_query(self, job_title, company_name, location=None):
         search_query = f"{job_title} {company_name}"
         if location:
             search_query += f" {location}"
-            
-        results = {
+        return search_query
+    
+    def _empty_platform_result(self):
+        return {
             'estimated_date': None,
             'confidence': 'low',
             'source': None,
             'date_range': None
         }
+    
+    def _try_external_platforms(self, job_title, company_name, location=None):
+        """Try external platforms for date estimation, one after another"""
+        search_query = self._build_search_query(job_title, company_name, location)
+        results = self._empty_platform_result()
         
         # Try multiple platforms
-        platforms = [
-            self._search_linkedin,
-            self._search_indeed,
-            self._search_glassdoor,
-            self._search_ziprecruiter
-        ]
-        
-        for platform_func in platforms:
-            try:
-                self._rate_limit()
-                platform_result = platform_func(search_query, company_name)
-                if platform_result and platform_result.get('date'):
-                    results.update(platform_result)
-                    break
-            except Exception as e:
-                logger.warning(f"Error searching {platform_func.__name__}: {e}")
-                continue
+        for platform in self.platform_urls:
+            self._rate_limit()
+            platform_result = self._search_platform(platform, search_query)
+            if platform_result and platform_result.get('estimated_date'):
+                results.update(platform_result)
+                break
         
         return results
     
-    def _search_linkedin(self, search_query, company_name):
-        """Search LinkedIn for job posting date"""
+    async def _try_external_platforms_async(self, job_title, company_name, location, limiters):
+        """Query every platform concurrently and return the first answer with a date"""
+        search_query = self._build_search_query(job_title, company_name, location)
+        
+        async def search(platform):
+            await limiters[platform].wait()
+            return await asyncio.get_running_loop().run_in_executor(
+                self.lookup_executor, self._search_platform, platform, search_query
+            )
+        
+        tasks = [asyncio.create_task(search(platform)) for platform in self.platform_urls]
         try:
-            # LinkedIn job search URL (public jobs)
-            search_url = f"https://www.linkedin.com/jobs/search/?keywords={quote_plus(search_query)}"
-            
-            response = self.session.get(search_url, timeout=10)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Look for job cards with posting dates
-                job_cards = soup.find_all('div', {'class': 'job-search-card'})
-                
-                for card in job_cards[:5]:  # Check first 5 results
-                    # Look for time posted indicators
-                    time_element = card.find('time') or card.find('span', string=re.compile(r'\d+ (day|week|month|hour)s? ago'))
-                    if time_element:
-                        date_text = time_element.get_text().strip()
-                        estimated_date = self._parse_relative_date(date_text)
-                        if estimated_date:
-                            return {
-                                'estimated_date': estimated_date,
-                                'confidence': 'medium',
-                                'source': 'LinkedIn'
-                            }
-                            
-        except Exception as e:
-            logger.warning(f"LinkedIn search error: {e}")
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    platform_result = task.result()
+                    if platform_result and platform_result.get('estimated_date'):
+                        results = self._empty_platform_result()
+                        results.update(platform_result)
+                        return results
+        finally:
+            # Slower platforms are no longer needed
+            for task in tasks:
+                task.cancel()
         
-        return None
+        return self._empty_platform_result()
     
-    def _search_indeed(self, search_query, company_name):
-        """Search Indeed for job posting date"""
+    def _search_platform(self, platform, search_query):
+        """Fetch one platform's search results and look for a posting date"""
         try:
-            # Indeed job search URL
-            search_url = f"https://www.indeed.com/jobs?q={quote_plus(search_query)}"
-            
+            search_url = self.platform_urls[platform].format(query=quote_plus(search_query))
             response = self.session.get(search_url, timeout=10)
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Look for job cards with posting dates
-                job_cards = soup.find_all('div', {'class': 'job_seen_beacon'})
-                
-                for card in job_cards[:5]:
-                    # Look for date posted
-                    date_element = card.find('span', string=re.compile(r'\d+ (day|week|month|hour)s? ago'))
-                    if date_element:
-                        date_text = date_element.get_text().strip()
-                        estimated_date = self._parse_relative_date(date_text)
-                        if estimated_date:
-                            return {
-                                'estimated_date': estimated_date,
-                                'confidence': 'medium',
-                                'source': 'Indeed'
-                            }
-                            
+                return self._parse_platform_results(platform, response.content)
         except Exception as e:
-            logger.warning(f"Indeed search error: {e}")
+            logger.warning(f"{platform} search error: {e}")
         
         return None
     
-    def _search_glassdoor(self, search_query, company_name):
-        """Search Glassdoor for job posting date"""
-        try:
-            # Glassdoor job search URL
-            search_url = f"https://www.glassdoor.com/Job/jobs.htm?sc.keyword={quote_plus(search_query)}"
-            
-            response = self.session.get(search_url, timeout=10)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Look for job listings with dates
-                job_listings = soup.find_all('li', {'class': 'react-job-listing'})
-                
-                for listing in job_listings[:5]:
-                    date_element = listing.find('span', string=re.compile(r'\d+ (day|week|month|hour)s? ago'))
-                    if date_element:
-                        date_text = date_element.get_text().strip()
-                        estimated_date = self._parse_relative_date(date_text)
-                        if estimated_date:
-                            return {
-                                'estimated_date': estimated_date,
-                                'confidence': 'medium',
-                                'source': 'Glassdoor'
-                            }
-                            
-        except Exception as e:
-            logger.warning(f"Glassdoor search error: {e}")
+    def _parse_platform_results(self, platform, content):
+        """Find the first relative posting date in a platform's result cards"""
+        tag, css_class, check_time = PLATFORM_RESULT_SELECTORS[platform]
+        soup = BeautifulSoup(content, 'html.parser')
+        
+        for card in soup.find_all(tag, {'class': css_class})[:5]:  # Check first 5 results
+            # Look for time posted indicators
+            date_element = (card.find('time') if check_time else None) or card.find('span', string=RELATIVE_DATE_PATTERN)
+            if date_element:
+                estimated_date = self._parse_relative_date(date_element.get_text().strip())
+                if estimated_date:
+                    return {
+                        'estimated_date': estimated_date,
+                        'confidence': 'medium',
+                        'source': platform
+                    }
         
         return None
     
+    def _search_linkedin(self, search_query, company_name):
+        """Search LinkedIn for job posting date"""
+        return self._search_platform('LinkedIn', search_query)
+    
+    def _search_indeed(self, search_query, company_name):
+        """Search Indeed for job posting date"""
+        return self._search_platform('Indeed', search_query)
+    
+    def _search_glassdoor(self, search_query, company_name):
+        """Search Glassdoor for job posting date"""
+        return self._search_platform('Glassdoor', search_query)
+    
     def _search_ziprecruiter(self, search_query, company_name):
         """Search ZipRecruiter for job posting date"""
-        try:
-            # ZipRecruiter job search URL
-            search_url = f"https://www.ziprecruiter.com/candidate/search?search={quote_plus(search_query)}"
-            
-            response = self.session.get(search_url, timeout=10)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Look for job cards with dates
-                job_cards = soup.find_all('article', {'class': 'job_result'})
-                
-                for card in job_cards[:5]:
-                    date_element = card.find('time') or card.find('span', string=re.compile(r'\d+ (day|week|month|hour)s? ago'))
-                    if date_element:
-                        date_text = date_element.get_text().strip()
-                        estimated_date = self._parse_relative_date(date_text)
-                        if estimated_date:
-                            return {
-                                'estimated_date': estimated_date,
-                                'confidence': 'medium',
-                                'source': 'ZipRecruiter'
-                            }
-                            
-        except Exception as e:
-            logger.warning(f"ZipRecruiter search error: {e}")
-        
-        return None
+        return self._search_platform('ZipRecruiter', search_query)
     
     def _parse_relative_date(self, date_text):
         """Parse relative date strings like '2 days ago', '1 week ago'"""
@@ -293,87 +471,20 @@ class JobDateEstimator:
         
         return None
     
-    def _estimate_based_on_patterns(self, job_title):
+    def _estimate_based_on_patterns(self, job_title, company_name='', location=None, first_seen=None):
         """Estimate date based on job title patterns and common posting behaviors"""
-        title_lower = job_title.lower()
-        
-        # Common patterns that indicate recent postings
-        recent_indicators = [
-            'urgent', 'immediate', 'asap', 'quick', 'fast',
-            'new', 'recent', 'fresh', 'latest'
-        ]
-        
-        # Patterns that might indicate older postings
-        older_indicators = [
-            'senior', 'lead', 'principal', 'staff', 'director',
-            'vp', 'head', 'chief', 'manager'
-        ]
-        
-        # Check for recent indicators
-        has_recent = any(indicator in title_lower for indicator in recent_indicators)
-        has_older = any(indicator in title_lower for indicator in older_indicators)
-        
-        now = datetime.now()
-        
-        if has_recent:
-            # Recent posting: 1-7 days ago
-            days_ago = random.randint(1, 7)
-            estimated_date = now - timedelta(days=days_ago)
-            confidence = 'low'
-        elif has_older:
-            # Older posting: 2-4 weeks ago
-            days_ago = random.randint(14, 28)
-            estimated_date = now - timedelta(days=days_ago)
-            confidence = 'low'
-        else:
-            # Default: 1-2 weeks ago
-            days_ago = random.randint(7, 14)
-            estimated_date = now - timedelta(days=days_ago)
-            confidence = 'very_low'
-        
-        return {
-            'estimated_date': estimated_date,
-            'confidence': confidence,
-            'source': 'pattern_analysis',
-            'date_range': f"{days_ago} days ago (estimated)"
-        }
+        return estimate_date_from_patterns(job_title, company_name, location, first_seen)
     
     def format_date_for_display(self, date_obj):
         """Format date for display in the UI"""
-        if not date_obj:
-            return "Unknown"
-        
-        if isinstance(date_obj, str):
-            try:
-                date_obj = datetime.fromisoformat(date_obj.replace('Z', '+00:00'))
-            except:
-                return date_obj
-        
-        now = datetime.now()
-        diff = now - date_obj
-        
-        if diff.days == 0:
-            return "Today"
-        elif diff.days == 1:
-            return "Yesterday"
-        elif diff.days < 7:
-            return f"{diff.days} days ago"
-        elif diff.days < 30:
-            weeks = diff.days // 7
-            return f"{weeks} week{'s' if weeks > 1 else ''} ago"
-        else:
-            months = diff.days // 30
-            return f"{months} month{'s' if months > 1 else ''} ago"
+        epoch = to_epoch(date_obj)
+        if epoch is None and isinstance(date_obj, str) and date_obj:
+            return date_obj
+        return relative_date_label(epoch)
     
     def get_confidence_color(self, confidence):
         """Get color class for confidence level"""
-        confidence_colors = {
-            'high': 'success',
-            'medium': 'warning', 
-            'low': 'info',
-            'very_low': 'secondary'
-        }
-        return confidence_colors.get(confidence, 'secondary')
+        return confidence_color(confidence)
     
     def enable_external_apis(self):
         """Enable external API calls for more accurate dates"""
@@ -387,7 +498,6 @@ class JobDateEstimator:
     
     def clear_cache(self):
         """Clear the date estimation cache"""
-        self.cache = {}
-        if os.path.exists(self.cache_file):
-            os.remove(self.cache_file)
+        self.cache.clear()
+        self.store.clear()
         logger.info("Date estimation cache cleared") 
\ No newline at end of file
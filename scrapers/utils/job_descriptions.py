@@ -0,0 +1,93 @@
+import base64
+import hashlib
+import zlib
+from typing import Any, Dict, Optional
+
+from .page_fetcher import extract_page_text
+from .sqlite_cache import SQLiteCache
+
+DESCRIPTION_STORE_FILE = 'description_store.db'
+
+def description_hash(text: str) -> str:
+    """Stable hash of a job description's text (whitespace-insensitive)"""
+    return hashlib.sha256(' '.join(text.split()).encode('utf-8')).hexdigest()
+
+def compress_description(text: str) -> str:
+    """zlib-compressed, base64-encoded text, small enough to keep on every scraped item"""
+    return base64.b64encode(zlib.compress(text.encode('utf-8'), 9)).decode('ascii')
+
+def decompress_description(value: Optional[str]) -> str:
+    """Text of a compressed description, "" for a missing or unreadable value"""
+    if not value:
+        return ''
+    try:
+        return zlib.decompress(base64.b64decode(value)).decode('utf-8')
+    except (ValueError, zlib.error):
+        return ''
+
+def job_description(job: Dict[str, Any]) -> str:
+    """A scraped job's description, plain or compressed"""
+    return job.get('description') or decompress_description(job.get('description_compressed'))
+
+class DescriptionStore:
+    """
+    Descriptions extracted from posting pages, keyed by posting URL.
+    Each entry keeps the page's ETag/Last-Modified, so a re-crawl can ask for
+    the page conditionally and reuse the stored description on a 304. A page
+    downloaded again whose text hashes the same (per-request tokens and
+    nonces aside) keeps its stored, already compressed description.
+    """
+
+    def __init__(self, cache_file: str = DESCRIPTION_STORE_FILE):
+        self.store = SQLiteCache(cache_file, table='descriptions')
+        self.stats = {'extracted': 0, 'unchanged': 0, 'not_modified': 0}
+
+    def validators(self, job_url: str) -> Dict[str, str]:
+        """Conditional request headers for a posting stored with an ETag or Last-Modified"""
+        stored = self.store.get(job_url)
+        headers = {}
+        if stored and stored.get('etag'):
+            headers['If-None-Match'] = stored['etag']
+        if stored and stored.get('last_modified'):
+            headers['If-Modified-Since'] = stored['last_modified']
+        return headers
+
+    def not_modified(self, job_url: str) -> Optional[Dict[str, str]]:
+        """{description_hash, description_compressed} for a posting answered with a 304, None if it isn't stored"""
+        stored = self.store.get(job_url)
+        if not stored:
+            return None
+        self.stats['not_modified'] += 1
+        return self._fields(stored)
+
+    def describe(self, job_url: str, page: bytes, etag: Optional[str] = None,
+                 last_modified: Optional[str] = None) -> Dict[str, str]:
+        """{description_hash, description_compressed} for a downloaded posting page"""
+        text = extract_page_text(page)
+        text_hash = description_hash(text)
+        stored = self.store.get(job_url)
+        if stored and stored['description_hash'] == text_hash:
+            self.stats['unchanged'] += 1
+            compressed = stored['description_compressed']
+            if (stored.get('etag'), stored.get('last_modified')) == (etag, last_modified):
+                return self._fields(stored)
+        else:
+            self.stats['extracted'] += 1
+            compressed = compress_description(text)
+        stored = {
+            'description_hash': text_hash,
+            'description_compressed': compressed,
+            'etag': etag,
+            'last_modified': last_modified
+        }
+        self.store.set(job_url, stored)
+        return self._fields(stored)
+
+    def _fields(self, stored: Dict[str, Any]) -> Dict[str, str]:
+        return {
+            'description_hash': stored['description_hash'],
+            'description_compressed': stored['description_compressed']
+        }
+
+    def close(self):
+        self.store.close()
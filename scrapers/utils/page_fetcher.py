@@ -0,0 +1,124 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Optional
+
+import lxml.etree
+import lxml.html
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .sqlite_cache import SQLiteCache
+
+logger = logging.getLogger(__name__)
+
+PAGE_CACHE_FILE = 'page_cache.db'
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# Elements whose text never belongs to the page copy
+NON_CONTENT_TAGS = ('script', 'style', 'noscript', 'template')
+
+def clean_page_text(text: str) -> str:
+    """Collapse a page's raw text into single-spaced phrases"""
+    lines = (line.strip() for line in text.splitlines())
+    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+    return ' '.join(chunk for chunk in chunks if chunk)
+
+def extract_page_text(content: bytes) -> str:
+    """Visible text of an HTML page, parsed with lxml (BeautifulSoup for documents lxml rejects)"""
+    try:
+        tree = lxml.html.fromstring(content)
+        lxml.etree.strip_elements(tree, lxml.etree.Comment, *NON_CONTENT_TAGS, with_tail=False)
+        text = tree.text_content()
+    except (lxml.etree.ParserError, ValueError):
+        soup = BeautifulSoup(content, 'html.parser')
+        for element in soup(list(NON_CONTENT_TAGS)):
+            element.decompose()
+        text = soup.get_text()
+    return clean_page_text(text)
+
+class PageFetcher:
+    """
+    Fetches job pages and returns their text.
+    One pooled keep-alive session is shared by every request, and pages are
+    kept in an on-disk cache with their ETag/Last-Modified validators, so a
+    repeat fetch is a conditional GET that costs a 304 instead of a download
+    and a re-parse.
+    """
+
+    def __init__(self, cache_file: Optional[str] = PAGE_CACHE_FILE, max_workers: int = 8,
+                 timeout: Any = (3.05, 10), max_age: float = 0, headers: Optional[Dict[str, str]] = None):
+        self.max_workers = max_workers
+        self.timeout = timeout  # (connect, read) seconds
+        self.max_age = max_age  # seconds a cached page is used without revalidating
+        self.cache = SQLiteCache(cache_file, table='pages') if cache_file else None
+
+        self.session = requests.Session()
+        self.session.headers.update(headers or DEFAULT_HEADERS)
+        retries = Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504), allowed_methods=('GET',))
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers, max_retries=retries)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self.stats = {'downloaded': 0, 'not_modified': 0, 'fresh': 0, 'errors': 0}
+
+    def fetch(self, url: str) -> str:
+        """Page text for url, or "" if it can't be fetched and isn't cached"""
+        cached = self.cache.get(url) if self.cache is not None else None
+        if cached and time.time() - cached['fetched_at'] < self.max_age:
+            self.stats['fresh'] += 1
+            return cached['text']
+
+        headers = {}
+        if cached and cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached and cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+        try:
+            response = self.session.get(url, headers=headers, timeout=self.timeout)
+            if response.status_code == 304 and cached:
+                self.stats['not_modified'] += 1
+                cached['fetched_at'] = time.time()
+                self.cache.set(url, cached)
+                return cached['text']
+
+            response.raise_for_status()
+            text = extract_page_text(response.content)
+            self.stats['downloaded'] += 1
+            if self.cache is not None:
+                self.cache.set(url, {
+                    'text': text,
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'fetched_at': time.time()
+                })
+            return text
+
+        except Exception as e:
+            self.stats['errors'] += 1
+            if cached:
+                logger.warning(f"⚠️ Error fetching {url}, using cached copy: {e}")
+                return cached['text']
+            logger.error(f"❌ Error fetching job description: {e}")
+            return ""
+
+    def fetch_many(self, urls: Iterable[str]) -> Dict[str, str]:
+        """{url: page text} for many pages, up to max_workers at a time"""
+        unique_urls = list(dict.fromkeys(urls))
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='page-fetch') as executor:
+            texts = executor.map(self.fetch, unique_urls)
+            results = dict(zip(unique_urls, texts))
+        if self.cache is not None:
+            self.cache.commit()
+        return results
+
+    def cache_stats(self) -> Dict[str, Any]:
+        stats = dict(self.stats)
+        stats['cached_pages'] = len(self.cache) if self.cache is not None else 0
+        return stats
@@ -0,0 +1,74 @@
+import asyncio
+import threading
+import time
+
+class AsyncRateLimiter:
+    """
+    Spaces out calls so at most one starts every `min_interval` seconds.
+    Each waiter reserves its slot under the lock and sleeps outside it,
+    so callers queue up without blocking the event loop.
+    """
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self.next_time = 0.0
+        self.lock = asyncio.Lock()
+
+    async def wait(self):
+        """Wait for the next free slot"""
+        async with self.lock:
+            now = time.monotonic()
+            delay = self.next_time - now
+            self.next_time = max(now, self.next_time) + self.min_interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+class RateLimiter:
+    """Thread counterpart of AsyncRateLimiter: at most one start every `min_interval` seconds"""
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self.next_time = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        """Block until the next free slot"""
+        with self.lock:
+            now = time.monotonic()
+            delay = self.next_time - now
+            self.next_time = max(now, self.next_time) + self.min_interval
+        if delay > 0:
+            time.sleep(delay)
+
+class AsyncTokenBucket:
+    """
+    Allows `rate` units (requests, LLM tokens...) per `per` seconds, with
+    bursts up to `capacity`. Like AsyncRateLimiter, each caller reserves its
+    units and sleeps off any debt outside the lock. The lock is a plain
+    threading lock (never held across an await), so one bucket can be shared
+    by every event loop and thread that talks to the same provider.
+    """
+
+    def __init__(self, rate: float, per: float = 60.0, capacity: float = None):
+        self.fill_rate = rate / per
+        self.capacity = capacity if capacity is not None else rate
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self, amount: float = 1) -> float:
+        """Take `amount` units now and return how long to wait before using them"""
+        # A request bigger than the bucket would never fit; let it through on a full bucket
+        amount = min(amount, self.capacity)
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.fill_rate)
+            self.updated = now
+            self.tokens -= amount
+            return -self.tokens / self.fill_rate if self.tokens < 0 else 0.0
+
+    async def acquire(self, amount: float = 1):
+        """Wait until `amount` units are available"""
+        delay = self.reserve(amount)
+        if delay > 0:
+            await asyncio.sleep(delay)
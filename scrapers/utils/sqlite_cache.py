@@ -0,0 +1,171 @@
+import atexit
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Sentinel for membership checks, so a stored None still counts as present
+_MISSING = object()
+
+class SQLiteCache:
+    """
+    Persistent key-value cache on SQLite in WAL mode.
+    Values are stored as JSON, entries can carry a TTL, and writes are
+    committed in batches instead of rewriting the whole store per miss.
+    Pending writes are buffered in memory so no write transaction is held
+    open between batches; other processes can use the same file meanwhile.
+    """
+
+    def __init__(self, db_path: str, table: str = 'cache', default_ttl: Optional[float] = None,
+                 commit_every: int = 100, commit_interval: float = 2.0):
+        self.db_path = db_path
+        self.table = table
+        self.default_ttl = default_ttl
+        self.commit_every = commit_every  # pending writes before a commit
+        self.commit_interval = commit_interval  # max seconds a write stays uncommitted
+
+        self.lock = threading.RLock()
+        self.pending_writes = {}  # key -> (value json, expires_at, updated_at), or None for a delete
+        self.last_commit_time = time.time()
+
+        self.connection = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL, updated_at REAL NOT NULL)"
+        )
+        self.connection.execute(f"CREATE INDEX IF NOT EXISTS {table}_expires_at ON {table} (expires_at)")
+        self.connection.commit()
+
+        # Don't lose the last batch when the process exits
+        atexit.register(self.close)
+
+    def _expires_at(self, ttl: Optional[float]) -> Optional[float]:
+        ttl = self.default_ttl if ttl is None else ttl
+        return time.time() + ttl if ttl else None
+
+    def _maybe_commit(self):
+        """Commit once enough writes are pending or the oldest one is getting stale"""
+        if (len(self.pending_writes) >= self.commit_every
+                or time.time() - self.last_commit_time >= self.commit_interval):
+            self.commit()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value for key, or default when missing or expired"""
+        with self.lock:
+            if key in self.pending_writes:
+                row = self.pending_writes[key]
+            else:
+                row = self.connection.execute(
+                    f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)
+                ).fetchone()
+        if row is None or (row[1] is not None and row[1] <= time.time()):
+            return default
+        return json.loads(row[0])
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Return {key: value} for the keys that are present and not expired"""
+        keys = list(keys)
+        rows = []
+        with self.lock:
+            stored_keys = []
+            for key in keys:
+                if key in self.pending_writes:
+                    if self.pending_writes[key] is not None:
+                        rows.append((key,) + self.pending_writes[key][:2])
+                else:
+                    stored_keys.append(key)
+
+            # Stay below SQLite's bound parameter limit
+            for start in range(0, len(stored_keys), 500):
+                chunk = stored_keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows.extend(self.connection.execute(
+                    f"SELECT key, value, expires_at FROM {self.table} WHERE key IN ({placeholders})", chunk
+                ).fetchall())
+
+        now = time.time()
+        return {
+            key: json.loads(value)
+            for key, value, expires_at in rows
+            if expires_at is None or expires_at > now
+        }
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """Store value under key. ttl in seconds, 0 for no expiry, None for the default"""
+        self.set_many([(key, value)], ttl)
+
+    def set_many(self, items: Iterable[Tuple[str, Any]], ttl: Optional[float] = None):
+        """Store several (key, value) pairs with the same ttl"""
+        now = time.time()
+        expires_at = self._expires_at(ttl)
+        rows = {key: (json.dumps(value), expires_at, now) for key, value in items}
+        with self.lock:
+            self.pending_writes.update(rows)
+            self._maybe_commit()
+
+    def delete(self, key: str):
+        """Remove a key if present"""
+        with self.lock:
+            self.pending_writes[key] = None
+            self._maybe_commit()
+
+    def purge_expired(self) -> int:
+        """Delete expired entries and return how many were removed"""
+        with self.lock:
+            self.commit()
+            with self.connection:
+                cursor = self.connection.execute(
+                    f"DELETE FROM {self.table} WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),)
+                )
+            return cursor.rowcount
+
+    def clear(self):
+        """Remove every entry"""
+        with self.lock:
+            self.pending_writes = {}
+            with self.connection:
+                self.connection.execute(f"DELETE FROM {self.table}")
+
+    def commit(self):
+        """Write pending changes to disk in one short transaction"""
+        with self.lock:
+            if self.pending_writes:
+                upserts = [(key,) + row for key, row in self.pending_writes.items() if row is not None]
+                deletes = [(key,) for key, row in self.pending_writes.items() if row is None]
+                with self.connection:
+                    self.connection.executemany(
+                        f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at, updated_at) "
+                        "VALUES (?, ?, ?, ?)", upserts
+                    )
+                    self.connection.executemany(f"DELETE FROM {self.table} WHERE key = ?", deletes)
+                self.pending_writes = {}
+            self.last_commit_time = time.time()
+
+    def close(self):
+        """Commit and close the connection. Safe to call more than once"""
+        with self.lock:
+            if self.connection is None:
+                return
+            try:
+                self.commit()
+                self.connection.close()
+            except sqlite3.Error as e:
+                logger.warning(f"Could not close cache {self.db_path}: {e}")
+            self.connection = None
+        atexit.unregister(self.close)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        with self.lock:
+            self.commit()
+            return self.connection.execute(
+                f"SELECT COUNT(*) FROM {self.table} WHERE expires_at IS NULL OR expires_at > ?", (time.time(),)
+            ).fetchone()[0]
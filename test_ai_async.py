@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Test script for concurrent AI processing and the token-bucket rate limiter
+Runs against the local chat-completions mock from test_ai_batch
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from scrapers.utils.ai_filter_processor import AIFilterProcessor
+from scrapers.utils.rate_limit import AsyncTokenBucket
+from test_ai_batch import HTTPChatClient, start_mock_server
+
+CITIES = [f'City{i}, ST' for i in range(40)]
+
+
+def create_processor(server, tmp_dir, **kwargs):
+    processor = AIFilterProcessor(
+        cache_file=os.path.join(tmp_dir, 'ai_cache.db'),
+        client=HTTPChatClient(f"http://127.0.0.1:{server.server_address[1]}"),
+        **kwargs
+    )
+    processor.retry_base_delay = 0.01
+    return processor
+
+
+def test_requests_run_concurrently():
+    """Batch requests overlap instead of running one at a time"""
+    print("🧪 Testing concurrent AI requests...")
+
+    server = start_mock_server()
+    server.latency = 0.1
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        processor = create_processor(server, tmp_dir, requests_per_minute=6000, max_concurrency=10)
+        jobs = [{'title': 'Engineer', 'location': city, 'company': 'Acme'} for city in CITIES]
+
+        start_time = time.perf_counter()
+        processed = asyncio.run(processor.process_jobs_async(jobs, batch_size=1))
+        elapsed = time.perf_counter() - start_time
+
+        # 40 location batches + 1 title + 1 company, 0.1s each
+        print(f"   {processor.request_count} requests in {elapsed:.2f}s, {server.max_in_flight} in flight")
+        assert processor.request_count == 42
+        assert server.max_in_flight == 10
+        assert elapsed < 42 * 0.1 / 3
+        assert [job['location_info']['cities'] for job in processed] == [[city.split(',')[0].lower()] for city in CITIES]
+        processor.response_cache.close()
+    server.shutdown()
+
+
+def test_rate_limited_requests_are_retried():
+    """429 answers are retried with backoff and every job still gets its answers"""
+    print("🧪 Testing 429 retries...")
+
+    server = start_mock_server()
+    server.rate_limit_next = 3
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        processor = create_processor(server, tmp_dir, requests_per_minute=6000)
+        jobs = [{'title': 'Senior Engineer', 'location': city, 'company': 'Acme'} for city in CITIES[:5]]
+
+        processed = processor.process_jobs(jobs)
+
+        # 3 batch requests plus the 3 rejected attempts, no single-request fallbacks
+        assert processor.request_count == 6
+        assert all(job['experience_level'] == 'senior' for job in processed)
+        assert all(job['location_info']['country'] == 'united states' for job in processed)
+        processor.response_cache.close()
+    server.shutdown()
+
+
+def test_failed_requests_fall_back_without_blocking():
+    """A single request that fails leaves the job to the rules, with no blocking call on the event loop"""
+    print("🧪 Testing the cache-only final pass...")
+
+    server = start_mock_server()
+    server.fail_inputs = ('Atlantis',)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        processor = create_processor(server, tmp_dir)
+        sync_calls = []
+        chat = processor._chat
+        processor._chat = lambda *args: sync_calls.append(args) or chat(*args)
+        jobs = [
+            {'title': 'Engineer', 'location': 'Atlantis', 'company': 'Acme Corp'},
+            {'title': 'Engineer', 'location': 'Boston, MA', 'company': 'Acme Corp'},
+        ]
+
+        processed = asyncio.run(processor.process_jobs_async(jobs))
+
+        # Failed location batch, single requests for both locations (Atlantis fails again), title and company batches
+        assert processor.request_count == 5
+        assert sync_calls == []
+        assert processed[0]['location_info']['raw_location'] == 'Atlantis'
+        assert processed[0]['location_info']['cities'] == []
+        assert processed[0]['ai_processed']
+        processor.response_cache.close()
+    server.shutdown()
+
+
+def test_progress_callback():
+    """Progress counts every answer needed, ending at (total, total)"""
+    server = start_mock_server()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        processor = create_processor(server, tmp_dir, requests_per_minute=6000)
+        jobs = [{'title': f'Engineer {i}', 'location': CITIES[i], 'company': 'Acme'} for i in range(10)]
+        updates = []
+
+        processor.process_jobs(jobs, batch_size=4, progress_callback=lambda done, total: updates.append((done, total)))
+
+        # 10 locations + 10 x (experience, role) + 1 company
+        assert updates[-1] == (31, 31)
+        assert [done for done, _ in updates] == sorted(done for done, _ in updates)
+
+        # A second run has nothing left to ask for
+        updates.clear()
+        processor.process_jobs(jobs, progress_callback=lambda done, total: updates.append((done, total)))
+        assert updates == []
+        processor.response_cache.close()
+    server.shutdown()
+
+
+def test_token_bucket_pacing():
+    """Requests and tokens beyond the burst capacity wait for the refill"""
+    print("🧪 Testing token buckets...")
+
+    async def acquire_all(bucket, amounts):
+        await asyncio.gather(*(bucket.acquire(amount) for amount in amounts))
+
+    # 20 requests/second with no burst: 5 requests need 4 refills
+    bucket = AsyncTokenBucket(20, per=1.0, capacity=1)
+    start_time = time.perf_counter()
+    asyncio.run(acquire_all(bucket, [1] * 5))
+    assert time.perf_counter() - start_time >= 0.19
+
+    # 1000 tokens/second, 100 token burst: 300 tokens need 0.2s
+    bucket = AsyncTokenBucket(1000, per=1.0, capacity=100)
+    start_time = time.perf_counter()
+    asyncio.run(acquire_all(bucket, [50] * 6))
+    assert time.perf_counter() - start_time >= 0.19
+
+    # The same bucket keeps its state across event loops
+    start_time = time.perf_counter()
+    asyncio.run(acquire_all(bucket, [100]))
+    assert time.perf_counter() - start_time >= 0.09
+
+
+if __name__ == "__main__":
+    test_requests_run_concurrently()
+    test_rate_limited_requests_are_retried()
+    test_failed_requests_fall_back_without_blocking()
+    test_progress_callback()
+    test_token_bucket_pacing()
+    print("\n🎉 Async AI processing tests completed!")
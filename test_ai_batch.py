@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Test script for batched AIFilterProcessor requests
+Runs against a local mock of the chat-completions API over HTTP
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import requests
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from scrapers.utils.ai_filter_processor import AIFilterProcessor
+
+# Per-request latency of the mock API
+MOCK_LATENCY = 0.02
+
+# Locations the mock can only answer one at a time (batch answers for them are invalid)
+BATCH_INVALID_LOCATIONS = {'Atlantis'}
+
+
+def answer_location(location):
+    city, _, state = location.partition(', ')
+    return {'country': 'united states', 'states': [state.lower()], 'cities': [city.lower()], 'is_remote': False}
+
+
+def answer_title(title):
+    experience = 'senior' if 'Senior' in title else 'mid'
+    role = 'data_science' if 'Data' in title else 'engineering'
+    return experience, role
+
+
+def answer_prompt(prompt):
+    """What the mock model says to a prompt"""
+    items = next((json.loads(line) for line in prompt.splitlines() if line.startswith('[{')), None)
+    if prompt.lstrip().startswith('Parse each job location'):
+        answers = []
+        for item in items:
+            if item['location'] in BATCH_INVALID_LOCATIONS:
+                answers.append({'id': item['id'], 'country': 'unknown'})
+            else:
+                answers.append(dict(answer_location(item['location']), id=item['id']))
+        return json.dumps(answers)
+    if prompt.lstrip().startswith('Classify each job'):
+        return json.dumps([
+            dict(zip(('experience_level', 'role_category'), answer_title(item['title'])), id=item['id'])
+            for item in items
+        ])
+    if prompt.lstrip().startswith('Normalize each company'):
+        return '```json\n' + json.dumps([
+            {'id': item['id'], 'normalized': item['company'].split(' ')[0]} for item in items
+        ]) + '\n```'
+
+    quoted = prompt.split('"')[1] if '"' in prompt else ''
+    if 'Parse this job location' in prompt:
+        return json.dumps(dict(answer_location(quoted), raw_location=quoted))
+    if 'experience level' in prompt:
+        return answer_title(quoted)[0]
+    if 'role category' in prompt:
+        return answer_title(quoted)[1]
+    if 'Normalize this company' in prompt:
+        return quoted.split(' ')[0]
+    return 'ok'
+
+
+class MockChatHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        prompt = body['messages'][0]['content']
+        with self.server.lock:
+            self.server.prompts.append(prompt)
+            rate_limited = self.server.rate_limit_next > 0
+            self.server.rate_limit_next -= rate_limited
+            failing = any(text in prompt for text in self.server.fail_inputs)
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(self.server.max_in_flight, self.server.in_flight)
+        time.sleep(self.server.latency)
+        with self.server.lock:
+            self.server.in_flight -= 1
+
+        if rate_limited or failing:
+            self.send_response(429 if rate_limited else 500)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        response = json.dumps({
+            'id': 'chatcmpl-mock', 'object': 'chat.completion', 'created': int(time.time()),
+            'model': body['model'],
+            'choices': [{'index': 0, 'finish_reason': 'stop',
+                         'message': {'role': 'assistant', 'content': answer_prompt(prompt)}}],
+            'usage': {'prompt_tokens': 0, 'completion_tokens': 0, 'total_tokens': 0},
+        }).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_mock_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), MockChatHandler)
+    server.prompts = []
+    server.lock = threading.Lock()
+    server.latency = MOCK_LATENCY
+    server.rate_limit_next = 0  # answer this many requests with 429
+    server.fail_inputs = ()  # answer prompts mentioning any of these with 500
+    server.in_flight = 0
+    server.max_in_flight = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class HTTPChatClient:
+    """Minimal chat-completions client (same call shape as Groq()) for the mock server"""
+
+    def __init__(self, base_url):
+        self.base_url = base_url
+        self.session = requests.Session()
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, **kwargs):
+        response = self.session.post(self.base_url + '/openai/v1/chat/completions', json=kwargs)
+        response.raise_for_status()
+        choices = [
+            SimpleNamespace(message=SimpleNamespace(content=choice['message']['content']))
+            for choice in response.json()['choices']
+        ]
+        return SimpleNamespace(choices=choices)
+
+
+def create_processor(server, tmp_dir, name):
+    processor = AIFilterProcessor(
+        cache_file=os.path.join(tmp_dir, f'{name}.db'),
+        client=HTTPChatClient(f"http://127.0.0.1:{server.server_address[1]}")
+    )
+    processor.min_request_interval = 0
+    return processor
+
+
+def sample_jobs():
+    locations = ['San Francisco, CA', 'Seattle, WA', 'Austin, TX', 'Boston, MA', 'Denver, CO', 'Atlantis', 'Remote']
+    titles = [f'{level} {role} {i}' for level in ('Senior', 'Junior') for role in ('Data Scientist', 'Engineer') for i in range(8)]
+    companies = ['Anthropic PBC', 'Google LLC', 'Meta Platforms Inc.', 'Microsoft Corporation']
+    return [
+        {
+            'title': titles[i % len(titles)],
+            'location': locations[i % len(locations)],
+            'company': companies[i % len(companies)],
+            'description': 'Build things.'
+        }
+        for i in range(200)
+    ]
+
+
+def test_batches_match_single_requests():
+    """Batched processing gives the same jobs as per-item processing with far fewer calls"""
+    print("🧪 Testing batched AI processing...")
+
+    server = start_mock_server()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        jobs = sample_jobs()
+
+        single = create_processor(server, tmp_dir, 'single')
+        start_time = time.perf_counter()
+        expected = [single.process_job(job) for job in jobs]
+        single_time = time.perf_counter() - start_time
+
+        batched = create_processor(server, tmp_dir, 'batched')
+        start_time = time.perf_counter()
+        processed = batched.process_jobs(jobs, batch_size=20)
+        batched_time = time.perf_counter() - start_time
+
+        print(f"   single: {single.request_count} requests in {single_time:.2f}s")
+        print(f"   batched: {batched.request_count} requests in {batched_time:.2f}s")
+        assert processed == expected
+        assert all(job['ai_processed'] for job in processed)
+        # 6 locations + 32 titles x 2 + 4 companies one at a time,
+        # vs 2 title batches + 1 location batch + 1 company batch + the Atlantis fallback
+        assert single.request_count == 74
+        assert batched.request_count == 5
+        assert batched.request_count * 10 <= single.request_count
+
+        single.response_cache.close()
+        batched.response_cache.close()
+    server.shutdown()
+
+
+def test_invalid_batch_entries_fall_back():
+    """Entries a batch answer can't validate get a single request; the rest don't"""
+    server = start_mock_server()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        processor = create_processor(server, tmp_dir, 'fallback')
+        jobs = [
+            {'title': 'Engineer', 'location': 'Atlantis', 'company': 'Acme Corp'},
+            {'title': 'Engineer', 'location': 'Boston, MA', 'company': 'Acme Corp'},
+        ]
+        processed = processor.process_jobs(jobs)
+
+        single_prompts = [prompt for prompt in server.prompts if 'Parse this job location' in prompt]
+        assert len(single_prompts) == 1 and '"Atlantis"' in single_prompts[0]
+        assert processed[1]['location_info']['cities'] == ['boston']
+        assert processed[0]['location_info']['raw_location'] == 'Atlantis'
+
+        # Everything is cached now
+        processor.request_count = 0
+        processor.process_jobs(jobs)
+        assert processor.request_count == 0
+        processor.response_cache.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    test_batches_match_single_requests()
+    test_invalid_batch_entries_fall_back()
+    print("\n🎉 AI batch tests completed!")
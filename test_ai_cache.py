@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Test script for the AIFilterProcessor response cache
+Uses a fake chat client, so no API key or network is needed
+"""
+
+import os
+import sys
+import tempfile
+from types import SimpleNamespace
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from scrapers.utils.ai_filter_processor import AIFilterProcessor, PROMPT_VERSIONS
+
+
+class FakeChatClient:
+    """Stands in for Groq(): answers from the prompt and counts the calls"""
+
+    def __init__(self):
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, model, messages, temperature=None, max_tokens=None):
+        self.calls += 1
+        prompt = messages[0]['content']
+        if 'Parse this job location' in prompt:
+            content = '{"country": "united states", "states": ["california"], "cities": ["san francisco"], "is_remote": false, "raw_location": "x"}'
+        elif 'experience level' in prompt:
+            content = 'senior'
+        elif 'role category' in prompt:
+            content = 'engineering'
+        else:
+            content = '"Anthropic"'
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def create_processor(tmp_dir, client):
+    processor = AIFilterProcessor(cache_file=os.path.join(tmp_dir, 'ai_cache.db'), client=client)
+    processor.min_request_interval = 0
+    return processor
+
+
+def test_repeated_inputs_call_llm_once():
+    """Only genuinely new strings reach the LLM"""
+    print("🧪 Testing AI response cache...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        client = FakeChatClient()
+        processor = create_processor(tmp_dir, client)
+        job = {
+            'title': 'Senior Software Engineer', 'location': 'San Francisco, CA',
+            'company': 'Anthropic PBC', 'description': 'Python and ML.'
+        }
+
+        first = processor.process_job(job)
+        assert client.calls == 4
+
+        # Same strings with different case/spacing are cache hits
+        for _ in range(50):
+            processor.process_job(dict(job, location='san francisco,  CA', company='ANTHROPIC PBC'))
+        assert client.calls == 4
+
+        again = processor.process_job(job)
+        assert again == first
+        assert first['location_info']['raw_location'] == 'San Francisco, CA'
+        assert first['company_normalized'] == 'Anthropic'
+
+        stats = processor.cache_stats()
+        print(f"   {stats}")
+        assert stats['store_size'] == 4
+        processor.response_cache.close()
+
+
+def test_cache_survives_restart():
+    """A new processor on the same cache file doesn't call the LLM again"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        first = create_processor(tmp_dir, FakeChatClient())
+        first.categorize_role('Backend Engineer', '')
+        first.flush_cache()
+
+        client = FakeChatClient()
+        second = create_processor(tmp_dir, client)
+        assert second.categorize_role('Backend Engineer', '') == 'engineering'
+        assert client.calls == 0
+        first.response_cache.close()
+        second.response_cache.close()
+
+
+def test_prompt_version_invalidates():
+    """Changing a prompt version makes the old answers unreachable"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        client = FakeChatClient()
+        processor = create_processor(tmp_dir, client)
+        processor.normalize_company('Google LLC')
+
+        PROMPT_VERSIONS['normalize_company'] += 1
+        try:
+            processor.normalize_company('Google LLC')
+        finally:
+            PROMPT_VERSIONS['normalize_company'] -= 1
+        assert client.calls == 2
+        processor.response_cache.close()
+
+
+def test_unparseable_location_is_not_cached():
+    """A bad JSON answer falls back to the rules and is retried next time"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        client = FakeChatClient()
+        original_create = client.create
+        client.chat.completions.create = lambda **kwargs: (
+            SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content='not json'))])
+        )
+        processor = create_processor(tmp_dir, client)
+
+        assert processor.parse_location('Berlin, Germany')['country'] == 'germany'
+
+        client.chat.completions.create = original_create
+        assert processor.parse_location('Berlin, Germany')['country'] == 'united states'
+        processor.response_cache.close()
+
+
+def test_invalid_category_is_not_cached():
+    """An answer outside the known levels/categories is retried next time, not served from the cache"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        client = FakeChatClient()
+        original_create = client.create
+        client.chat.completions.create = lambda **kwargs: (
+            SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content='I am not sure'))])
+        )
+        processor = create_processor(tmp_dir, client)
+
+        assert processor.extract_experience('Senior Backend Engineer', '') == 'unknown'
+        assert processor.categorize_role('Senior Backend Engineer', '') == 'other'
+
+        client.chat.completions.create = original_create
+        assert processor.extract_experience('Senior Backend Engineer', '') == 'senior'
+        assert processor.categorize_role('Senior Backend Engineer', '') == 'engineering'
+        processor.response_cache.close()
+
+
+if __name__ == "__main__":
+    test_repeated_inputs_call_llm_once()
+    test_cache_survives_restart()
+    test_prompt_version_invalidates()
+    test_unparseable_location_is_not_cached()
+    test_invalid_category_is_not_cached()
+    print("\n🎉 AI cache tests completed!")
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Test script for lazy AIFilterProcessor startup, the circuit breaker
+and the rule-based fallback filters
+"""
+
+import os
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from scrapers.utils.ai_filter_processor import AIFilterProcessor, normalize_company_rules, parse_location_rules
+from scrapers.utils.circuit_breaker import CircuitBreaker
+
+JOB = {
+    'title': 'Senior Software Engineer', 'location': 'San Francisco, CA | Seattle, WA',
+    'company': 'Anthropic PBC', 'description': 'Python and ML.'
+}
+
+
+class FlakyChatClient:
+    """Fails while `down` is set, otherwise answers like a healthy backend"""
+
+    def __init__(self):
+        self.down = True
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, model, messages, temperature=None, max_tokens=None):
+        self.calls += 1
+        if self.down:
+            raise ConnectionError("connection refused")
+        prompt = messages[0]['content']
+        content = 'staff' if 'experience level' in prompt else 'engineering' if 'role category' in prompt else 'Anthropic'
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def test_startup_does_not_block():
+    """Construction returns at once even when the backend is unreachable"""
+    print("🧪 Testing lazy AI processor startup...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        start_time = time.perf_counter()
+        processor = AIFilterProcessor(
+            api_key='test-key', base_url='http://127.0.0.1:9', request_timeout=0.5,
+            cache_file=os.path.join(tmp_dir, 'ai_cache.db')
+        )
+        elapsed = time.perf_counter() - start_time
+        print(f"   constructed in {elapsed * 1000:.1f}ms")
+        assert elapsed < 0.5
+
+        processor.health_thread.join(10)
+        assert processor.health['status'] == 'error'
+        assert not processor.is_available()
+
+        # With the circuit open every job is classified by rules, without touching the network
+        start_time = time.perf_counter()
+        processed = [processor.process_job(JOB) for _ in range(100)]
+        assert time.perf_counter() - start_time < 0.5
+        assert processed[0]['experience_level'] == 'senior'
+        assert processed[0]['role_category'] == 'engineering'
+        assert processed[0]['company_normalized'] == 'Anthropic'
+        assert processed[0]['location_info']['states'] == ['california', 'washington']
+        assert processor.status()['circuit']['state'] == 'open'
+        processor.response_cache.close()
+
+
+def test_breaker_opens_and_recovers():
+    """Repeated failures open the circuit; a successful trial closes it again"""
+    print("🧪 Testing circuit breaker recovery...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        client = FlakyChatClient()
+        processor = AIFilterProcessor(
+            cache_file=os.path.join(tmp_dir, 'ai_cache.db'), client=client,
+            failure_threshold=2, reset_timeout=0.2
+        )
+        processor.min_request_interval = 0
+
+        assert processor.normalize_company('Acme Corp') == 'Acme'
+        assert processor.normalize_company('Globex LLC') == 'Globex'
+        assert processor.breaker.state == 'open'
+
+        # Open: answered by rules without calling the backend
+        calls = client.calls
+        assert processor.extract_experience('Staff Engineer', '') == 'senior'
+        assert client.calls == calls
+
+        # Rule-based answers weren't cached, so the AI answers once the backend is back
+        client.down = False
+        time.sleep(0.25)
+        assert processor.breaker.state == 'half_open'
+        assert processor.extract_experience('Staff Engineer', '') == 'staff'
+        assert processor.breaker.state == 'closed'
+        processor.response_cache.close()
+
+
+def test_circuit_breaker_states():
+    """Only one trial request is let through while half open"""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert not breaker.allow_request()
+
+    time.sleep(0.06)
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+    breaker.record_failure()  # failed trial
+    assert breaker.state == 'open'
+
+    time.sleep(0.06)
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == 'closed'
+    assert breaker.status()['trips'] == 2
+
+
+def test_rule_based_filters():
+    """Rule-based location and company parsing"""
+    assert parse_location_rules('New York, NY')['cities'] == ['new york']
+    assert parse_location_rules('Austin, Texas')['states'] == ['texas']
+    assert parse_location_rules('London, UK')['country'] == 'united kingdom'
+    assert parse_location_rules('Remote - US')['is_remote']
+    assert parse_location_rules('Somewhere')['country'] == 'other'
+    assert normalize_company_rules('Meta Platforms Inc.') == 'Meta Platforms'
+    assert normalize_company_rules('Stripe, Inc.') == 'Stripe'
+
+
+if __name__ == "__main__":
+    test_startup_does_not_block()
+    test_breaker_opens_and_recovers()
+    test_circuit_breaker_states()
+    test_rule_based_filters()
+    print("\n🎉 AI fallback tests completed!")
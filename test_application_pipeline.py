@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Test script for the staged application pipeline
+Postings come from a slow local HTTP stub; browser automation is replaced
+by a short sleep so only the pipeline's scheduling is measured
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from application_system import JobApplicationSystem
+from job_description_analyzer import JobDescriptionAnalyzer
+from scrapers.utils.page_fetcher import PageFetcher
+from test_job_analysis_cache import CountingGroqClient, start_posting_server
+
+FETCH_DELAY = 0.2
+AUTOMATION_DELAY = 0.05
+
+
+class TimedAutomationSystem(JobApplicationSystem):
+    """Records how the automation stage is scheduled instead of opening a browser"""
+
+    def __init__(self, analysis_cache_file):
+        super().__init__(analysis_cache_file=analysis_cache_file)
+        self.lock = threading.Lock()
+        self.automation_running = 0
+        self.max_automation_running = 0
+        self.automation_starts = []
+        self.automated = 0
+        self.max_waiting = 0
+
+    def prepare_application(self, job, job_analysis=None):
+        if job.get('opening_title') == 'Broken':
+            raise ValueError("bad posting")
+        application = super().prepare_application(job, job_analysis)
+        with self.lock:
+            prepared = sum(1 for status in self.processing_status.values() if status['status'] == 'completed') + 1
+            self.max_waiting = max(self.max_waiting, prepared - self.automated)
+        return application
+
+    def automate_form_filling(self, job_id, application_result, keep_browser_open=True, delay_seconds=30):
+        with self.lock:
+            self.automation_running += 1
+            self.max_automation_running = max(self.max_automation_running, self.automation_running)
+            self.automation_starts.append(time.perf_counter())
+        time.sleep(AUTOMATION_DELAY)
+        with self.lock:
+            self.automation_running -= 1
+            self.automated += 1
+        return {'success': True, 'filled_fields': ['name']}
+
+
+def create_jobs(server, count):
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    return [
+        {'id': str(i), 'opening_title': f'Engineer {i}', 'company_name': 'Acme', 'opening_link': f'{base_url}/jobs/{i}'}
+        for i in range(count)
+    ]
+
+
+def create_system(tmp_dir):
+    system = TimedAutomationSystem(os.path.join(tmp_dir, 'job_analysis_cache.db'))
+    system.description_analyzer = JobDescriptionAnalyzer(groq_client=CountingGroqClient(), fetcher=PageFetcher(cache_file=None))
+    system.resume_data = {'name': 'Test', 'skills': ['python', 'docker']}
+    return system
+
+
+def test_stages_run_in_parallel():
+    """Analysis overlaps across jobs; results keep the selection order"""
+    print("🧪 Testing staged application pipeline...")
+
+    server = start_posting_server()
+    server.delay = FETCH_DELAY
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        system = create_system(tmp_dir)
+        system.selected_jobs = create_jobs(server, 24)
+
+        start_time = time.perf_counter()
+        results = system.process_applications(automate=False, analysis_workers=8)
+        elapsed = time.perf_counter() - start_time
+
+        print(f"   {results['processed']} applications in {elapsed:.2f}s (sequential fetches alone: {24 * FETCH_DELAY:.1f}s)")
+        assert results['processed'] == 24 and results['errors'] == []
+        assert [application['job_id'] for application in results['applications']] == [str(i) for i in range(24)]
+        assert elapsed < 24 * FETCH_DELAY / 3
+        assert results['automation_attempts'] == 0
+        system.analysis_cache.store.close()
+    server.shutdown()
+
+
+def test_automation_stage_is_throttled():
+    """Automation runs with its own concurrency and spacing, and errors don't stop the pipeline"""
+    print("🧪 Testing automation throttling and backpressure...")
+
+    server = start_posting_server()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        system = create_system(tmp_dir)
+        jobs = create_jobs(server, 12)
+        jobs[5]['opening_title'] = 'Broken'
+        system.selected_jobs = jobs
+
+        results = system.process_applications(automation_workers=1, automation_interval=0.02, queue_size=2)
+
+        assert results['processed'] == 11
+        assert len(results['errors']) == 1 and system.processing_status['5']['status'] == 'error'
+        assert results['automation_attempts'] == results['automation_success'] == 11
+        assert system.max_automation_running == 1
+        gaps = [later - earlier for earlier, later in zip(system.automation_starts, system.automation_starts[1:])]
+        assert min(gaps) >= 0.02 - 0.005
+        # Prepared applications waiting on the browser stay bounded by the queue
+        # (+ one being automated, + one per preparation worker blocked on a full queue)
+        print(f"   at most {system.max_waiting} prepared applications waiting for automation")
+        assert system.max_waiting <= 2 + 1 + 4 + 1
+        system.analysis_cache.store.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    test_stages_run_in_parallel()
+    test_automation_stage_is_throttled()
+    print("\n🎉 Application pipeline tests completed!")
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Test script for the application run store and its progress stream
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from application_runs import ApplicationRunStore
+from test_application_pipeline import create_jobs, create_system
+from test_job_analysis_cache import start_posting_server
+
+
+def parse_sse(body):
+    """[(event, data)] from a Server-Sent Events body"""
+    messages = []
+    for block in body.split('\n\n'):
+        fields = dict(line.split(': ', 1) for line in block.splitlines() if ': ' in line and not line.startswith(':'))
+        if 'event' in fields:
+            messages.append((fields['event'], json.loads(fields['data'])))
+    return messages
+
+
+def test_run_lifecycle():
+    """Runs get ids, per-job states and timings, and stop counting as processing when they finish"""
+    print("🧪 Testing run store...")
+
+    store = ApplicationRunStore()
+    jobs = [{'id': '1', 'opening_title': 'Engineer'}, {'id': '2', 'opening_title': 'Analyst'}]
+    assert not store.is_running() and store.get_run() is None
+
+    run_id = store.start_run(jobs)
+    assert store.is_running()
+    assert store.start_run(jobs) is None  # one run at a time
+
+    store.update_job(run_id, '1', 'analyzing')
+    time.sleep(0.02)
+    store.update_job(run_id, '1', 'preparing')
+    store.update_job(run_id, '1', 'completed', application={'job_id': '1'})
+    store.update_job(run_id, '2', 'error', error='bad posting')
+    store.update_job(run_id, 'unknown', 'completed')
+    store.finish_run(run_id, results={'processed': 1})
+
+    assert not store.is_running()
+    run = store.get_run(run_id)
+    assert run['status'] == 'completed' and run['counts']['completed'] == 1 and run['counts']['error'] == 1
+    first_job = run['jobs'][0]
+    assert first_job['timings']['analyzing'] >= 0.02 and 'application' not in first_job
+    assert store.job_statuses()['1']['application'] == {'job_id': '1'}
+    assert store.job_statuses()['2'] == dict(store.job_statuses()['2'], status='error', error='bad posting')
+
+    # A new run starts once the last one finished, and becomes the latest
+    next_run_id = store.start_run(jobs[:1])
+    assert next_run_id != run_id and store.get_run()['run_id'] == next_run_id
+    assert store.job_statuses() == {}
+    assert store.get_run(run_id)['counts']['completed'] == 1
+
+
+def test_concurrent_starts():
+    """Only one of many simultaneous start requests gets a run"""
+    store = ApplicationRunStore()
+    barrier = threading.Barrier(16)
+    run_ids = []
+
+    def start():
+        barrier.wait()
+        run_ids.append(store.start_run([{'id': '1'}]))
+
+    threads = [threading.Thread(target=start) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len([run_id for run_id in run_ids if run_id is not None]) == 1
+
+
+def test_waiting_for_events():
+    """wait_for_events returns as soon as something changes"""
+    store = ApplicationRunStore()
+    last_event_id, state = store.snapshot()
+    assert state == {'run': None, 'is_processing': False}
+
+    threading.Timer(0.05, store.start_run, args=([{'id': '1'}],)).start()
+    start_time = time.perf_counter()
+    events = store.wait_for_events(last_event_id, timeout=5)
+    assert time.perf_counter() - start_time < 1
+    assert [event['event'] for event in events] == ['run']
+    assert store.wait_for_events(events[-1]['id'], timeout=0.05) == []
+
+
+def test_pipeline_progress_stream():
+    """A background run's progress is pushed over /api/application-events"""
+    print("🧪 Testing application progress stream...")
+
+    import app as web_app
+
+    server = start_posting_server()
+    server.delay = 0.05
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        system = create_system(tmp_dir)
+        system.selected_jobs = create_jobs(server, 6)
+        web_app.application_system = system
+        client = web_app.app.test_client()
+
+        # Nothing has run yet: just a snapshot
+        messages = parse_sse(client.get('/api/application-events').get_data(as_text=True))
+        assert messages == [('snapshot', {'run': None, 'is_processing': False})]
+
+        run_id = system.start_run()
+        worker = threading.Thread(target=system.process_applications, kwargs={'run_id': run_id, 'automate': False})
+        worker.start()
+        response = client.get('/api/application-events')
+        assert response.mimetype == 'text/event-stream'
+        messages = parse_sse(response.get_data(as_text=True))  # ends with the run
+        worker.join()
+
+        assert messages[0][0] == 'snapshot' and messages[0][1]['is_processing']
+        assert messages[-1][0] == 'run' and messages[-1][1]['status'] == 'completed'
+        assert messages[-1][1]['counts']['completed'] == 6
+        job_states = [(data['job_id'], data['status']) for event, data in messages if event == 'job']
+        for job in system.selected_jobs:
+            states = [status for job_id, status in job_states if job_id == job['id']]
+            assert states[-1] == 'completed'
+        print(f"   {len(messages)} events, run finished in {messages[-1][1]['elapsed']:.2f}s")
+
+        status = client.get('/api/application-status').get_json()
+        assert status['is_processing'] is False and status['run']['run_id'] == run_id
+        assert len(client.get('/api/applications').get_json()['applications']) == 6
+        run = client.get(f'/api/application-runs/{run_id}').get_json()
+        assert all(job['timings']['analyzing'] >= 0.05 for job in run['jobs'])
+
+        # A client resuming from an earlier event only gets what it missed
+        resumed = client.get('/api/application-events', headers={'Last-Event-ID': '1'})  # after the run's start
+        resumed_messages = parse_sse(resumed.get_data(as_text=True))
+        assert resumed_messages[0][0] == 'job' and resumed_messages[-len(messages) + 1:] == messages[1:]
+        system.analysis_cache.store.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    test_run_lifecycle()
+    test_concurrent_starts()
+    test_waiting_for_events()
+    test_pipeline_progress_stream()
+    print("\n🎉 Application run tests completed!")
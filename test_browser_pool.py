@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared browser pool used by form automation
+Uses an in-memory stand-in for Chrome so it runs without a browser
+"""
+
+import os
+import sys
+import threading
+import time
+from types import SimpleNamespace
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+from browser_pool import BrowserPool
+from form_automation import JobFormAutomation
+
+LAUNCH_DELAY = 0.05
+PAGE_DELAY = 0.2
+
+
+class FakeElement:
+    """A form field that becomes usable once the page has rendered it"""
+
+    tag_name = 'input'
+
+    def __init__(self, enabled_at=0.0):
+        self.enabled_at = enabled_at
+        self.value = ''
+
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        return time.monotonic() >= self.enabled_at
+
+    def get_attribute(self, name):
+        return None
+
+    def clear(self):
+        self.value = ''
+
+    def click(self):
+        pass
+
+    def send_keys(self, value):
+        if not self.is_enabled():
+            raise WebDriverException("element not interactable")
+        self.value += value
+
+
+class FakeDriver:
+    """Just enough of a WebDriver: windows, cookies, storage and page loads"""
+
+    launched = 0
+    form_delay = 0.0  # seconds after a page load until its form renders
+
+    def __init__(self):
+        FakeDriver.launched += 1
+        self.crashed = False
+        self.quit_called = False
+        self.url = 'about:blank'
+        self.form_ready_at = 0.0
+        self.window_handles = ['main']
+        self.cookies = {}
+        self.storage = {}
+        self.switch_to = SimpleNamespace(window=self._check)
+        time.sleep(LAUNCH_DELAY)
+
+    def _check(self, *args):
+        if self.crashed or self.quit_called:
+            raise WebDriverException("chrome not reachable")
+
+    def get(self, url):
+        self._check()
+        time.sleep(PAGE_DELAY if url != 'about:blank' else 0)
+        self.url = url
+        self.form_ready_at = time.monotonic() + self.form_delay
+
+    def close(self):
+        self._check()
+        self.window_handles.pop()
+
+    def execute_script(self, script, *args):
+        self._check()
+        if 'localStorage.clear()' in script:
+            self.storage.clear()
+        if 'location.origin' in script:
+            return '/'.join(self.url.split('/')[:3]) if self.url.startswith('http') else 'null'
+        if 'document.readyState' in script:
+            return 'complete'
+
+    def find_element(self, by, value):
+        self._check()
+        if time.monotonic() < self.form_ready_at or self.url == 'about:blank':
+            raise NoSuchElementException(value)
+        return FakeElement()
+
+    def delete_all_cookies(self):
+        self._check()
+        self.cookies.clear()
+
+    def find_elements(self, by, value):
+        self._check()
+        return []
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_sessions_are_reused_and_reset():
+    """A released session is reset and handed to the next job"""
+    print("🧪 Testing browser reuse...")
+
+    pool = BrowserPool(size=2, driver_factory=FakeDriver)
+    with pool.session() as driver:
+        driver.get('https://boards.greenhouse.io/acme/jobs/1')
+        driver.cookies['session'] = 'applicant-1'
+        driver.storage['draft'] = 'cover letter'
+        driver.window_handles.append('popup')
+    first_driver = driver
+
+    with pool.session() as driver:
+        assert driver is first_driver
+        assert driver.cookies == {} and driver.storage == {}
+        assert driver.window_handles == ['main'] and driver.url == 'about:blank'
+
+    print(f"   {pool.status()}")
+    assert pool.status()['started'] == 1 and pool.status()['reused'] == 1
+    pool.close()
+    assert first_driver.quit_called
+
+
+class CdpFakeDriver(FakeDriver):
+    """Chrome's DevTools commands: validates origins like Chrome, optionally refuses everything"""
+
+    refuse_cdp = False
+
+    def __init__(self):
+        super().__init__()
+        self.cdp_calls = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        self._check()
+        if self.refuse_cdp or (cmd == 'Storage.clearDataForOrigin' and not params['origin'].startswith('http')):
+            raise WebDriverException(f"{cmd}: invalid params")
+        self.cdp_calls.append((cmd, params.get('origin')))
+
+
+def test_devtools_cleanup_is_best_effort():
+    """DevTools cleanup targets the job's origin, and a refused command doesn't discard the session"""
+    pool = BrowserPool(size=1, driver_factory=CdpFakeDriver)
+    with pool.session() as driver:
+        driver.get('https://boards.greenhouse.io/acme/jobs/1')
+    assert driver.cdp_calls == [
+        ('Network.clearBrowserCookies', None), ('Storage.clearDataForOrigin', 'https://boards.greenhouse.io')
+    ]
+
+    CdpFakeDriver.refuse_cdp = True
+    try:
+        for _ in range(3):
+            with pool.session() as same_driver:
+                same_driver.get('https://jobs.lever.co/initech/1')
+            assert same_driver is driver
+    finally:
+        CdpFakeDriver.refuse_cdp = False
+    assert pool.status()['started'] == 1 and pool.status()['crashed'] == 0
+    pool.close()
+
+
+def test_crashed_and_worn_out_sessions_are_replaced():
+    pool = BrowserPool(size=1, driver_factory=FakeDriver, max_uses=3)
+
+    with pool.session() as driver:
+        driver.crashed = True
+    crashed_driver = driver
+    assert crashed_driver.quit_called and pool.status()['crashed'] == 1
+
+    # An exception in the job doesn't leak the session
+    try:
+        with pool.session() as driver:
+            assert driver is not crashed_driver
+            raise ValueError("form blew up")
+    except ValueError:
+        pass
+    assert pool.status()['idle'] == 1
+
+    for _ in range(2):
+        with pool.session() as driver:
+            pass
+    assert driver.quit_called and pool.status()['recycled'] == 1 and pool.status()['live'] == 0
+    pool.close()
+
+
+def test_pool_size_bounds_concurrency():
+    """Never more sessions than `size`; extra jobs wait, then time out"""
+    pool = BrowserPool(size=2, driver_factory=FakeDriver)
+    running = []
+    peak = []
+    lock = threading.Lock()
+
+    def job():
+        with pool.session() as driver:
+            with lock:
+                running.append(driver)
+                peak.append(len(running))
+            driver.get('https://jobs.lever.co/initech/1')
+            with lock:
+                running.remove(driver)
+
+    threads = [threading.Thread(target=job) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert max(peak) == 2 and pool.status()['started'] == 2
+
+    first, second = pool.acquire(), pool.acquire()
+    try:
+        pool.acquire(timeout=0.05)
+        assert False, "acquire should time out while every session is busy"
+    except TimeoutError:
+        pass
+    pool.release(first)
+    pool.release(second)
+    pool.close()
+
+
+def test_form_previews_run_concurrently():
+    """JobFormAutomation borrows pooled sessions, so previews overlap"""
+    print("🧪 Testing concurrent form automation on a warm pool...")
+
+    pool = BrowserPool(size=3, driver_factory=FakeDriver)
+    pool.warm()
+    launched = FakeDriver.launched
+    results = []
+
+    def preview(i):
+        results.append(JobFormAutomation(pool=pool).preview_form_fields(f'https://jobs.lever.co/initech/{i}'))
+
+    start_time = time.perf_counter()
+    threads = [threading.Thread(target=preview, args=(i,)) for i in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start_time
+
+    print(f"   3 previews in {elapsed:.2f}s, {pool.status()}")
+    assert all(result['success'] for result in results)
+    assert elapsed < 3 * PAGE_DELAY
+    assert FakeDriver.launched == launched  # nothing launched per job
+    assert pool.status()['idle'] == 3
+    pool.close()
+
+
+if __name__ == "__main__":
+    test_sessions_are_reused_and_reset()
+    test_devtools_cleanup_is_best_effort()
+    test_crashed_and_worn_out_sessions_are_replaced()
+    test_pool_size_bounds_concurrency()
+    test_form_previews_run_concurrently()
+    print("\n🎉 Browser pool tests completed!")
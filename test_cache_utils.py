@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test script for the bounded TTL/LRU cache and the date estimator's memory tier
+"""
+
+import os
+import sys
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from scrapers.utils.cache_utils import TTLLRUCache
+from scrapers.utils.job_date_estimator import JobDateEstimator
+
+
+def test_lru_eviction():
+    """The least recently used entry goes first once max_size is reached"""
+    print("🧪 Testing LRU eviction...")
+
+    cache = TTLLRUCache(max_size=3)
+    for key in ('a', 'b', 'c'):
+        cache.set(key, key.upper())
+    cache.get('a')  # 'b' is now the oldest
+    cache.set('d', 'D')
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 'A'
+    assert len(cache) == 3
+    assert cache.stats()['evictions'] == 1
+
+
+def test_ttl_expiry_and_stats():
+    """Expired entries count as misses"""
+    print("🧪 Testing TTL expiry...")
+
+    cache = TTLLRUCache(max_size=10)
+    cache.set('short', 1, ttl=0.05)
+    cache.set('forever', 2, ttl=0)
+
+    assert cache.get('short') == 1
+    time.sleep(0.1)
+    assert cache.get('short') is None
+    assert cache.get('forever') == 2
+
+    stats = cache.stats()
+    assert stats['hits'] == 2
+    assert stats['misses'] == 1
+    assert stats['expirations'] == 1
+    assert stats['size'] == 1
+
+
+def test_estimator_memory_stays_bounded():
+    """The estimator's memory tier never grows past its limit, the store keeps everything"""
+    print("🧪 Testing date estimator memory tier...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        estimator = JobDateEstimator(
+            cache_file=os.path.join(tmp_dir, 'date_cache.db'), legacy_cache_file=None, memory_cache_size=50
+        )
+        for i in range(200):
+            estimator.estimate_job_date(f'Engineer {i}', 'Acme')
+        estimator.estimate_job_date('Engineer 0', 'Acme')  # evicted from memory, served by the store
+
+        stats = estimator.cache_stats()
+        print(f"   {stats}")
+        assert stats['size'] == 50
+        assert stats['evictions'] == 151
+        assert stats['store_size'] == 200
+        estimator.store.close()
+
+
+def test_pattern_guesses_expire_sooner():
+    """Pattern guesses get the short TTL, platform dates the long one"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        estimator = JobDateEstimator(
+            cache_file=os.path.join(tmp_dir, 'date_cache.db'), legacy_cache_file=None,
+            pattern_cache_ttl=60, external_cache_ttl=3600
+        )
+        assert estimator._cache_ttl({'source': 'pattern_analysis'}) == 60
+        assert estimator._cache_ttl({'source': 'LinkedIn'}) == 3600
+        estimator.store.close()
+
+
+if __name__ == "__main__":
+    test_lru_eviction()
+    test_ttl_expiry_and_stats()
+    test_estimator_memory_stays_bounded()
+    test_pattern_guesses_expire_sooner()
+    print("\n🎉 Cache tests completed!")
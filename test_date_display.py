@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Test script for posted-date epochs and relative date labels
+Run directly to also time labelling a 100k-job snapshot
+"""
+
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from scrapers.utils.date_display import confidence_color, relative_date_label, to_epoch
+
+
+def legacy_format(date_obj, now):
+    """The previous per-job formatter, used as the parity and benchmark baseline"""
+    if isinstance(date_obj, str):
+        date_obj = datetime.fromisoformat(date_obj.replace('Z', '+00:00'))
+    diff = now - date_obj
+    if diff.days == 0:
+        return "Today"
+    elif diff.days == 1:
+        return "Yesterday"
+    elif diff.days < 7:
+        return f"{diff.days} days ago"
+    elif diff.days < 30:
+        weeks = diff.days // 7
+        return f"{weeks} week{'s' if weeks > 1 else ''} ago"
+    else:
+        months = diff.days // 30
+        return f"{months} month{'s' if months > 1 else ''} ago"
+
+
+def test_to_epoch():
+    """Datetimes, ISO strings and numbers all become unix seconds"""
+    print("🧪 Testing epoch conversion...")
+
+    moment = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+    assert to_epoch(moment) == 1714564800
+    assert to_epoch('2024-05-01T12:00:00Z') == 1714564800
+    assert to_epoch(1714564800.7) == 1714564800
+    assert to_epoch(None) is None
+    assert to_epoch('') is None
+    assert to_epoch('last week') is None
+
+
+def test_labels_match_legacy_formatter():
+    """Bucketed labels agree with the old per-job formatter for every age up to two years"""
+    print("🧪 Testing relative date labels...")
+
+    now = datetime.now()
+    for age_days in range(0, 730):
+        posted = now - timedelta(days=age_days, hours=3)
+        assert relative_date_label(to_epoch(posted), now.timestamp()) == legacy_format(posted, now), age_days
+
+    assert relative_date_label(None) == 'Unknown'
+    # Dates slightly in the future (clock skew) read as today
+    assert relative_date_label(int(now.timestamp()) + 3600, now.timestamp()) == 'Today'
+
+
+def test_confidence_colors():
+    assert confidence_color('medium') == 'warning'
+    assert confidence_color('very_low') == 'secondary'
+    assert confidence_color('nonsense') == 'secondary'
+
+
+def benchmark_labels(count=100_000):
+    """Label a snapshot with the old formatter (ISO strings) and with epochs + one clock tick"""
+    print(f"\n🚀 Posted Date Label Benchmark: {count:,} jobs")
+    print("=" * 60)
+
+    now = datetime.now()
+    dates = [now - timedelta(days=i % 90, hours=i % 24) for i in range(count)]
+    iso_dates = [date.isoformat() for date in dates]
+    epochs = [to_epoch(date) for date in dates]
+
+    start_time = time.perf_counter()
+    for iso_date in iso_dates:
+        legacy_format(iso_date, datetime.now())
+    legacy_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    snapshot_now = time.time()
+    for epoch in epochs:
+        relative_date_label(epoch, snapshot_now)
+    epoch_time = time.perf_counter() - start_time
+
+    print(f"  Parse + format per job: {legacy_time:.3f}s")
+    print(f"  Epoch + label table:    {epoch_time:.3f}s ({legacy_time / epoch_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    test_to_epoch()
+    test_labels_match_legacy_formatter()
+    test_confidence_colors()
+    benchmark_labels()
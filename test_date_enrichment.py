@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test script for background date enrichment
+Provisional dates come back immediately; the worker fills in platform dates later
+"""
+
+import os
+import sys
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from scrapers.utils.date_enrichment import DateEnrichmentWorker
+from test_date_estimator_async import SLOW_PLATFORM_DELAY, create_stub_estimator, start_stub_server
+
+
+def test_provisional_then_enriched():
+    """The first call doesn't wait on the platforms, the next snapshot sees the platform date"""
+    print("🧪 Testing background date enrichment...")
+
+    server = start_stub_server()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        estimator = create_stub_estimator(server, tmp_dir)
+        worker = DateEnrichmentWorker(estimator, batch_size=10)
+
+        start_time = time.perf_counter()
+        provisional = [worker.estimate(f'Engineer {i}', 'Acme', 'Remote') for i in range(25)]
+        elapsed = time.perf_counter() - start_time
+
+        print(f"   25 provisional dates in {elapsed * 1000:.1f}ms")
+        assert elapsed < SLOW_PLATFORM_DELAY
+        assert all(result['provisional'] for result in provisional)
+        assert all(result['source'] == 'pattern_analysis' for result in provisional)
+
+        assert worker.wait_until_idle(timeout=10)
+        enriched = worker.estimate('Engineer 0', 'Acme', 'Remote')
+        assert enriched['source'] == 'Indeed'
+        assert 'provisional' not in enriched
+
+        status = worker.status()
+        print(f"   {status}")
+        assert status['enqueued'] == 25
+        assert status['improved'] == 25
+        assert status['queued'] == 0
+
+        worker.stop()
+        estimator.store.close()
+    server.shutdown()
+
+
+def test_duplicates_and_retries_are_skipped():
+    """A job is queued once, and not again right after its lookup"""
+    server = start_stub_server()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        estimator = create_stub_estimator(server, tmp_dir)
+        worker = DateEnrichmentWorker(estimator)
+
+        assert worker.enqueue('Analyst', 'Acme') is True
+        assert worker.enqueue('Analyst', 'Acme') is False
+        assert worker.wait_until_idle(timeout=10)
+        assert worker.enqueue('Analyst', 'Acme') is False
+
+        worker.stop()
+        estimator.store.close()
+    server.shutdown()
+
+
+def test_fast_mode_is_unchanged():
+    """Without external APIs, estimates are pattern guesses and nothing is queued"""
+    server = start_stub_server()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        estimator = create_stub_estimator(server, tmp_dir)
+        estimator.disable_external_apis()
+        worker = DateEnrichmentWorker(estimator)
+
+        result = worker.estimate('Designer', 'Acme')
+        assert result['source'] == 'pattern_analysis'
+        assert worker.status()['enqueued'] == 0
+        assert not worker.status()['running']
+        estimator.store.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    test_provisional_then_enriched()
+    test_duplicates_and_retries_are_skipped()
+    test_fast_mode_is_unchanged()
+    print("\n🎉 Date enrichment tests completed!")
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Test script for the concurrent (async batch) date estimator
+Runs against a local HTTP stub server instead of the real job platforms
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from scrapers.utils.job_date_estimator import JobDateEstimator
+
+SLOW_PLATFORM_DELAY = 0.5
+
+# path -> (delay in seconds, status, body)
+STUB_PAGES = {
+    '/linkedin': (SLOW_PLATFORM_DELAY, 200, '<div class="job-search-card"><span>Be an early applicant</span></div>'),
+    '/indeed': (0.05, 200, '<div class="job_seen_beacon"><span>3 days ago</span></div>'),
+    '/glassdoor': (0.0, 503, 'unavailable'),
+    '/ziprecruiter': (SLOW_PLATFORM_DELAY, 200, '<article class="job_result"><time>1 week ago</time></article>'),
+}
+
+
+class StubPlatformHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        delay, status, body = STUB_PAGES.get(self.path.split('?')[0], (0.0, 404, ''))
+        time.sleep(delay)
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html')
+        self.end_headers()
+        self.wfile.write(body.encode('utf-8'))
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubPlatformServer(ThreadingHTTPServer):
+    # Every platform of every job in a batch connects at once
+    request_queue_size = 128
+
+
+def start_stub_server():
+    server = StubPlatformServer(('127.0.0.1', 0), StubPlatformHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def create_stub_estimator(server, tmp_dir):
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    estimator = JobDateEstimator(
+        cache_file=os.path.join(tmp_dir, 'date_cache.db'),
+        legacy_cache_file=None,
+        use_external_apis=True,
+        platform_urls={
+            'LinkedIn': base_url + '/linkedin?q={query}',
+            'Indeed': base_url + '/indeed?q={query}',
+            'Glassdoor': base_url + '/glassdoor?q={query}',
+            'ZipRecruiter': base_url + '/ziprecruiter?q={query}',
+        },
+        max_concurrency=20,
+    )
+    estimator.request_delay = 0
+    return estimator
+
+
+def test_first_confident_answer_wins():
+    """The fast platform's date comes back without waiting for the slow ones"""
+    print("🧪 Testing first-answer fan-out...")
+
+    server = start_stub_server()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        estimator = create_stub_estimator(server, tmp_dir)
+
+        start_time = time.perf_counter()
+        [result] = estimator.estimate_job_dates([{'title': 'Data Engineer', 'company': 'Acme'}])
+        elapsed = time.perf_counter() - start_time
+
+        print(f"   {result['source']} in {elapsed:.2f}s")
+        assert result['source'] == 'Indeed'
+        assert result['confidence'] == 'medium'
+        assert (datetime.now() - result['estimated_date']).days == 3
+        assert elapsed < SLOW_PLATFORM_DELAY
+        estimator.store.close()
+    server.shutdown()
+
+
+def test_batch_runs_jobs_in_parallel():
+    """Many jobs finish in about the time of one"""
+    print("🧪 Testing batch concurrency...")
+
+    server = start_stub_server()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        estimator = create_stub_estimator(server, tmp_dir)
+        jobs = [{'title': f'Engineer {i}', 'company': 'Acme', 'location': 'Remote'} for i in range(20)]
+
+        start_time = time.perf_counter()
+        results = estimator.estimate_job_dates(jobs)
+        elapsed = time.perf_counter() - start_time
+
+        print(f"   {len(jobs)} jobs in {elapsed:.2f}s")
+        assert [result['source'] for result in results] == ['Indeed'] * len(jobs)
+        assert elapsed < 20 * 0.05
+        assert estimator.cache_stats()['store_size'] == len(jobs)
+        estimator.store.close()
+    server.shutdown()
+
+
+def test_per_platform_rate_limit():
+    """Requests to the same platform are spaced request_delay apart"""
+    server = start_stub_server()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        estimator = create_stub_estimator(server, tmp_dir)
+        estimator.request_delay = 0.1
+        jobs = [{'title': f'Analyst {i}', 'company': 'Acme'} for i in range(5)]
+
+        start_time = time.perf_counter()
+        estimator.estimate_job_dates(jobs)
+        elapsed = time.perf_counter() - start_time
+
+        # 5 Indeed lookups need at least 4 gaps
+        assert elapsed >= 4 * 0.1
+        estimator.store.close()
+    server.shutdown()
+
+
+def test_sync_path_uses_same_platform_table():
+    """estimate_job_date still works one platform at a time"""
+    server = start_stub_server()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        estimator = create_stub_estimator(server, tmp_dir)
+        result = estimator.estimate_job_date('Designer', 'Acme')
+        # LinkedIn has no date, so the sequential path moves on to Indeed
+        assert result['source'] == 'Indeed'
+        estimator.store.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    test_first_confident_answer_wins()
+    test_batch_runs_jobs_in_parallel()
+    test_per_platform_rate_limit()
+    test_sync_path_uses_same_platform_table()
+    print("\n🎉 Async date estimator tests completed!")
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Test script for the deterministic posted-date fallback
+"""
+
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from scrapers.utils.job_date_estimator import JobDateEstimator, estimate_date_from_patterns, stable_offset
+
+FIRST_SEEN = 1700000000  # 2023-11-14
+
+
+def test_same_job_same_date():
+    """Repeated calls (reloads, other workers) give the same answer"""
+    print("🧪 Testing deterministic fallback...")
+
+    first = estimate_date_from_patterns('Data Scientist', 'Meta', 'San Francisco, CA', FIRST_SEEN)
+    second = estimate_date_from_patterns('Data Scientist', 'Meta', 'San Francisco, CA', FIRST_SEEN)
+    assert first == second
+
+    # Without ingest history the guess is anchored at today's midnight
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    undated = estimate_date_from_patterns('Data Scientist', 'Meta')
+    assert undated == estimate_date_from_patterns('Data Scientist', 'Meta')
+    assert timedelta(days=7) <= today - undated['estimated_date'] <= timedelta(days=14)
+
+
+def test_anchored_at_first_seen():
+    """The guess is a whole number of days before the first time the job was scraped"""
+    anchor = datetime.fromtimestamp(FIRST_SEEN)
+
+    senior = estimate_date_from_patterns('Senior Backend Engineer', 'Acme', None, FIRST_SEEN)
+    urgent = estimate_date_from_patterns('Urgent: Warehouse Associate', 'Acme', None, FIRST_SEEN)
+    other = estimate_date_from_patterns('Recruiter', 'Acme', None, FIRST_SEEN)
+
+    assert 14 <= (anchor - senior['estimated_date']).days <= 28
+    assert 1 <= (anchor - urgent['estimated_date']).days <= 7
+    assert 7 <= (anchor - other['estimated_date']).days <= 14
+    assert other['confidence'] == 'very_low'
+    assert 'first seen' in other['date_range']
+
+
+def test_offsets_spread_over_range():
+    """Different jobs land on different days, all inside the range"""
+    offsets = {stable_offset(7, 14, f'Engineer {i}', 'Acme', 'Remote') for i in range(200)}
+    assert offsets == set(range(7, 15))
+
+
+def test_estimator_uses_deterministic_fallback():
+    """Two estimators with separate caches agree"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        estimators = [
+            JobDateEstimator(cache_file=os.path.join(tmp_dir, f'cache_{i}.db'), legacy_cache_file=None)
+            for i in range(2)
+        ]
+        results = [estimator.estimate_job_date('Product Manager', 'Globex', 'Remote', FIRST_SEEN)
+                   for estimator in estimators]
+        assert results[0]['estimated_date'] == results[1]['estimated_date']
+        for estimator in estimators:
+            estimator.store.close()
+
+
+if __name__ == "__main__":
+    test_same_job_same_date()
+    test_anchored_at_first_seen()
+    test_offsets_spread_over_range()
+    test_estimator_uses_deterministic_fallback()
+    print("\n🎉 Date fallback tests completed!")
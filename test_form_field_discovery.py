@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Test script for single-pass form field discovery
+One script call snapshots the page's fields; matching happens in Python
+"""
+
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from form_automation import FIELD_SNAPSHOT_SCRIPT, JobFormAutomation
+from test_browser_pool import FakeDriver, FakeElement
+
+
+def snapshot_field(tag='input', visible=True, readonly=False, disabled=False, **attributes):
+    field = {'element': FakeElement(), 'tag': tag, 'type': 'text' if tag == 'input' else None,
+             'name': None, 'id': None, 'placeholder': None, 'aria-label': None, 'data-field': None,
+             'label': '', 'visible': visible, 'readonly': readonly, 'disabled': disabled}
+    field.update({key.replace('_', '-') if key in ('aria_label', 'data_field') else key: value
+                  for key, value in attributes.items()})
+    return field
+
+
+class FormPageDriver(FakeDriver):
+    """A Greenhouse-like application page that counts WebDriver round trips"""
+
+    def __init__(self, fields):
+        super().__init__()
+        self.fields = fields
+        self.calls = {'snapshot': 0, 'scripts': 0, 'find_elements': 0}
+
+    def execute_script(self, script, *args):
+        if script == FIELD_SNAPSHOT_SCRIPT:
+            self.calls['snapshot'] += 1
+            return self.fields
+        self.calls['scripts'] += 1
+        return super().execute_script(script, *args)
+
+    def find_elements(self, by, value):
+        self.calls['find_elements'] += 1
+        return super().find_elements(by, value)
+
+
+def application_page():
+    return [
+        snapshot_field(type='hidden', name='authenticity_token', visible=False),
+        snapshot_field(id='first_name', name='job_application[first_name]'),
+        snapshot_field(id='last_name', name='job_application[last_name]'),
+        snapshot_field(id='email', name='job_application[email]', type='email'),
+        snapshot_field(id='phone', name='job_application[phone]', type='tel'),
+        snapshot_field(id='job_application_location', label='Location (City)'),
+        snapshot_field(name='job_application[answers][0][text_value]', label='LinkedIn Profile'),
+        snapshot_field('textarea', id='cover_letter_text', name='job_application[cover_letter_text]'),
+        snapshot_field('select', id='job_application_gender', name='job_application[gender]'),
+    ]
+
+
+def test_matching_follows_selector_precedence():
+    print("🧪 Testing snapshot matching...")
+
+    automation = JobFormAutomation()
+    hidden = snapshot_field(name='first_name', visible=False)
+    readonly = snapshot_field(name='firstname', readonly=True)
+    partial = snapshot_field(name='applicant_first_name')
+    exact = snapshot_field(name='first_name')
+    fields = [hidden, readonly, partial, exact]
+
+    # Exact name beats an earlier substring match; hidden and read-only fields are skipped
+    assert automation.find_form_field(['first_name', 'firstname'], fields) is exact['element']
+    assert automation.find_form_field(['first_name'], [hidden, readonly, partial]) is partial['element']
+
+    # Case-insensitive substring on placeholder, aria-label, then label text
+    fields = [snapshot_field(placeholder='Your E-mail'), snapshot_field(aria_label='Mobile phone')]
+    assert automation.find_form_field(['e-mail'], fields) is fields[0]['element']
+    assert automation.find_form_field(['phone'], fields) is fields[1]['element']
+    labelled = snapshot_field(id='q_123', label='Are you authorized to work in the US?')
+    assert automation.find_form_field(['authorized to work'], [labelled]) is labelled['element']
+
+    assert automation.find_form_field(['salary'], fields) is None
+    assert automation.find_form_field(['email'], [snapshot_field(name='email', disabled=True)]) is None
+
+
+def test_form_is_discovered_in_one_round_trip():
+    """Filling a whole form snapshots the page once instead of querying per selector"""
+    print("🧪 Testing single-pass discovery...")
+
+    driver = FormPageDriver(application_page())
+    automation = JobFormAutomation(keep_open=False)
+    automation.setup_driver = lambda: setattr(automation, 'driver', driver) or True
+    automation.wait = None
+    automation.wait_for_page = lambda: True
+
+    result = automation.automate_job_application(
+        'https://boards.greenhouse.io/acme/jobs/1',
+        {'name': 'Jane Doe', 'email': 'jane@example.com', 'phone': '555-0100'},
+        cover_letter='Dear hiring team'
+    )
+
+    print(f"   filled {result['filled_fields']} with {driver.calls}")
+    assert result['success']
+    for field in ('first_name', 'last_name', 'email', 'phone', 'cover_letter'):
+        assert field in result['filled_fields']
+    assert driver.calls['snapshot'] == 1 and driver.calls['find_elements'] == 0
+    assert result['total_visible_fields'] == 8
+    assert 'element' not in result['field_detection_debug'][0]  # results stay JSON-serialisable
+
+
+if __name__ == "__main__":
+    test_matching_follows_selector_precedence()
+    test_form_is_discovered_in_one_round_trip()
+    print("\n🎉 Form field discovery tests completed!")
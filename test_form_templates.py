@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Test script for per-board form templates
+The first application to a board discovers its form; later ones fill from the template
+"""
+
+import os
+import re
+import sys
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from form_automation import TEMPLATE_LOCATE_SCRIPT, JobFormAutomation
+from form_templates import FormTemplateCache, board_key, field_locator
+from test_form_field_discovery import FormPageDriver, application_page, snapshot_field
+
+RESUME = {'name': 'Jane Doe', 'email': 'jane@example.com', 'phone': '555-0100',
+          'linkedin': 'https://linkedin.com/in/janedoe'}
+LOCATOR = re.compile(r'^(\w+)\[(\w+)="(.*)"\]$')
+
+
+class TemplatePageDriver(FormPageDriver):
+    """Resolves template locators against the fake page like document.querySelector would"""
+
+    def __init__(self, fields):
+        super().__init__(fields)
+        self.calls['locate'] = 0
+
+    def execute_script(self, script, *args):
+        if script != TEMPLATE_LOCATE_SCRIPT:
+            return super().execute_script(script, *args)
+        self.calls['locate'] += 1
+        located = []
+        for locator in args[0]:
+            tag, attribute, value = LOCATOR.match(locator).groups()
+            value = value.replace('\\"', '"').replace('\\\\', '\\')
+            located.append(next((field for field in self.fields if field['tag'] == tag and field.get(attribute) == value), None))
+        return {'fields': located, 'visible_fields': sum(1 for field in self.fields if field['visible'])}
+
+
+def apply(templates, job_url, fields):
+    driver = TemplatePageDriver(fields)
+    automation = JobFormAutomation(keep_open=False, templates=templates)
+    automation.setup_driver = lambda: setattr(automation, 'driver', driver) or True
+    automation.wait_for_page = lambda: True
+    result = automation.automate_job_application(job_url, RESUME, cover_letter='Dear hiring team')
+    assert result['success']
+    return result, driver.calls
+
+
+def test_board_keys():
+    assert board_key('https://boards.greenhouse.io/acme/jobs/123') == 'greenhouse:acme'
+    assert board_key('https://job-boards.greenhouse.io/Acme/jobs/456?gh_src=x') == 'greenhouse:acme'
+    assert board_key('https://boards.greenhouse.io/embed/job_app?for=acme&token=789') == 'greenhouse:acme'
+    assert board_key('https://jobs.lever.co/initech/0f1e2d/apply') == 'lever:initech'
+    assert board_key('https://careers.example.com/jobs/1') is None
+
+    assert field_locator({'tag': 'input', 'id': 'email', 'name': 'job_application[email]'}) == 'input[id="email"]'
+    assert field_locator({'tag': 'textarea', 'id': None, 'name': 'say "hi"'}) == 'textarea[name="say \\"hi\\""]'
+    assert field_locator({'tag': 'input', 'id': '', 'name': None}) is None
+
+
+def test_repeat_applications_fill_from_template():
+    print("🧪 Testing form templates...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        templates = FormTemplateCache(os.path.join(tmp_dir, 'form_template_cache.db'))
+
+        # First application to the board discovers the form and learns it
+        learned, calls = apply(templates, 'https://boards.greenhouse.io/acme/jobs/1', application_page())
+        assert learned['form_template'] == 'learned' and calls['snapshot'] == 1
+
+        # Next application to the same board: one locate call, no discovery, same fields filled
+        used, calls = apply(templates, 'https://boards.greenhouse.io/acme/jobs/2', application_page())
+        print(f"   discovered: {learned['filled_fields']}")
+        print(f"   from template: {used['filled_fields']} with {calls}")
+        assert used['form_template'] == 'used'
+        assert calls['snapshot'] == 0 and calls['locate'] == 1
+        assert used['filled_fields'] == learned['filled_fields']
+        assert used['total_visible_fields'] == learned['total_visible_fields']
+
+        # A form that changed fails validation: discovery runs again and the template is relearned
+        changed_page = [field for field in application_page() if field['id'] != 'phone']
+        relearned, calls = apply(templates, 'https://boards.greenhouse.io/acme/jobs/3', changed_page)
+        assert relearned['form_template'] == 'learned' and calls['snapshot'] == 1
+        assert 'phone' not in relearned['filled_fields'] and templates.stats['invalidated'] == 1
+        used, calls = apply(templates, 'https://boards.greenhouse.io/acme/jobs/4', changed_page)
+        assert used['form_template'] == 'used' and calls['snapshot'] == 0
+
+        # Other boards and non-ATS sites always discover
+        other, calls = apply(templates, 'https://jobs.lever.co/initech/1', application_page())
+        assert other['form_template'] == 'learned'
+        direct, calls = apply(templates, 'https://careers.example.com/jobs/1', application_page())
+        assert direct['form_template'] is None and calls['snapshot'] == 1
+
+        print(f"   {templates.stats}")
+        templates.close()
+
+
+def test_posting_with_extra_field_relearns():
+    """A posting on the same board with a field the template hasn't seen is discovered, not skipped"""
+    print("🧪 Testing template validation against the page...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        templates = FormTemplateCache(os.path.join(tmp_dir, 'form_template_cache.db'))
+        learned, _ = apply(templates, 'https://boards.greenhouse.io/acme/jobs/1', application_page())
+        assert 'school' not in learned['filled_fields']
+
+        # Same board, but this posting also asks for a school
+        extra_page = application_page() + [snapshot_field(id='school', name='job_application[school]')]
+        extra, calls = apply(templates, 'https://boards.greenhouse.io/acme/jobs/2', extra_page)
+        print(f"   extra field: {extra['form_template']}, filled {extra['filled_fields']}")
+        assert extra['form_template'] == 'learned' and calls['snapshot'] == 1
+        assert 'school' in extra['filled_fields']
+        assert extra['total_visible_fields'] == learned['total_visible_fields'] + 1
+        assert templates.stats['invalidated'] == 1
+
+        # Postings of that shape now fill from the updated template
+        used, calls = apply(templates, 'https://boards.greenhouse.io/acme/jobs/3', extra_page)
+        assert used['form_template'] == 'used' and calls['snapshot'] == 0
+        assert used['filled_fields'] == extra['filled_fields']
+        templates.close()
+
+
+def test_same_index_different_question_relearns():
+    """Greenhouse numbers custom questions by index: another question in the same slot fails validation"""
+    print("🧪 Testing template fields against their labels...")
+
+    def posting(question):
+        page = [field for field in application_page() if field['label'] != 'LinkedIn Profile']
+        page.append(snapshot_field(id='job_application_answers_attributes_0_text_value',
+                                   name='job_application[answers][0][text_value]', label=question))
+        return page
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        templates = FormTemplateCache(os.path.join(tmp_dir, 'form_template_cache.db'))
+        learned, _ = apply(templates, 'https://boards.greenhouse.io/acme/jobs/1', posting('LinkedIn Profile'))
+        entry = templates.get('https://boards.greenhouse.io/acme/jobs/1')['fields']['linkedin']
+        assert entry['locator'] == 'input[id="job_application_answers_attributes_0_text_value"]'
+        assert entry['alias'] == 'linkedin' and entry['label'] == 'LinkedIn Profile'
+
+        # Same board, same number of fields, but question 0 asks something else
+        other, calls = apply(templates, 'https://boards.greenhouse.io/acme/jobs/2', posting('Why Acme?'))
+        print(f"   other question: {other['form_template']}, filled {other['filled_fields']}")
+        assert other['total_visible_fields'] == learned['total_visible_fields']
+        assert other['form_template'] == 'learned' and calls['snapshot'] == 1
+        assert 'linkedin' in learned['filled_fields'] and 'linkedin' not in other['filled_fields']
+        assert templates.stats['invalidated'] == 1
+        templates.close()
+
+
+def test_fields_without_locator_are_discovered():
+    """A field matched only by its label (no id or name) is looked up on the page each time"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        templates = FormTemplateCache(os.path.join(tmp_dir, 'form_template_cache.db'))
+        page = [field for field in application_page() if field['label'] != 'LinkedIn Profile']
+        page.append(snapshot_field(label='LinkedIn Profile URL'))
+
+        learned, _ = apply(templates, 'https://jobs.lever.co/initech/1', page)
+        assert learned['form_template'] == 'learned' and 'linkedin' in learned['filled_fields']
+        assert 'linkedin' not in templates.get('https://jobs.lever.co/initech/1')['fields']
+
+        used, calls = apply(templates, 'https://jobs.lever.co/initech/2', page)
+        assert used['form_template'] == 'used' and calls['locate'] == 1 and calls['snapshot'] == 1
+        assert used['filled_fields'] == learned['filled_fields']
+        assert used['field_detection_debug']  # reported from the page, as in discovery
+        templates.close()
+
+
+if __name__ == "__main__":
+    test_board_keys()
+    test_repeat_applications_fill_from_template()
+    test_posting_with_extra_field_relearns()
+    test_same_index_different_question_relearns()
+    test_fields_without_locator_are_discovered()
+    print("\n🎉 Form template tests completed!")
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Test script for event-driven waits in form automation
+Pages, fields and the review hold are waited on as long as they take, not slept on
+"""
+
+import os
+import sys
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from application_system import JobApplicationSystem
+from browser_pool import BrowserPool
+from form_automation import JobFormAutomation, close_browser, held_sessions
+from job_store import JobStore
+from test_browser_pool import FakeDriver, FakeElement, PAGE_DELAY
+
+JOB_URL = 'https://boards.greenhouse.io/acme/jobs/1'
+RESUME = {'name': 'Jane Doe', 'email': 'jane@example.com'}
+
+
+def test_waits_for_the_form_not_a_fixed_delay():
+    """Navigation returns once the form renders instead of after a fixed 5s"""
+    print("🧪 Testing page waits...")
+
+    FakeDriver.form_delay = 0.3
+    automation = JobFormAutomation(keep_open=False, pool=BrowserPool(size=1, driver_factory=FakeDriver))
+    result = automation.automate_job_application(JOB_URL, RESUME, cover_letter='')
+
+    timings = result['timings']
+    print(f"   page ready in {timings['page_ready']:.2f}s, filled in {timings['fill']:.2f}s")
+    assert result['success']
+    assert 0.3 + PAGE_DELAY <= timings['page_ready'] < 1.5
+
+    # A page whose form never renders costs page_timeout, then automation carries on
+    FakeDriver.form_delay = 60
+    automation = JobFormAutomation(keep_open=False, page_timeout=0.3,
+                                   pool=BrowserPool(size=1, driver_factory=FakeDriver))
+    result = automation.automate_job_application(JOB_URL, RESUME, cover_letter='')
+    assert result['success'] and result['timings']['page_ready'] < 1.5
+    FakeDriver.form_delay = 0.0
+
+
+def test_fill_waits_until_field_is_interactable():
+    automation = JobFormAutomation(field_timeout=2)
+    automation.driver = FakeDriver()
+
+    element = FakeElement(enabled_at=time.monotonic() + 0.2)
+    start_time = time.perf_counter()
+    assert automation.fill_text_field(element, 'Jane')
+    elapsed = time.perf_counter() - start_time
+    assert element.value == 'Jane' and 0.2 <= elapsed < 1.0
+
+    # A ready field is filled straight away
+    element = FakeElement()
+    start_time = time.perf_counter()
+    assert automation.fill_textarea_field(element, 'Dear hiring team')
+    assert time.perf_counter() - start_time < 0.1
+
+
+def test_review_hold_does_not_block():
+    """A browser kept open for review is handed off; the caller moves on to the next job"""
+    print("🧪 Testing background review hold...")
+
+    pool = BrowserPool(size=1, headless=False, driver_factory=FakeDriver)
+    automation = JobFormAutomation(keep_open=True, delay_after_fill=0.5, pool=pool)
+
+    start_time = time.perf_counter()
+    result = automation.automate_job_application(JOB_URL, RESUME, cover_letter='')
+    elapsed = time.perf_counter() - start_time
+    print(f"   returned in {elapsed:.2f}s with the browser held open")
+    assert result['success'] and result['browser_kept_open']
+    assert elapsed < 0.5 and automation.driver is None
+    assert pool.status()['in_use'] == 1 and len(held_sessions) == 1
+
+    time.sleep(0.7)
+    assert pool.status()['idle'] == 1 and not held_sessions
+
+    # close_browser() ends a hold early
+    automation = JobFormAutomation(keep_open=True, delay_after_fill=60, pool=pool)
+    automation.automate_job_application(JOB_URL, RESUME, cover_letter='')
+    assert pool.status()['in_use'] == 1
+    assert close_browser()
+    assert pool.status()['idle'] == 1 and not held_sessions
+    pool.close()
+
+
+def test_app_keeps_filled_forms_open_for_review():
+    """By default the app fills forms in visible pooled browsers and holds them for review"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        system = JobApplicationSystem(
+            os.path.join(tmp_dir, 'job_analysis_cache.db'),
+            job_store=JobStore(os.path.join(tmp_dir, 'scraped_data.json')),
+            form_template_file=os.path.join(tmp_dir, 'form_template_cache.db')
+        )
+        assert not system.browser_headless
+        system.browser_pool = BrowserPool(size=1, headless=system.browser_headless, driver_factory=FakeDriver)
+        system.runs.select([{'id': '1', 'opening_title': 'Engineer', 'company_name': 'Acme', 'opening_link': JOB_URL}])
+
+        result = system.automate_form_filling('1', {'cover_letter': '', 'tailored_resume': RESUME}, delay_seconds=0.3)
+        assert result['success'] and result['browser_kept_open']
+        assert system.browser_pool.status()['in_use'] == 1
+
+        time.sleep(0.5)
+        assert system.browser_pool.status()['idle'] == 1
+        system.browser_pool.close()
+        system.form_templates.close()
+        system.analysis_cache.store.close()
+
+
+if __name__ == "__main__":
+    test_waits_for_the_form_not_a_fixed_delay()
+    test_fill_waits_until_field_is_interactable()
+    test_review_hold_does_not_block()
+    test_app_keeps_filled_forms_open_for_review()
+    print("\n🎉 Form wait tests completed!")
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared job analysis cache used by prepare_application
+Serves the job posting from a local HTTP stub and counts LLM calls
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from application_system import JobApplicationSystem
+from job_description_analyzer import JobDescriptionAnalyzer
+from scrapers.utils.job_descriptions import compress_description
+from scrapers.utils.page_fetcher import PageFetcher
+
+POSTING_HTML = '<html><body><h1>Backend Engineer</h1><p>We use Python, Docker and AWS.</p></body></html>'
+
+
+class PostingHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.fetches += 1
+        time.sleep(self.server.delay)
+        body = self.server.page.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class CountingGroqClient:
+    """Answers the job analysis prompt and counts calls"""
+
+    def __init__(self):
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, **kwargs):
+        self.calls += 1
+        content = json.dumps({
+            'technologies': ['python', 'docker', 'aws'], 'required_skills': ['python'],
+            'experience_level': 'mid', 'responsibilities': [], 'requirements': [],
+            'matching_skills': ['python', 'docker'], 'missing_skills': ['aws'], 'job_category': 'engineering'
+        })
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def start_posting_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), PostingHandler)
+    server.fetches = 0
+    server.delay = 0.0
+    server.page = POSTING_HTML
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def create_system(cache_file, client, skills):
+    system = JobApplicationSystem(analysis_cache_file=cache_file)
+    system.description_analyzer = JobDescriptionAnalyzer(groq_client=client, fetcher=PageFetcher(cache_file=None))
+    system.resume_data = {'name': 'Test', 'skills': skills}
+    return system
+
+
+def test_prepare_application_analyzes_once():
+    """All stages share one analysis, and re-preparing costs nothing"""
+    print("🧪 Testing shared job analysis cache...")
+
+    server = start_posting_server()
+    job = {
+        'id': '1', 'opening_title': 'Backend Engineer', 'company_name': 'Acme',
+        'opening_link': f"http://127.0.0.1:{server.server_address[1]}/jobs/1"
+    }
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_file = os.path.join(tmp_dir, 'job_analysis_cache.db')
+        client = CountingGroqClient()
+        system = create_system(cache_file, client, ['python', 'docker', 'react'])
+
+        application = system.prepare_application(job)
+        assert server.fetches == 1 and client.calls == 1
+        assert application['tailored_resume']['skills'][:2] == ['python', 'docker']
+        assert application['job_analysis']['missing_skills'] == ['aws']
+
+        system.prepare_application(job)
+        assert server.fetches == 1 and client.calls == 1
+
+        # A new run reads the persisted analysis
+        restarted_client = CountingGroqClient()
+        restarted = create_system(cache_file, restarted_client, ['python', 'docker', 'react'])
+        restarted.prepare_application(job)
+        assert server.fetches == 1 and restarted_client.calls == 0
+        print(f"   {server.fetches} fetch, {client.calls} LLM call for 3 preparations")
+
+        # Different resume skills need a new analysis, but not a new fetch
+        other_skills = create_system(cache_file, restarted_client, ['go'])
+        other_skills.prepare_application(job)
+        assert server.fetches == 1 and restarted_client.calls == 1
+
+        for cache_owner in (system, restarted, other_skills):
+            cache_owner.analysis_cache.store.close()
+    server.shutdown()
+
+
+def test_changed_posting_is_reanalyzed():
+    """Once the remembered description expires, a changed page gets a new analysis"""
+    server = start_posting_server()
+    job = {'id': '2', 'opening_title': 'Engineer', 'opening_link': f"http://127.0.0.1:{server.server_address[1]}/jobs/2"}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        client = CountingGroqClient()
+        system = create_system(os.path.join(tmp_dir, 'job_analysis_cache.db'), client, ['python'])
+        system.analysis_cache.description_ttl = 0.01  # trust a fetched page only briefly
+
+        system.analyze_job_description(job)
+        time.sleep(0.05)
+
+        # Page unchanged: fetched again, but the LLM analysis is reused
+        system.analyze_job_description(job)
+        assert server.fetches == 2 and client.calls == 1
+
+        time.sleep(0.05)
+        server.page = POSTING_HTML.replace('AWS', 'GCP')
+        system.analyze_job_description(job)
+        assert server.fetches == 3 and client.calls == 2
+        system.analysis_cache.store.close()
+    server.shutdown()
+
+
+def test_inline_description_skips_fetch():
+    """A job that already carries its description is never fetched"""
+    server = start_posting_server()
+    job = {
+        'id': '3', 'opening_title': 'Engineer', 'description': 'Python and Docker.',
+        'opening_link': f"http://127.0.0.1:{server.server_address[1]}/jobs/3"
+    }
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        client = CountingGroqClient()
+        system = create_system(os.path.join(tmp_dir, 'job_analysis_cache.db'), client, ['python'])
+        system.analyze_job_description(job)
+        system.analyze_job_description(job)
+        assert server.fetches == 0 and client.calls == 1
+
+        # The same text stored compressed by the spiders' description stage
+        scraped_job = dict(job)
+        scraped_job['description_compressed'] = compress_description(scraped_job.pop('description'))
+        system.analyze_job_description(scraped_job)
+        assert server.fetches == 0 and client.calls == 1
+        system.analysis_cache.store.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    test_prepare_application_analyzes_once()
+    test_changed_posting_is_reanalyzed()
+    test_inline_description_skips_fetch()
+    print("\n🎉 Job analysis cache tests completed!")
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Test script for job title classification (experience level / role category)
+Run directly to also benchmark classification over 100k titles
+"""
+
+import random
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from scrapers.utils.job_analyzer import (
+    EXPERIENCE_PATTERNS,
+    ROLE_CATEGORIES,
+    analyze_job_title,
+    analyze_job_titles,
+    classification_cache_info,
+    classify_title_columns,
+    extract_experience_level,
+    extract_role_category,
+    get_experience_level_color,
+    get_experience_level_display,
+    get_role_category_color,
+    get_role_category_display,
+    get_tailoring_experience_level,
+    normalize_job_title,
+)
+
+SAMPLE_TITLES = [
+    'Senior Software Engineer, Backend', 'Software Engineer Intern', 'Staff Site Reliability Engineer',
+    'Junior Developer', 'Data Scientist', 'Senior Machine Learning Engineer', 'Product Manager, Growth',
+    'Senior Product Designer', 'Account Executive, Enterprise', 'Customer Success Manager',
+    'Maintenance Technician', 'PR & Communications Lead', 'Financial Analyst', 'Recruiter',
+    'Legal Counsel', 'Director of Engineering', 'VP, Sales', 'Research Scientist, NLP',
+    'Business Operations Associate', 'Head of People', 'Mid-Level Frontend Developer',
+]
+
+
+def test_word_boundaries():
+    """Short patterns only match whole words"""
+    print("🧪 Testing word-boundary matching...")
+
+    # 'ai' used to match "maintenance", 'pr' matched "product"
+    assert extract_role_category('Maintenance Technician') == 'other'
+    assert extract_role_category('AI Researcher') == 'data_science'
+    assert extract_role_category('PR Manager') == 'marketing'
+    assert extract_role_category('Product Manager') == 'product'
+
+    # 'sr' and 'intern' shouldn't fire inside other words
+    assert extract_experience_level('Sr. Software Engineer') == 'senior'
+    assert extract_experience_level('Internal Auditor') == 'unknown'
+    assert extract_experience_level('Summer Interns') == 'intern'
+
+
+def test_priority_order():
+    """Dictionary order decides between categories, regardless of position in the title"""
+    print("🧪 Testing priority ordering...")
+
+    assert extract_experience_level('Senior Intern') == 'intern'
+    assert extract_experience_level('Engineering Lead') == 'senior'
+    assert extract_role_category('Support Engineer') == 'engineering'
+    assert extract_role_category('Director of Sales') == 'sales'
+    assert extract_role_category('Engineering Manager') == 'engineering'
+
+
+def test_empty_titles():
+    assert analyze_job_title('') == {'experience_level': 'unknown', 'role_category': 'other'}
+    assert analyze_job_title(None) == {'experience_level': 'unknown', 'role_category': 'other'}
+
+
+def test_batch_matches_single():
+    """analyze_job_titles gives the same answers as one call per title"""
+    print("🧪 Testing batch classification...")
+
+    titles = SAMPLE_TITLES * 3
+    batch = analyze_job_titles(titles)
+
+    assert len(batch) == len(titles)
+    for title, analysis in zip(titles, batch):
+        assert analysis == analyze_job_title(title)
+
+
+def test_memo_shares_normalized_titles():
+    """Titles that only differ in case/whitespace hit the same memo entry"""
+    print("🧪 Testing classification memo...")
+
+    assert normalize_job_title('  Senior   Software ENGINEER ') == 'senior software engineer'
+
+    analyze_job_title('Senior Backend Engineer, Payments')
+    before = classification_cache_info()
+    analysis = analyze_job_title('senior  backend engineer,  PAYMENTS')
+    after = classification_cache_info()
+
+    assert analysis == {'experience_level': 'senior', 'role_category': 'engineering'}
+    assert after['hits'] == before['hits'] + 1
+    assert after['misses'] == before['misses']
+
+
+def test_tailoring_experience_levels():
+    """The coarse scale used by resume tailoring comes from the same engine"""
+    assert get_tailoring_experience_level('Software Engineer Intern') == 'entry'
+    assert get_tailoring_experience_level('Junior Developer') == 'entry'
+    assert get_tailoring_experience_level('Staff Engineer') == 'senior'
+    assert get_tailoring_experience_level('Director of Engineering') == 'senior'
+    assert get_tailoring_experience_level('Data Scientist') == 'mid'
+    assert get_tailoring_experience_level('') == 'mid'
+
+
+def make_snapshot_titles(count, seed=42):
+    """Random titles with the heavy repetition of a real snapshot"""
+    rng = random.Random(seed)
+    # Add a suffix to some to keep a share of distinct titles
+    return [
+        rng.choice(SAMPLE_TITLES) + (f' ({rng.randint(1, 500)})' if rng.random() < 0.2 else '')
+        for _ in range(count)
+    ]
+
+
+def test_columns_match_single():
+    """Columnar batch output lines up with the per-title helpers"""
+    print("🧪 Testing columnar batch classification...")
+
+    titles = SAMPLE_TITLES + ['', None] + SAMPLE_TITLES
+    columns = classify_title_columns(titles)
+
+    assert all(len(column) == len(titles) for column in columns.values())
+    for row, title in enumerate(titles):
+        analysis = analyze_job_title(title)
+        assert columns['experience_level'][row] == analysis['experience_level']
+        assert columns['role_category'][row] == analysis['role_category']
+        assert columns['experience_display'][row] == get_experience_level_display(analysis['experience_level'])
+        assert columns['role_display'][row] == get_role_category_display(analysis['role_category'])
+        assert columns['experience_color'][row] == get_experience_level_color(analysis['experience_level'])
+        assert columns['role_color'][row] == get_role_category_color(analysis['role_category'])
+
+
+def test_snapshot_prepares_quickly():
+    """A 100k-title snapshot should be classified in well under a second"""
+    titles = make_snapshot_titles(100_000)
+
+    start_time = time.perf_counter()
+    columns = classify_title_columns(titles)
+    elapsed = time.perf_counter() - start_time
+
+    print(f"   100,000 titles -> columns in {elapsed:.3f}s")
+    assert len(columns['role_color']) == len(titles)
+    assert elapsed < 1.0
+
+
+def substring_classify(job_title):
+    """The previous per-pattern substring scan, used as the benchmark baseline"""
+    title_lower = job_title.lower()
+    experience_level = 'unknown'
+    for level, patterns in EXPERIENCE_PATTERNS.items():
+        if any(pattern in title_lower for pattern in patterns):
+            experience_level = level
+            break
+    role_category = 'other'
+    for category, patterns in ROLE_CATEGORIES.items():
+        if any(pattern in title_lower for pattern in patterns):
+            role_category = category
+            break
+    return {'experience_level': experience_level, 'role_category': role_category}
+
+
+def benchmark_classification(count=100_000):
+    """Classify `count` titles with the substring scan, the compiled matcher and the batch call"""
+    print(f"\n🚀 Classification Benchmark: {count:,} titles")
+    print("=" * 60)
+
+    titles = make_snapshot_titles(count)
+
+    start_time = time.perf_counter()
+    for title in titles:
+        substring_classify(title)
+    substring_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    for title in titles:
+        analyze_job_title(title)
+    compiled_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    analyze_job_titles(titles)
+    batch_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    classify_title_columns(titles)
+    columns_time = time.perf_counter() - start_time
+
+    print(f"  Substring scan:    {substring_time:.3f}s ({count / substring_time:,.0f} titles/sec)")
+    print(f"  Compiled matcher:  {compiled_time:.3f}s ({count / compiled_time:,.0f} titles/sec)")
+    print(f"  Batch call:        {batch_time:.3f}s ({count / batch_time:,.0f} titles/sec)")
+    print(f"  Columnar + lookups: {columns_time:.3f}s ({count / columns_time:,.0f} titles/sec)")
+
+
+if __name__ == "__main__":
+    test_word_boundaries()
+    test_priority_order()
+    test_empty_titles()
+    test_batch_matches_single()
+    test_memo_shares_normalized_titles()
+    test_tailoring_experience_levels()
+    test_columns_match_single()
+    test_snapshot_prepares_quickly()
+    benchmark_classification()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared, indexed job store
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from application_system import JobApplicationSystem
+from job_store import JobStore, unique_job_id
+
+
+def write_jobs(path, jobs):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(jobs, f)
+    # Make sure the change is visible even on coarse mtime filesystems
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def create_jobs(count, companies=('acme', 'globex')):
+    jobs = [{'department_id': 'acme_Engineering'}]  # non-job rows are skipped
+    for i in range(count):
+        for company in companies:
+            jobs.append({'id': f'job{i}', 'company_name': company, 'opening_title': f'Engineer {i} at {company}'})
+    return jobs
+
+
+def test_lookups_and_reload():
+    """Indexes answer by id and id + company, and follow the file when it changes"""
+    print("🧪 Testing job store...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'scraped_data.json')
+        store = JobStore(path)
+        assert store.jobs() == [] and store.get('job1') is None
+
+        write_jobs(path, create_jobs(3))
+        assert len(store.jobs()) == 6 and len(store.all_records()) == 7
+        assert store.get('job1_globex')['company_name'] == 'globex'
+        assert store.get('job1')['company_name'] == 'acme'  # first row for a plain id
+        assert [job['opening_title'] for job in store.find(['job2_globex', 'missing', 'job0'])] == [
+            'Engineer 2 at globex', 'Engineer 0 at acme'
+        ]
+
+        # Reads don't touch the file until it changes
+        for _ in range(100):
+            store.find(['job0_acme'])
+        assert store.stats['loads'] == 1
+
+        jobs = create_jobs(5)
+        jobs[1]['posted_date'] = '2026-10-01T00:00:00+00:00'
+        write_jobs(path, jobs)
+        assert store.get('job4_acme') is not None and store.version == 2
+        # Scraped dates are parsed once, when the file is loaded
+        assert store.get('job0_acme')['posted_date_epoch'] == 1790812800
+        assert 'posted_date_epoch' not in store.get('job0_globex')
+
+        # A half-written file keeps the last good copy
+        with open(path, 'w') as f:
+            f.write('[{"id": "job9", "opening_')
+        assert len(store.jobs()) == 10 and store.stats['load_errors'] == 1
+        store.jobs()
+        assert store.stats['load_errors'] == 1  # not re-parsed until it changes again
+
+        os.remove(path)
+        assert store.jobs() == []
+
+
+def test_select_jobs_uses_store():
+    """select_jobs and the per-job lookups go through the indexes"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'scraped_data.json')
+        write_jobs(path, create_jobs(20))
+        system = JobApplicationSystem(os.path.join(tmp_dir, 'job_analysis_cache.db'), job_store=JobStore(path))
+
+        assert system.select_jobs(['job3_globex', 'job7'])
+        assert [unique_job_id(job) for job in system.selected_jobs] == ['job3_globex', 'job7_acme']
+        assert system.runs.selected_job('job7')['company_name'] == 'acme'
+        assert system.runs.selected_job('job8') is None
+        assert not system.select_jobs(['nope'])
+        system.analysis_cache.store.close()
+
+
+def benchmark_selection(job_count=20000, rounds=50):
+    """Selecting 10 jobs: old per-request parse + mapping vs the shared store"""
+    print("\n🚀 Selection benchmark")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'scraped_data.json')
+        write_jobs(path, create_jobs(job_count // 2))
+        job_ids = [f'job{i * 97}_globex' for i in range(10)]
+
+        start_time = time.perf_counter()
+        for _ in range(rounds):
+            with open(path) as f:
+                jobs = [job for job in json.load(f) if 'opening_title' in job]
+            mapping = {unique_job_id(job): job for job in jobs}
+            before = [mapping[job_id] for job_id in job_ids]
+        before_time = (time.perf_counter() - start_time) / rounds
+
+        store = JobStore(path)
+        store.jobs()
+        start_time = time.perf_counter()
+        for _ in range(rounds):
+            after = store.find(job_ids)
+        after_time = (time.perf_counter() - start_time) / rounds
+
+        assert after == before
+        print(f"   before: {before_time * 1000:.1f}ms per selection")
+        print(f"   after:  {after_time * 1000:.3f}ms per selection ({before_time / after_time:.0f}x)")
+
+
+if __name__ == "__main__":
+    test_lookups_and_reload()
+    test_select_jobs_uses_store()
+    benchmark_selection()
+    print("\n🎉 Job store tests completed!")
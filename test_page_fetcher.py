@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Test script for the pooled, cached job page fetcher
+Runs against a local HTTP/1.1 server that honors ETag and Last-Modified
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from bs4 import BeautifulSoup
+from scrapers.utils.page_fetcher import PageFetcher, clean_page_text, extract_page_text
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'boards')
+
+PAGE = (
+    '<html><head><style>body { color: red; }</style><script>var tracking = 1;</script></head>'
+    '<body><h1>Backend Engineer</h1>\n<p>Python,  Docker</p><!-- hidden --></body></html>'
+)
+LAST_MODIFIED = 'Wed, 01 Jan 2025 00:00:00 GMT'
+SLOW_DELAY = 0.2
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.connections.add(self.client_address)
+        path = self.path
+
+        if path.startswith('/slow'):
+            time.sleep(SLOW_DELAY)
+        if path == '/missing':
+            return self._respond(404, b'')
+        if path.startswith('/etag') and self.headers.get('If-None-Match') == server.etag:
+            return self._respond(304, b'')
+        if path.startswith('/modified') and self.headers.get('If-Modified-Since') == LAST_MODIFIED:
+            return self._respond(304, b'')
+
+        headers = {}
+        if path.startswith('/etag'):
+            headers['ETag'] = server.etag
+        if path.startswith('/modified'):
+            headers['Last-Modified'] = LAST_MODIFIED
+        self._respond(200, server.page.encode('utf-8'), headers)
+
+    def _respond(self, status, body, headers=None):
+        with self.server.lock:
+            self.server.statuses.append(status)
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_page_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), PageHandler)
+    server.lock = threading.Lock()
+    server.connections = set()
+    server.statuses = []
+    server.page = PAGE
+    server.etag = '"v1"'
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_conditional_get():
+    """Repeat fetches revalidate with ETag / Last-Modified and reuse the cached text"""
+    print("🧪 Testing conditional GET page cache...")
+
+    server = start_page_server()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_file = os.path.join(tmp_dir, 'page_cache.db')
+        fetcher = PageFetcher(cache_file=cache_file)
+
+        text = fetcher.fetch(base_url + '/etag')
+        assert text == 'Backend Engineer Python, Docker'
+        assert fetcher.fetch(base_url + '/etag') == text
+        assert fetcher.fetch(base_url + '/modified') == text
+        assert fetcher.fetch(base_url + '/modified') == text
+        assert server.statuses == [200, 304, 200, 304]
+
+        # A new page version is downloaded again
+        server.etag = '"v2"'
+        server.page = PAGE.replace('Docker', 'Kubernetes')
+        assert fetcher.fetch(base_url + '/etag').endswith('Kubernetes')
+
+        # The cache survives a restart
+        fetcher.cache.commit()
+        restarted = PageFetcher(cache_file=cache_file)
+        assert restarted.fetch(base_url + '/etag').endswith('Kubernetes')
+        assert server.statuses[-1] == 304
+        print(f"   {fetcher.cache_stats()}")
+
+        # Errors: "" without a cached copy, the cached copy otherwise
+        assert fetcher.fetch(base_url + '/missing') == ''
+        server.shutdown()
+        server.server_close()
+        assert fetcher.fetch(base_url + '/etag').endswith('Kubernetes')
+        fetcher.cache.close()
+        restarted.cache.close()
+
+
+def test_fetch_many_pooled_and_concurrent():
+    """fetch_many overlaps slow pages and reuses keep-alive connections"""
+    print("🧪 Testing fetch_many...")
+
+    server = start_page_server()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    fetcher = PageFetcher(cache_file=None, max_workers=8)
+
+    urls = [f'{base_url}/slow/{i}' for i in range(16)]
+    start_time = time.perf_counter()
+    texts = fetcher.fetch_many(urls + urls[:4])
+    elapsed = time.perf_counter() - start_time
+
+    print(f"   {len(texts)} pages in {elapsed:.2f}s over {len(server.connections)} connections")
+    assert list(texts) == urls
+    assert all(text == 'Backend Engineer Python, Docker' for text in texts.values())
+    assert elapsed < 16 * SLOW_DELAY / 3
+    assert len(server.connections) <= 8
+
+    # Sequential fetches share one connection
+    server.connections.clear()
+    for i in range(10):
+        fetcher.fetch(f'{base_url}/plain/{i}')
+    assert len(server.connections) == 1
+    server.shutdown()
+
+
+def test_lxml_text_matches_beautifulsoup():
+    """The lxml extraction gives the same text as the old html.parser path"""
+    for file_name in sorted(os.listdir(FIXTURES_DIR)):
+        if not file_name.endswith('.html'):
+            continue
+        with open(os.path.join(FIXTURES_DIR, file_name), 'rb') as f:
+            content = f.read()
+        soup = BeautifulSoup(content, 'html.parser')
+        for script in soup(["script", "style"]):
+            script.decompose()
+        assert extract_page_text(content) == clean_page_text(soup.get_text()), file_name
+
+    assert extract_page_text(b'') == ''
+
+
+if __name__ == "__main__":
+    test_conditional_get()
+    test_fetch_many_pooled_and_concurrent()
+    test_lxml_text_matches_beautifulsoup()
+    print("\n🎉 Page fetcher tests completed!")
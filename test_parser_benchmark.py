@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Test script for the offline parser benchmark harness
+"""
+
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark_parsers import run_benchmark, print_report, STAGES
+
+
+def test_benchmark_covers_corpus():
+    """Every spider/fixture pair in the manifest parses offline with the expected item count"""
+    print("🧪 Running parser benchmark over the fixture corpus...")
+
+    results = run_benchmark(rounds=1)
+    print_report(results)
+
+    spiders = {result['spider'] for result in results}
+    assert spiders == {'greenhouse_job_departments', 'greenhouse_jobs_outline', 'lever_jobs_outline'}
+
+    for result in results:
+        assert result['ok'], f"{result['spider']} / {result['fixture']}: {result['items']} items"
+        assert result['items_per_sec'] > 0
+        assert result['peak_memory_kb'] > 0
+        assert set(result['stage_ms']) == set(STAGES)
+
+
+def test_legacy_path_matches_item_counts():
+    """The ItemLoader path should still agree with the manifest"""
+    results = run_benchmark(rounds=1, use_item_loader=1)
+    assert all(result['ok'] for result in results)
+
+
+if __name__ == "__main__":
+    test_benchmark_covers_corpus()
+    test_legacy_path_matches_item_counts()
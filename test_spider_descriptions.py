@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Test script for the spiders' optional posting-page stage
+Board fixtures are parsed with fetch_descriptions on, and the posting
+requests are answered with canned pages instead of the network
+"""
+
+import os
+import sys
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from scrapy import Request
+from scrapy.http import HtmlResponse
+from twisted.python.failure import Failure
+from scrapers.spiders.greenhouse_jobs_outline_spider import GreenhouseJobsOutlineSpider
+from scrapers.spiders.lever_jobs_outline_spider import LeverJobsOutlineSpider
+from scrapers.utils.job_descriptions import (
+    compress_description, decompress_description, description_hash, job_description
+)
+from test_spider_parsing import FIXTURES_DIR, parse_fixture
+
+POSTING_PAGE = """<html><head><meta name="csrf-token" content="{nonce}"><script>var x = 1;</script></head><body>
+<h1>{title}</h1>
+<div class="content"><p>We use Python and PostgreSQL.</p></div>
+</body></html>"""
+
+
+def crawl_board(spider_class, careers_page_url, file_name, store_file, use_item_loader=0, page=POSTING_PAGE, etag=None):
+    """
+    Parse a board with fetch_descriptions on and answer every posting request.
+    Each response carries a fresh token; with an etag, the postings are served
+    with it and a matching If-None-Match is answered with a 304.
+    """
+    spider = spider_class(
+        careers_page_url=careers_page_url,
+        run_hash='test_run',
+        use_existing_html=0,
+        use_item_loader=use_item_loader,
+        fetch_descriptions=1,
+        description_store_file=store_file,
+    )
+    spider.created_at = spider.updated_at = 1700000000
+    with open(os.path.join(FIXTURES_DIR, file_name), 'rb') as f:
+        body = f.read()
+    response = HtmlResponse(url=careers_page_url, body=body, encoding='utf-8', request=Request(careers_page_url))
+
+    items = []
+    for request in spider.parse(response):
+        if request.callback != spider.parse_description:
+            continue  # next board page
+        assert request.priority < 0 and request.dont_filter
+        assert 304 in request.meta['handle_httpstatus_list']
+        item = request.cb_kwargs['item']
+        if etag and request.headers.get('If-None-Match') == etag.encode():
+            posting_response = HtmlResponse(url=request.url, status=304, body=b'', request=request)
+        else:
+            posting = page.format(title=item['opening_title'], nonce=os.urandom(8).hex()).encode('utf-8')
+            headers = {'ETag': etag} if etag else {}
+            posting_response = HtmlResponse(url=request.url, body=posting, headers=headers, encoding='utf-8', request=request)
+        items.extend(dict(result) for result in request.callback(posting_response, **request.cb_kwargs))
+    return spider, items
+
+
+def test_compression_round_trip():
+    text = 'Senior Engineer ' * 200
+    compressed = compress_description(text)
+    assert len(compressed) < len(text) / 5
+    assert decompress_description(compressed) == text
+    assert decompress_description(None) == ''
+    assert decompress_description('not base64!') == ''
+    assert job_description({'description_compressed': compressed}) == text
+    assert job_description({'description': 'plain', 'description_compressed': compressed}) == 'plain'
+
+
+def test_descriptions_stored_with_items():
+    """Every item carries its posting's description, compressed, plus its hash"""
+    print("🧪 Testing posting-page stage...")
+
+    cases = [
+        (GreenhouseJobsOutlineSpider, 'https://boards.greenhouse.io/embed/job_board?for=acme', 'greenhouse_embed_acme.html'),
+        (GreenhouseJobsOutlineSpider, 'https://job-boards.greenhouse.io/globex', 'greenhouse_job_boards_globex.html'),
+        (LeverJobsOutlineSpider, 'https://jobs.lever.co/initech', 'lever_initech.html'),
+    ]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for spider_class, url, file_name in cases:
+            store_file = os.path.join(tmp_dir, spider_class.name + '.db')
+            spider, items = crawl_board(spider_class, url, file_name, store_file)
+            outline_items = parse_fixture(spider_class, url, file_name)
+
+            print(f"   {spider_class.name} / {file_name}: {len(items)} items with descriptions")
+            assert len(items) == len(outline_items)
+            for item, outline_item in zip(items, outline_items):
+                description = decompress_description(item.pop('description_compressed'))
+                assert description == f"{outline_item['opening_title']} We use Python and PostgreSQL."
+                assert item.pop('description_hash') == description_hash(description)
+                assert item == outline_item
+            spider.closed('finished')
+
+            # The ItemLoader path follows the same postings
+            spider, legacy_items = crawl_board(spider_class, url, file_name, store_file, use_item_loader=1)
+            assert [item['description_hash'] for item in legacy_items] == [
+                description_hash(f"{item['opening_title']} We use Python and PostgreSQL.") for item in outline_items
+            ]
+            spider.closed('finished')
+
+
+def test_unchanged_postings_are_not_reextracted():
+    """A second crawl reuses stored descriptions whose text hashes the same, despite per-request tokens"""
+    print("🧪 Testing unchanged posting skip...")
+
+    url, file_name = 'https://jobs.lever.co/initech', 'lever_initech.html'
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store_file = os.path.join(tmp_dir, 'descriptions.db')
+        spider, first_items = crawl_board(LeverJobsOutlineSpider, url, file_name, store_file)
+        assert spider.description_store.stats == {'extracted': len(first_items), 'unchanged': 0, 'not_modified': 0}
+        spider.closed('finished')
+
+        spider, second_items = crawl_board(LeverJobsOutlineSpider, url, file_name, store_file)
+        print(f"   second crawl: {spider.description_store.stats}")
+        assert spider.description_store.stats == {'extracted': 0, 'unchanged': len(first_items), 'not_modified': 0}
+        assert second_items == first_items
+        spider.closed('finished')
+
+        changed_page = POSTING_PAGE.replace('PostgreSQL', 'Kafka')
+        spider, changed_items = crawl_board(LeverJobsOutlineSpider, url, file_name, store_file, page=changed_page)
+        assert spider.description_store.stats['extracted'] == len(first_items)
+        assert decompress_description(changed_items[0]['description_compressed']).endswith('Kafka.')
+        spider.closed('finished')
+
+
+def test_postings_are_revalidated_with_etag():
+    """Postings served with an ETag are requested conditionally; a 304 reuses the stored description"""
+    print("🧪 Testing conditional posting requests...")
+
+    url, file_name = 'https://jobs.lever.co/initech', 'lever_initech.html'
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store_file = os.path.join(tmp_dir, 'descriptions.db')
+        spider, first_items = crawl_board(LeverJobsOutlineSpider, url, file_name, store_file, etag='"v1"')
+        assert spider.description_store.stats['extracted'] == len(first_items)
+        spider.closed('finished')
+
+        spider, second_items = crawl_board(LeverJobsOutlineSpider, url, file_name, store_file, etag='"v1"')
+        print(f"   revalidated crawl: {spider.description_store.stats}")
+        assert spider.description_store.stats == {'extracted': 0, 'unchanged': 0, 'not_modified': len(first_items)}
+        assert second_items == first_items
+        spider.closed('finished')
+
+        # A new ETag means a full response again
+        spider, _ = crawl_board(LeverJobsOutlineSpider, url, file_name, store_file, etag='"v2"')
+        assert spider.description_store.stats == {'extracted': 0, 'unchanged': len(first_items), 'not_modified': 0}
+        spider.closed('finished')
+
+
+def test_failed_posting_keeps_item():
+    """A posting page that can't be fetched still yields the outline item"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        spider = LeverJobsOutlineSpider(
+            careers_page_url='https://jobs.lever.co/initech', run_hash='test_run', use_existing_html=0,
+            fetch_descriptions=1, description_store_file=os.path.join(tmp_dir, 'descriptions.db')
+        )
+        item = {'opening_link': 'https://jobs.lever.co/initech/1', 'opening_title': 'Engineer'}
+        request = spider.follow_description(HtmlResponse(url='https://jobs.lever.co/initech', body=b''), item)
+        assert request.errback == spider.description_failed
+
+        failure = Failure(ConnectionError('refused'))
+        failure.request = request
+        assert list(spider.description_failed(failure)) == [item]
+        assert spider.description_store.stats == {'extracted': 0, 'unchanged': 0, 'not_modified': 0}
+        spider.closed('finished')
+
+    # Without the option the item is yielded as before
+    spider.fetch_descriptions = 0
+    assert spider.follow_description(None, item) is item
+
+
+if __name__ == "__main__":
+    test_compression_round_trip()
+    test_descriptions_stored_with_items()
+    test_unchanged_postings_are_not_reextracted()
+    test_postings_are_revalidated_with_etag()
+    test_failed_posting_keeps_item()
+    print("\n🎉 Spider description tests completed!")
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Test script for the SQLite-backed cache and the date estimator's use of it
+"""
+
+import os
+import pickle
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from scrapers.utils.sqlite_cache import SQLiteCache
+from scrapers.utils.job_date_estimator import JobDateEstimator
+
+
+def test_get_set_and_ttl():
+    """Values round-trip as JSON and expire after their TTL"""
+    print("🧪 Testing SQLite cache get/set/TTL...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = SQLiteCache(os.path.join(tmp_dir, 'cache.db'))
+        cache.set('a', {'confidence': 'low', 'days': 3})
+        cache.set('short', 'gone soon', ttl=0.05)
+
+        assert cache.get('a') == {'confidence': 'low', 'days': 3}
+        assert 'short' in cache
+        time.sleep(0.1)
+        assert cache.get('short') is None
+        assert 'short' not in cache
+        assert cache.purge_expired() == 1
+
+        assert cache.get_many(['a', 'missing']) == {'a': {'confidence': 'low', 'days': 3}}
+        cache.close()
+
+
+def test_batched_commits_visible_to_other_connections():
+    """Writes are committed in batches and then visible to a second connection (another process)"""
+    print("🧪 Testing batched commits...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, 'cache.db')
+        writer = SQLiteCache(db_path, commit_every=10, commit_interval=60)
+        reader = SQLiteCache(db_path)
+
+        for i in range(9):
+            writer.set(f'key{i}', i)
+        assert reader.get('key0') is None  # still pending
+
+        writer.set('key9', 9)  # 10th write triggers the commit
+        assert reader.get_many([f'key{i}' for i in range(10)]) == {f'key{i}': i for i in range(10)}
+
+        writer.close()
+        reader.close()
+
+
+def test_concurrent_writers():
+    """Several threads writing at once leave every key readable"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = SQLiteCache(os.path.join(tmp_dir, 'cache.db'))
+
+        def write_range(offset):
+            for i in range(200):
+                cache.set(f'{offset}:{i}', i)
+
+        threads = [threading.Thread(target=write_range, args=(offset,)) for offset in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(cache) == 800
+        cache.close()
+
+
+def test_estimator_persists_between_instances():
+    """A warm start reads the earlier estimate back, datetime included"""
+    print("🧪 Testing date estimator warm start...")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, 'date_cache.db')
+        first = JobDateEstimator(cache_file=db_path, legacy_cache_file=None)
+        result = first.estimate_job_date('Data Scientist', 'Meta', 'San Francisco, CA')
+        first.flush_cache()
+
+        second = JobDateEstimator(cache_file=db_path, legacy_cache_file=None)
+        cached = second.estimate_job_date('Data Scientist', 'Meta', 'San Francisco, CA')
+
+        assert isinstance(cached['estimated_date'], datetime)
+        assert cached['estimated_date'] == result['estimated_date']
+        assert cached['posted_date_display'] == result['posted_date_display']
+
+        second.clear_cache()
+        assert len(second.store) == 0
+        first.store.close()
+        second.store.close()
+
+
+def test_legacy_pickle_import():
+    """An existing date_cache.pkl is imported once and then moved aside"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        legacy_path = os.path.join(tmp_dir, 'date_cache.pkl')
+        estimated_date = datetime.now() - timedelta(days=5)
+        with open(legacy_path, 'wb') as f:
+            pickle.dump({'recruiter|acme': {
+                'estimated_date': estimated_date, 'confidence': 'low', 'source': 'pattern_analysis'
+            }}, f)
+
+        estimator = JobDateEstimator(cache_file=os.path.join(tmp_dir, 'date_cache.db'), legacy_cache_file=legacy_path)
+        result = estimator.estimate_job_date('Recruiter', 'Acme')
+
+        assert result['estimated_date'] == estimated_date
+        assert not os.path.exists(legacy_path)
+        assert os.path.exists(legacy_path + '.imported')
+        estimator.store.close()
+
+
+if __name__ == "__main__":
+    test_get_set_and_ttl()
+    test_batched_commits_visible_to_other_connections()
+    test_concurrent_writers()
+    test_estimator_persists_between_instances()
+    test_legacy_pickle_import()
+    print("\n🎉 SQLite cache tests completed!")